@@ -0,0 +1,65 @@
+"""
+Component construction microbenchmark.
+
+Compares building many small components with the current ``__slots__``
+model and counter ids against the previous model (per-instance ``__dict__``
+and a ``uuid4()`` per id), reproduced below.
+
+Run:
+    python benchmarks/bench_construct.py [count]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from taupy.widgets.elements import Text_  # noqa: E402
+
+
+class _DictComponent:
+    _id_counter = 0
+
+    def __init__(self, **kwargs):
+        self.props = kwargs
+        self.children = self.props.pop("children", []) or []
+        self.app = None
+
+        provided_id = self.props.pop("id", None)
+        if provided_id is not None:
+            self.id = provided_id
+        else:
+            _DictComponent._id_counter += 1
+            self.id = f"tau_{_DictComponent._id_counter}_{uuid.uuid4().hex[:6]}"
+
+
+class _DictText(_DictComponent):
+    def __init__(self, value, **props):
+        super().__init__(**props)
+        self.value = value
+
+
+def _measure(factory, count: int) -> float:
+    start = time.perf_counter()
+    items = [factory(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    del items
+    return elapsed
+
+
+def main(count: int = 100_000) -> None:
+    before = min(_measure(lambda i: _DictText(i), count) for _ in range(3))
+    after = min(_measure(lambda i: Text_(i), count) for _ in range(3))
+
+    print(f"constructing {count} Text components")
+    print(f"  dict + uuid4 ids:    {before * 1000:8.1f} ms")
+    print(f"  slots + counter ids: {after * 1000:8.1f} ms")
+    print(f"  speedup:             {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
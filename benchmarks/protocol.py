@@ -0,0 +1,167 @@
+"""
+Wire protocol benchmark.
+
+Compares, for each message type, the JSON text encoding with the binary
+encoding of ``taupy.protocol``: bytes per message and encode / decode time
+per message. Messages are encoded in frames of ``--frame`` messages, as the
+server sends them, after a warm-up frame so element ids are already
+interned (the steady state of a session). ``tick`` mixes the small
+updates a State change typically produces in one frame.
+
+Run:
+    python benchmarks/protocol.py
+    python benchmarks/protocol.py --count 100000 --frame 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from taupy.protocol import Decoder, Encoder  # noqa: E402
+
+IDS = 200
+
+
+def _messages(kind: str, n: int) -> List[Dict[str, Any]]:
+    ids = [f"tau_{i}" for i in range(IDS)]
+    make: Dict[str, Callable[[int], Dict[str, Any]]] = {
+        "update_text": lambda i: {
+            "type": "update_text",
+            "id": ids[i % IDS],
+            "value": str(i),
+        },
+        "set_attr": lambda i: {
+            "type": "set_attr",
+            "id": ids[i % IDS],
+            "name": "disabled",
+            "value": "" if i % 2 else None,
+        },
+        "toggle_class": lambda i: {
+            "type": "toggle_class",
+            "id": ids[i % IDS],
+            "name": "hidden",
+            "on": bool(i % 2),
+        },
+        "update_html": lambda i: {
+            "type": "update_html",
+            "id": ids[i % IDS],
+            "html": f'<span class="badge">{i}</span>' * 10,
+        },
+        "table_rows": lambda i: {
+            "type": "table_rows",
+            "id": ids[i % IDS],
+            "start": i,
+            "total": 10_000,
+            "rows": [[str(i + r), f"name {i + r}", "0.5"] for r in range(5)],
+        },
+    }
+    if kind == "tick":
+        small = ("update_text", "set_attr", "toggle_class")
+        return [make[small[i % 3]](i) for i in range(n)]
+    return [make[kind](i) for i in range(n)]
+
+
+KINDS = (
+    "update_text",
+    "set_attr",
+    "toggle_class",
+    "update_html",
+    "table_rows",
+    "tick",
+)
+
+
+def _json_encode(frame: List[Dict[str, Any]]) -> str:
+    if len(frame) == 1:
+        return json.dumps(frame[0])
+    return json.dumps({"type": "batch", "messages": frame})
+
+
+def _json_decode(payload: str) -> List[Dict[str, Any]]:
+    data = json.loads(payload)
+    return data["messages"] if data["type"] == "batch" else [data]
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(kind: str, count: int, frame: int, repeat: int) -> Dict[str, float]:
+    """
+    Measure one message type.
+
+    Returns:
+        dict: bytes and encode/decode microseconds per message, per codec.
+    """
+    messages = _messages(kind, count)
+    frames = [messages[i : i + frame] for i in range(0, count, frame)]
+    warmup = _messages(kind, IDS)
+
+    t_enc, payloads = _time(lambda: [_json_encode(f) for f in frames], repeat)
+    t_dec, _ = _time(lambda: [_json_decode(p) for p in payloads], repeat)
+    json_bytes = sum(len(p.encode("utf-8")) for p in payloads)
+
+    def encode_binary() -> List[bytes]:
+        encoder = Encoder()
+        encoder.encode(warmup)
+        return [encoder.encode(f) for f in frames]
+
+    def decode_binary() -> List[List[Dict[str, Any]]]:
+        decoder = Decoder()
+        decoder.decode(warm)
+        return [decoder.decode(p) for p in binary]
+
+    warm = Encoder().encode(warmup)
+    b_enc, binary = _time(encode_binary, repeat)
+    b_dec, decoded = _time(decode_binary, repeat)
+    assert [m for f in decoded for m in f] == messages
+    binary_bytes = sum(len(p) for p in binary)
+
+    us = 1e6 / count
+    return {
+        "json_bytes": json_bytes / count,
+        "binary_bytes": binary_bytes / count,
+        "json_encode_us": t_enc * us,
+        "binary_encode_us": b_enc * us,
+        "json_decode_us": t_dec * us,
+        "binary_decode_us": b_dec * us,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--frame", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default=",".join(KINDS))
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'message':<14}{'json B':>9}{'bin B':>9}"
+        f"{'json enc':>11}{'bin enc':>10}{'json dec':>11}{'bin dec':>10}  (µs/msg)"
+    )
+    for kind in args.only.split(","):
+        r = run(kind, args.count, args.frame, args.repeat)
+        print(
+            f"{kind:<14}{r['json_bytes']:>9.1f}{r['binary_bytes']:>9.1f}"
+            f"{r['json_encode_us']:>11.2f}{r['binary_encode_us']:>10.2f}"
+            f"{r['json_decode_us']:>11.2f}{r['binary_decode_us']:>10.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
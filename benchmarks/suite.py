@@ -0,0 +1,299 @@
+"""
+Render benchmark suite.
+
+Measures, for each widget scenario and tree size:
+
+* ``construct``: building the component tree,
+* ``render``: the first ``render()`` of the tree,
+* ``bytes``: size of the rendered HTML,
+* ``navigate``: ``App.navigate()`` until the message has been handed to
+  every client of an in-memory ``TauServer`` (fake sockets, no network),
+* ``renavigate``: the same for a second navigate to the same route, which
+  diffs the rebuilt tree against the cached one.
+
+Timings are the median of ``--repeat`` runs, so a single slow run does not
+show up as a regression. Results can be saved as a baseline JSON file and
+later compared against it; any metric that grew by more than
+``--threshold`` (relative) is reported and the exit code is 1.
+
+Run:
+    python benchmarks/suite.py                      # print results
+    python benchmarks/suite.py --save               # write the baseline
+    python benchmarks/suite.py --compare            # check for regressions
+    python benchmarks/suite.py --sizes 1000 --only table,modal
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from taupy.app import App  # noqa: E402
+from taupy.state import State  # noqa: E402
+from taupy.widgets.component import Component, IdAllocator  # noqa: E402
+from taupy.widgets.elements import Div_, Modal_, Table_, Text_  # noqa: E402
+from taupy.widgets.factory import Component as Template  # noqa: E402
+from taupy.widgets.layout import HStack, VStack  # noqa: E402
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+# Timing differences below this many seconds are noise, whatever the ratio.
+MIN_DELTA = 0.002
+CLIENTS = 3
+
+Card = Template(
+    """
+<div class="card">
+  <h2>{title}</h2>
+  <p>{subtitle}</p>
+</div>
+"""
+)
+
+
+def build_vstack(n: int) -> Component:
+    return VStack(*[Text_(f"item {i}") for i in range(n)])
+
+
+def build_hstack(n: int) -> Component:
+    rows = [HStack(*[Text_(i + j) for j in range(10)]) for i in range(0, n, 10)]
+    return VStack(*rows)
+
+
+def build_table(n: int) -> Component:
+    rows = [[i, f"name {i}", i * 0.5] for i in range(n)]
+    return Table_(head=["id", "name", "score"], rows=rows)
+
+
+def build_modal(n: int) -> Component:
+    return Modal_(State(True), title="Items", content=[Text_(i) for i in range(n)])
+
+
+def build_template(n: int) -> Component:
+    return VStack(*[Card(title=f"card {i}", subtitle="<sub>") for i in range(n)])
+
+
+SCENARIOS: Dict[str, Callable[[int], Component]] = {
+    "vstack": build_vstack,
+    "hstack": build_hstack,
+    "table": build_table,
+    "modal": build_modal,
+    "template": build_template,
+}
+
+
+class FakeSocket:
+    """In-memory stand-in for a websockets connection."""
+
+    open = True
+
+    def __init__(self) -> None:
+        self.received = 0
+
+    async def send(self, payload: Any) -> None:
+        if isinstance(payload, str):
+            self.received += len(payload)
+        else:
+            self.received += sum(len(part) for part in payload)
+
+
+@contextmanager
+def _fresh_ids() -> Iterator[None]:
+    """
+    Number components from ``tau_1`` again, so ``bytes`` (ids are part of the
+    markup) does not depend on which scenarios ran before.
+    """
+    previous = Component.ids
+    Component.ids = IdAllocator()
+    try:
+        yield
+    finally:
+        Component.ids = previous
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[float, Any]:
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def _navigate_once(build: Callable[[int], Component], n: int) -> tuple[float, float]:
+    with _fresh_ids():
+        return _navigate(build, n)
+
+
+def _navigate(build: Callable[[int], Component], n: int) -> tuple[float, float]:
+    """
+    Returns:
+        tuple: seconds of the first and of the second navigate to the route.
+    """
+    app = App("bench", 800, 600)
+    app.root_component = Div_()
+    app.router.register("/", lambda: build(n))
+    clients = [FakeSocket() for _ in range(CLIENTS)]
+    app.server.clients.update(clients)  # type: ignore[arg-type]
+
+    async def timed_navigate() -> float:
+        for c in clients:
+            c.received = 0
+        gc.collect()
+        start = time.perf_counter()
+        await app.navigate("/")
+        await app.server.flush()
+        elapsed = time.perf_counter() - start
+        assert all(c.received for c in clients), "navigate sent nothing"
+        return elapsed
+
+    async def run() -> tuple[float, float]:
+        first = await timed_navigate()
+        return first, await timed_navigate()
+
+    return asyncio.run(run())
+
+
+def run_case(name: str, n: int, repeat: int) -> Dict[str, float]:
+    """
+    Benchmark one scenario at one size.
+
+    Returns:
+        dict: median ``construct``/``render``/``navigate``/``renavigate``
+        seconds and ``bytes``.
+    """
+    build = SCENARIOS[name]
+    timings: Dict[str, List[float]] = {
+        "construct": [],
+        "render": [],
+        "navigate": [],
+        "renavigate": [],
+    }
+    size = 0
+
+    for _ in range(repeat):
+        with _fresh_ids():
+            t, tree = _timed(lambda: build(n))
+        timings["construct"].append(t)
+        t, html = _timed(tree.render)
+        timings["render"].append(t)
+        size = len(html.encode("utf-8"))
+        del tree, html
+        first, second = _navigate_once(build, n)
+        timings["navigate"].append(first)
+        timings["renavigate"].append(second)
+
+    result: Dict[str, float] = {
+        metric: statistics.median(values) for metric, values in timings.items()
+    }
+    result["bytes"] = size
+    return result
+
+
+def run_suite(sizes, names, repeat: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        for n in sizes:
+            key = f"{name}/{n}"
+            results[key] = run_case(name, n, repeat if n < 100_000 else 1)
+            r = results[key]
+            print(
+                f"{key:<16} construct {r['construct'] * 1000:9.1f} ms  "
+                f"render {r['render'] * 1000:9.1f} ms  "
+                f"navigate {r['navigate'] * 1000:9.1f} ms  "
+                f"renavigate {r['renavigate'] * 1000:9.1f} ms  "
+                f"{r['bytes'] / 1024:10.1f} KiB"
+            )
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """
+    List the metrics that regressed by more than ``threshold`` (relative).
+
+    Cases or metrics missing from the baseline are ignored, and so are
+    timings that grew by less than ``MIN_DELTA`` seconds.
+    """
+    regressions = []
+    for key, metrics in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        for metric, value in metrics.items():
+            old = base.get(metric)
+            if not old:
+                continue
+            if metric != "bytes" and value - old < MIN_DELTA:
+                continue
+            ratio = value / old
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{key} {metric}: {old:.6g} -> {value:.6g} ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--only", default=",".join(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    parser.add_argument("--compare", action="store_true", help="check the baseline")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    names = [s for s in args.only.split(",") if s]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = run_suite(sizes, names, args.repeat)
+
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"no baseline at {args.baseline}; run with --save first")
+            return 1
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nregressions above {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nno regressions above {args.threshold:.0%}")
+
+    if args.save:
+        data: Dict[str, Any] = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        if args.baseline.exists():
+            old = json.loads(args.baseline.read_text(encoding="utf-8"))
+            data["results"] = {**old.get("results", {}), **results}
+        args.baseline.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        print(f"\nbaseline written to {args.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ from .router import Router
 from .theme import TauTheme
 from .widgets import (
     Component,
+    Markup,
     Div,
     Button,
     Text,
@@ -16,6 +17,9 @@ from .widgets import (
     Spacer,
     Scroll,
     Container,
+    ColumnarSource,
+    For,
+    Each,
 )
 
 __all__ = [
@@ -24,6 +28,7 @@ __all__ = [
     "Router",
     "TauTheme",
     "Component",
+    "Markup",
     "Div",
     "Button",
     "Text",
@@ -37,4 +42,7 @@ __all__ = [
     "Spacer",
     "Scroll",
     "Container",
+    "ColumnarSource",
+    "For",
+    "Each",
 ]
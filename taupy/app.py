@@ -8,19 +8,26 @@ import sys
 import subprocess
 import ctypes
 import threading
-from typing import Any, Awaitable, Callable, Optional
+from contextlib import contextmanager
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Coroutine, Iterator, Optional
 from enum import Enum
-from types import CellType
 
 import websockets
 
 from .dispatcher import Dispatcher
 from .router import Router
 from .widgets.component import Component
-from .widgets.elements import Button_, Text_, Input_
-from .state import State
+from .widgets.elements import Button_, Text_, Input_, Table_
+from .widgets.elements import _attr_name, _attr_value, _class_value
+from .state import Effect, State, batch, bind_loop
 from .server import TauServer
+from .vdom import RenderCache
 
+from .config import load_server_config
+from .scheduler import OVERFLOW_POLICIES
+from .sequencer import EVENT_ORDERINGS
 from .reloader import start_hot_reload, start_static_reload, free_port
 import shutil
 
@@ -61,6 +68,8 @@ class App:
         min_height: int | None = None,
         max_width: int | None = None,
         max_height: int | None = None,
+        compression: bool | None = None,
+        compression_threshold: int | None = None,
     ) -> None:
         """
         Initialize the application.
@@ -73,6 +82,11 @@ class App:
             mode (AppMode): GENERATE_HTML renders to dist/, RAW_HTML reuses existing dist/.
             frameless (bool): Remove native window frame (Lake Engine).
             transparent (bool): Make window background transparent (Lake Engine).
+            compression (bool | None): permessage-deflate for the WebSocket.
+                Defaults to ``[server] compression`` in taupy.toml, else on.
+            compression_threshold (int | None): Messages smaller than this
+                many bytes are sent uncompressed. Defaults to
+                ``[server] compression_threshold``, else 1024.
         """
         self.root_module_name = (
             sys.argv[0].replace(".py", "").replace("/", ".").replace("\\", ".")
@@ -104,12 +118,18 @@ class App:
         self.dispatcher = Dispatcher()
         self.router = Router()
         self.root_component: Optional[Component] = None
+        self.current_route: Optional[str] = None
         self.mode = mode
         self.http_port = http_port
         self.external_http = external_http
         self.ws_port = 8765
 
         self.server = TauServer(self)
+        self._configure_server(compression, compression_threshold)
+        self._vdom = RenderCache()
+        self._outbox: list[dict[str, Any]] = []
+        self._outbox_scheduled = False
+        self._transaction_depth = 0
         self.connect_handlers: list[Callable[[], Awaitable[None] | None]] = []
 
         self.dev = dev_flag
@@ -134,6 +154,51 @@ class App:
             Callable[[str, dict], Awaitable[None] | None]
         ] = []
         self._window_stdout_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    def _configure_server(self, enabled: bool | None, threshold: int | None) -> None:
+        """
+        Resolve the server settings: environment variables, then App
+        arguments, then the ``[server]`` table of taupy.toml.
+        """
+        cfg = load_server_config(
+            os.path.dirname(os.path.abspath(self.root_module_path))
+        )
+
+        env_enabled = os.getenv("TAUPY_WS_COMPRESSION")
+        if env_enabled is not None:
+            enabled = env_enabled not in ("0", "false", "False")
+        elif enabled is None:
+            enabled = cfg.get("compression")
+
+        env_threshold = os.getenv("TAUPY_WS_COMPRESSION_THRESHOLD")
+        if env_threshold and env_threshold.isdigit():
+            threshold = int(env_threshold)
+        elif threshold is None:
+            threshold = cfg.get("compression_threshold")
+
+        server = self.server
+        if isinstance(enabled, bool):
+            server.compression = enabled
+        if isinstance(threshold, int):
+            server.compression_threshold = threshold
+        level = cfg.get("compression_level")
+        if isinstance(level, int):
+            server.compression_level = level
+        queue_size = cfg.get("queue_size")
+        if isinstance(queue_size, int):
+            server.max_queue = queue_size if queue_size > 0 else None
+        overflow = cfg.get("overflow")
+        if overflow in OVERFLOW_POLICIES:
+            server.overflow = overflow
+        ordering = cfg.get("event_ordering")
+        if ordering in EVENT_ORDERINGS:
+            server.event_ordering = ordering
+        max_in_flight = cfg.get("max_in_flight")
+        if isinstance(max_in_flight, int):
+            server.max_in_flight = max_in_flight
 
     async def run(
         self, root_component: Optional[Component] = None, port: int = 8765
@@ -160,18 +225,28 @@ class App:
             port = int(env_ws_port)
         self.ws_port = port
 
+        self._loop = asyncio.get_running_loop()
+        bind_loop(self._loop)
+
         self.root_component = root_component
         if self.mode == AppMode.GENERATE_HTML:
             self._render_and_save_html(root_component)  # type: ignore[arg-type]
         elif root_component:
             self._bind_events_and_states(root_component)
 
+        serve = partial(
+            websockets.serve,
+            self.server.handler,
+            "localhost",
+            port,
+            **self.server.serve_options(),
+        )
         try:
-            await websockets.serve(self.server.handler, "localhost", port)
+            await serve()
         except OSError as e:
             if e.errno == 10048:
                 free_port(port)
-                await websockets.serve(self.server.handler, "localhost", port)
+                await serve()
             else:
                 raise
 
@@ -216,6 +291,9 @@ class App:
         """
         Render the root component and embed it into the HTML template.
 
+        The body is written chunk by chunk from ``iter_render()``, so the full
+        page is never held in memory as one string.
+
         Output directory:
             dist/index.html
             dist/public/
@@ -223,8 +301,6 @@ class App:
         Parameters:
             component (Component): UI element tree root.
         """
-        rendered_body = component.render()
-
         template_path = os.path.join(
             os.path.dirname(__file__), "templates", "base.html"
         )
@@ -232,9 +308,7 @@ class App:
         with open(template_path, "r", encoding="utf-8") as tpl_file:
             template_html = tpl_file.read()
 
-        full_html = template_html.format(
-            title=self.title, theme=self.theme, body=rendered_body
-        )
+        head, tail = template_html.split("{body}", 1)
 
         dist_dir = os.path.join(os.getcwd(), "dist")
         public_dir = os.path.join(dist_dir, "public")
@@ -243,7 +317,10 @@ class App:
         os.makedirs(public_dir, exist_ok=True)
 
         with open(os.path.join(dist_dir, "index.html"), "w", encoding="utf-8") as f:
-            f.write(full_html)
+            f.write(head.format(title=self.title, theme=self.theme))
+            for chunk in component.iter_render():
+                f.write(chunk)
+            f.write(tail.format(title=self.title, theme=self.theme))
 
         self._ensure_client_js(dist_dir)
 
@@ -252,46 +329,155 @@ class App:
     def _bind_events_and_states(self, component: Component) -> None:
         """
         Recursively propagate the App reference, connect reactive State bindings,
-        and attach input handlers.
-        """
+        attach input handlers and mount the subtree.
 
-        from inspect import isfunction
+        Everything registered here is released when the component is
+        unmounted. Components that are still mounted (e.g. a cached screen
+        shown again) keep their bindings; only their new children are bound.
+        """
+        if component._mounted and component.app is self:
+            for child in component._child_components():
+                self._bind_events_and_states(child)
+            return
 
         component.app = self
 
-        if isinstance(component, Text_) and isfunction(component.value):
-            func = component.value
-            states: set[State] = set()
-
-            closure: tuple[CellType, ...] = func.__closure__ or ()
-            for cell in closure:
-                val = cell.cell_contents
-                if isinstance(val, State):
-                    states.add(val)
-
-            for name in func.__code__.co_names:
-                if name in func.__globals__:
-                    val = func.__globals__[name]
-                    if isinstance(val, State):
-                        states.add(val)
+        if isinstance(component, Text_) and callable(component.value):
+            self._bind_text(component)
 
-            for st in states:
-
-                def _on_state_change(_v, cid=component.id, f=func):
-                    self._update_text_component(cid, f())
-
-                st.subscribe(_on_state_change)
+        if component.props_are_attrs:
+            self._bind_props(component)
 
         if isinstance(component, Button_):
             pass
 
         if isinstance(component, Input_):
             if component.on_input:
-                self.dispatcher.on_input(component.id)(component.on_input)
+                self.dispatcher.on_input(component.id, component.min_interval)(
+                    component.on_input
+                )
+                component.add_cleanup(
+                    partial(self.dispatcher.remove, component.id, "input")
+                )
 
-        for child in component.children:
+        if isinstance(component, Table_) and component.virtual:
+            self.dispatcher.on_viewport(component.id)(component.on_viewport)
+            component.add_cleanup(
+                partial(self.dispatcher.remove, component.id, "viewport")
+            )
+
+        for child in component._child_components():
             self._bind_events_and_states(child)
 
+        component._mount()
+
+    def _bind_text(self, component: Text_) -> None:
+        """
+        Bind a callable ``Text`` to the States it reads.
+
+        Dependencies are recorded while the callable runs, so the text is
+        refreshed exactly when one of them changes. Binding again replaces
+        the previous binding.
+        """
+        if component.binding is not None:
+            component.binding.dispose()
+
+        def on_change(value: Any, c: Text_ = component) -> None:
+            c.invalidate()
+            self._update_text_component(c.id, value)
+
+        binding = component.binding = Effect(component.value, on_change)
+
+        def release(c: Text_ = component) -> None:
+            binding.dispose()
+            if c.binding is binding:
+                c.binding = None
+
+        component.add_cleanup(release)
+
+    def _bind_props(self, component: Component) -> None:
+        """
+        Bind the ``State`` / ``Computed`` props of a component.
+
+        A change of a reactive prop sends a ``set_attr`` message, a reactive
+        entry of ``classes`` a ``toggle_class`` message and a reactive
+        ``Input`` value a ``set_value`` message, instead of re-rendering the
+        element.
+        """
+        for effect in component._bindings or ():
+            effect.dispose()
+        component._bindings = None
+        value = None
+        if isinstance(component, Input_) and callable(component.value):
+            value = component.value
+        if value is None and not component._has_reactive_props():
+            return
+        bindings: list[Effect] = []
+
+        def on_attr(value: Any, name: str) -> None:
+            component.invalidate()
+            if name == "class":
+                self._set_attr(component.id, "class", _class_value(component))
+            else:
+                self._set_attr(component.id, _attr_name(name), value)
+
+        def on_class(on: Any, name: str) -> None:
+            component.invalidate()
+            self._toggle_class(component.id, name, bool(on))
+
+        def on_value(value: Any) -> None:
+            component.invalidate()
+            self._set_value(component.id, value)
+
+        for name, prop in component.props.items():
+            if name == "classes":
+                for cls, flag in prop.items():
+                    if isinstance(flag, State):
+                        bindings.append(Effect(flag, partial(on_class, name=cls)))
+            elif isinstance(prop, State):
+                bindings.append(Effect(prop, partial(on_attr, name=name)))
+
+        if value is not None:
+            bindings.append(Effect(value, on_value))
+
+        component._bindings = bindings
+
+        def release() -> None:
+            for effect in bindings:
+                effect.dispose()
+            if component._bindings is bindings:
+                component._bindings = None
+
+        component.add_cleanup(release)
+
+    def _set_attr(self, component_id: str, name: str, value: Any) -> None:
+        """
+        Send a ``set_attr`` message; ``None`` / ``False`` remove the attribute.
+
+        Parameters:
+            component_id (str): UI element ID.
+            name (str): Attribute name.
+            value (Any): New value, ``True`` for a bare boolean attribute.
+        """
+        attr = _attr_value(value)
+        self._vdom.set_attr(component_id, name, attr)
+        self._enqueue(
+            {"type": "set_attr", "id": component_id, "name": name, "value": attr}
+        )
+
+    def _toggle_class(self, component_id: str, name: str, on: bool) -> None:
+        """Send a ``toggle_class`` message adding or removing one class."""
+        self._vdom.toggle_class(component_id, name, on)
+        self._enqueue(
+            {"type": "toggle_class", "id": component_id, "name": name, "on": on}
+        )
+
+    def _set_value(self, component_id: str, value: Any) -> None:
+        """Send a ``set_value`` message updating the value of an input."""
+        text = "" if value is None else str(value)
+        self._vdom.set_attr(component_id, "value", text)
+        self._enqueue({"type": "set_value", "id": component_id, "value": text})
+
     def _ensure_client_js(self, dist_dir: str) -> None:
         base_dir = os.path.dirname(os.path.abspath(__file__))
         utils_client = os.path.join(base_dir, "utils", "client.js")
@@ -310,16 +496,95 @@ class App:
             component_id (str): UI element ID.
             new_value (Any): Value to render inside the <Text>.
         """
-        asyncio.create_task(
-            self.server.broadcast(
-                {"type": "update_text", "id": component_id, "value": str(new_value)}
-            )
-        )
+        value = str(new_value)
+        self._vdom.set_text(component_id, value)
+        self._enqueue({"type": "update_text", "id": component_id, "value": value})
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group State changes and UI updates into a single message.
+
+        State notifications are deferred as in ``State.batch()``, and every
+        message produced inside the block (text updates, component updates)
+        is buffered. When the outermost block exits, the buffered messages are
+        sent as one ``batch`` message; repeated text updates of the same
+        element keep only the last value.
+
+        Example:
+            with app.transaction():
+                for s in states:
+                    s.set(0)
+        """
+        self._transaction_depth += 1
+        try:
+            with batch():
+                yield
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self._flush_outbox()
+
+    def _enqueue(self, msg: dict[str, Any]) -> None:
+        """
+        Queue a message for the clients.
+
+        Messages queued during the same event loop iteration (or the same
+        transaction) are combined into one frame. Safe to call from other
+        threads once the App runs.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is None:
+                raise
+            self._loop.call_soon_threadsafe(self._enqueue, msg)
+            return
+
+        self._outbox.append(msg)
+        if self._transaction_depth or self._outbox_scheduled:
+            return
+        self._outbox_scheduled = True
+        loop.call_soon(self._flush_outbox)
+
+    async def _send(self, msg: dict[str, Any]) -> None:
+        """Broadcast a message now, or buffer it inside a transaction."""
+        if self._transaction_depth:
+            self._outbox.append(msg)
+        else:
+            await self.server.broadcast(msg)
+
+    def _flush_outbox(self) -> None:
+        self._outbox_scheduled = False
+        if self._transaction_depth or not self._outbox:
+            return
+
+        messages: list[dict[str, Any]] = []
+        texts: dict[str, dict[str, Any]] = {}
+        for msg in self._outbox:
+            if msg.get("type") == "update_text":
+                previous = texts.get(msg["id"])
+                if previous is not None:
+                    previous["value"] = msg["value"]
+                    continue
+                msg = texts[msg["id"]] = dict(msg)
+            messages.append(msg)
+        self._outbox.clear()
+
+        if len(messages) == 1:
+            out = messages[0]
+        else:
+            out = {"type": "batch", "messages": messages}
+        asyncio.ensure_future(self.server.broadcast(out))
 
     async def navigate(self, route: str) -> None:
         """
         Render a new screen and send it to all connected clients.
 
+        The screen is diffed against the previously sent one, so only a
+        ``patch`` message with the changed nodes goes over the socket when
+        possible.
+
         Parameters:
             route (str): Route path string (e.g. "/settings").
         """
@@ -336,17 +601,20 @@ class App:
         if not self.root_component:
             raise RuntimeError("App has no root component to navigate from.")
 
+        self.current_route = route
+
+        for old_screen in self.root_component.children:
+            if old_screen is not new_screen and isinstance(old_screen, Component):
+                old_screen._unmount()
+
         self.root_component.children = [new_screen]
 
         self._bind_events_and_states(new_screen)
 
-        await self.server.broadcast(
-            {
-                "type": "replace",
-                "id": self.root_component.id,
-                "html": new_screen.render(),
-            }
-        )
+        html = "".join(new_screen.iter_render())
+        msg = self._vdom.replace(self.root_component.id, html)
+        if msg:
+            await self._send(msg)
 
     def on_connect(self, func: Callable[[], Awaitable[None] | None]):
         """
@@ -522,6 +790,93 @@ class App:
 
         return decorator
 
+    def _schedule(self, coro: Coroutine[Any, Any, Any]) -> "asyncio.Future[Any]":
+        """
+        Run a coroutine on the App's loop from any thread.
+
+        Returns:
+            Future: An asyncio Task on the loop thread, otherwise a
+            ``concurrent.futures.Future``.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None and (self._loop is None or running is self._loop):
+            return running.create_task(coro)
+        if self._loop is None:
+            raise RuntimeError("App is not running; no loop to schedule on.")
+        return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+    async def run_in_thread(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        into: State | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a blocking function in a worker thread without blocking the UI.
+
+        Example:
+            rows = State([])
+
+            @app.dispatcher.on_click("load")
+            async def load(_):
+                await app.run_in_thread(parse_csv, path, into=rows)
+
+        Parameters:
+            fn (Callable): Function to run.
+            *args, **kwargs: Arguments for ``fn``.
+            into (State | None): State that receives the result on the loop.
+
+        Returns:
+            Any: The result of ``fn``.
+        """
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(thread_name_prefix="taupy-worker")
+        return await self._run_in(self._thread_pool, fn, args, kwargs, into)
+
+    async def run_in_process(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        into: State | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a CPU-heavy function in a worker process.
+
+        ``fn``, its arguments and its result must be picklable, so ``fn`` has
+        to be defined at module level. The pool is created on first use and
+        shut down with the App.
+
+        Parameters:
+            fn (Callable): Module-level function to run.
+            *args, **kwargs: Arguments for ``fn``.
+            into (State | None): State that receives the result on the loop.
+
+        Returns:
+            Any: The result of ``fn``.
+        """
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor()
+        return await self._run_in(self._process_pool, fn, args, kwargs, into)
+
+    async def _run_in(
+        self,
+        executor: Executor,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        into: State | None,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+        if into is not None:
+            into.set(result)
+        return result
+
     async def hot_reload_broadcast(self, message: str) -> None:
         """
         Broadcast a message to all connected clients.
@@ -559,6 +914,11 @@ class App:
         except Exception:
             pass
 
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        bind_loop(None)
+
         if self.window_process:
             try:
                 self.window_process.terminate()
@@ -576,9 +936,37 @@ class App:
         os._exit(0)
 
     async def update_component(self, component_id: str, new_html: str):
-        await self.server.broadcast(
-            {"type": "update_html", "id": component_id, "html": new_html}
-        )
+        """
+        Replace a rendered component on all clients, sending a ``patch``
+        against the previously sent HTML when possible.
+
+        Parameters:
+            component_id (str): UI element ID.
+            new_html (str): Freshly rendered outer HTML of the component.
+        """
+        msg = self._vdom.update(component_id, new_html)
+        if msg:
+            await self._send(msg)
+
+    async def _resync(self, target_id: str) -> None:
+        """Resend full HTML for a target whose patch failed on the client."""
+        msg = self._vdom.resync(target_id)
+        if msg is None:
+            component = self._find_component(target_id)
+            if component is not None:
+                msg = self._vdom.update(target_id, component.render())
+        if msg:
+            await self.server.broadcast(msg)
+
+    def _find_component(self, component_id: str) -> Optional[Component]:
+        """Look up a mounted component by id, depth first from the root."""
+        stack = [self.root_component] if self.root_component else []
+        while stack:
+            component = stack.pop()
+            if component.id == component_id:
+                return component
+            stack.extend(component._child_components())
+        return None
 
     async def send_window_command(self, command: dict):
         """
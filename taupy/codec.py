@@ -0,0 +1,158 @@
+"""
+JSON codec used for the WebSocket traffic.
+
+``orjson`` or ``msgspec`` are used when installed, the standard library
+``json`` module otherwise. Set ``TAUPY_JSON`` to ``orjson``, ``msgspec`` or
+``json`` to force one. Values the fast encoders reject (e.g. integers above
+64 bits, non-string keys) are encoded with the standard library instead.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+class Codec:
+    """A named pair of ``dumps`` (to ``str``) and ``loads`` functions."""
+
+    __slots__ = ("name", "_dumps", "loads")
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], str],
+        loads: Callable[[Any], Any],
+    ) -> None:
+        self.name = name
+        self._dumps = dumps
+        self.loads = loads
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Encode ``obj`` as compact JSON text.
+
+        Parameters:
+            obj (Any): JSON-serializable value.
+
+        Returns:
+            str: JSON text.
+        """
+        try:
+            return self._dumps(obj)
+        except (TypeError, ValueError, OverflowError):
+            return _stdlib_dumps(obj)
+
+    def __repr__(self) -> str:
+        return f"<Codec {self.name}>"
+
+
+def _codecs() -> Dict[str, Codec]:
+    codecs = {"json": Codec("json", _stdlib_dumps, json.loads)}
+    if msgspec is not None:
+        encoder = msgspec.json.Encoder()
+        codecs["msgspec"] = Codec(
+            "msgspec",
+            lambda obj: encoder.encode(obj).decode("utf-8"),
+            msgspec.json.Decoder().decode,
+        )
+    if orjson is not None:
+        codecs["orjson"] = Codec(
+            "orjson", lambda obj: orjson.dumps(obj).decode("utf-8"), orjson.loads
+        )
+    return codecs
+
+
+CODECS = _codecs()
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """
+    Return a codec by name, or the fastest available one.
+
+    Parameters:
+        name (str | None): ``"orjson"``, ``"msgspec"`` or ``"json"``; defaults
+            to ``TAUPY_JSON``, then the first installed of that order.
+    """
+    name = name or os.getenv("TAUPY_JSON")
+    if name:
+        if name not in CODECS:
+            raise ValueError(f"JSON codec {name!r} is not available")
+        return CODECS[name]
+    for preferred in ("orjson", "msgspec", "json"):
+        if preferred in CODECS:
+            return CODECS[preferred]
+    raise AssertionError("unreachable")
+
+
+class EncodedCache:
+    """
+    Remembers the JSON text of recently sent messages and frames.
+
+    A broadcast pushes the same message objects to every client's queue, so
+    the clients' frames usually hold the same messages in the same order:
+    the first client's frame is encoded, the others reuse its text. Frames
+    with other combinations still reuse the text of each message. Entries
+    keep their messages alive, so object ids cannot be reused while cached.
+
+    Frames are kept as ``str``: websockets sends ``str`` as a text frame and
+    ``bytes`` as a binary one, which JSON clients would not understand.
+    """
+
+    __slots__ = ("codec", "size", "_entries", "_frames", "hits", "misses", "frame_hits")
+
+    def __init__(self, codec: Codec, size: int = 1024) -> None:
+        self.codec = codec
+        self.size = size
+        self._entries: OrderedDict[int, Tuple[Dict[str, Any], str]] = OrderedDict()
+        self._frames: OrderedDict[Tuple[int, ...], Tuple[List[Dict[str, Any]], str]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.frame_hits = 0
+
+    def encode(self, msg: Dict[str, Any]) -> str:
+        key = id(msg)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        text = self.codec.dumps(msg)
+        self._entries[key] = (msg, text)
+        if len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+        return text
+
+    def frame(self, messages: List[Dict[str, Any]]) -> str:
+        """JSON text of a frame: the message itself, or a ``batch``."""
+        if len(messages) == 1:
+            return self.encode(messages[0])
+        key = tuple(map(id, messages))
+        entry = self._frames.get(key)
+        if entry is not None:
+            self.frame_hits += 1
+            return entry[1]
+        parts = ",".join(self.encode(msg) for msg in messages)
+        text = f'{{"type":"batch","messages":[{parts}]}}'
+        self._frames[key] = (messages, text)
+        if len(self._frames) > self.size // 16:
+            self._frames.popitem(last=False)
+        return text
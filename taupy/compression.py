@@ -0,0 +1,114 @@
+"""
+permessage-deflate with a size threshold.
+
+Large ``replace`` / ``update_html`` payloads (repetitive markup) compress
+very well, while deflating the constant stream of tiny updates only costs
+CPU. Messages below ``threshold`` bytes are therefore sent uncompressed,
+which permessage-deflate allows per message (RSV1 unset).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from websockets.extensions.base import Extension
+from websockets.extensions.permessage_deflate import (
+    PerMessageDeflate,
+    ServerPerMessageDeflateFactory,
+)
+from websockets.frames import CTRL_OPCODES, OP_CONT, Frame
+from websockets.typing import ExtensionParameter
+
+COMPRESSION_THRESHOLD = 1024
+COMPRESSION_LEVEL = 6
+
+
+class CompressionStats:
+    """Byte counters of outgoing data messages, before and after deflate."""
+
+    __slots__ = ("messages", "compressed", "bytes_in", "bytes_out")
+
+    def __init__(self) -> None:
+        self.messages = 0
+        self.compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def ratio(self) -> float:
+        """Wire bytes divided by payload bytes (1.0 without any traffic)."""
+        return self.bytes_out / self.bytes_in if self.bytes_in else 1.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "messages": self.messages,
+            "compressed": self.compressed,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": self.ratio,
+        }
+
+
+class ThresholdDeflate(PerMessageDeflate):
+    """``PerMessageDeflate`` that leaves messages below a threshold as is."""
+
+    def __init__(
+        self, base: PerMessageDeflate, threshold: int, stats: CompressionStats
+    ) -> None:
+        super().__init__(
+            base.remote_no_context_takeover,
+            base.local_no_context_takeover,
+            base.remote_max_window_bits,
+            base.local_max_window_bits,
+            base.compress_settings,
+        )
+        self.threshold = threshold
+        self.stats = stats
+        self._raw = False
+
+    def encode(self, frame: Frame) -> Frame:
+        if frame.opcode in CTRL_OPCODES:
+            return frame
+
+        stats = self.stats
+        if frame.opcode is not OP_CONT:
+            # Only complete messages can be judged by their size.
+            self._raw = frame.fin and len(frame.data) < self.threshold
+            stats.messages += 1
+            stats.compressed += not self._raw
+
+        size = len(frame.data)
+        if not self._raw:
+            frame = super().encode(frame)
+        stats.bytes_in += size
+        stats.bytes_out += len(frame.data)
+        return frame
+
+
+class ThresholdDeflateFactory(ServerPerMessageDeflateFactory):
+    """Server-side negotiation of ``ThresholdDeflate``."""
+
+    def __init__(
+        self,
+        threshold: int = COMPRESSION_THRESHOLD,
+        level: int = COMPRESSION_LEVEL,
+        stats: Optional[CompressionStats] = None,
+    ) -> None:
+        # Same window and memory settings as the websockets defaults.
+        super().__init__(
+            server_max_window_bits=12,
+            client_max_window_bits=12,
+            compress_settings={"memLevel": 5, "level": level},
+        )
+        self.threshold = threshold
+        self.stats = stats if stats is not None else CompressionStats()
+
+    def process_request_params(
+        self,
+        params: Sequence[ExtensionParameter],
+        accepted_extensions: Sequence[Extension],
+    ) -> Tuple[List[ExtensionParameter], PerMessageDeflate]:
+        response, extension = super().process_request_params(
+            params, accepted_extensions
+        )
+        return response, ThresholdDeflate(extension, self.threshold, self.stats)
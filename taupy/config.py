@@ -0,0 +1,43 @@
+"""
+Server settings from the ``[server]`` table of ``taupy.toml``.
+
+Keys: ``compression``, ``compression_threshold``, ``compression_level``,
+``queue_size``, ``overflow``, ``event_ordering`` and ``max_in_flight``
+(see ``App._configure_server``).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict
+
+
+def _load_toml(path: str) -> Dict[str, Any]:
+    try:
+        import tomllib
+    except ImportError:  # Python 3.10
+        try:
+            import tomli as tomllib  # type: ignore[no-redef, import-not-found, unused-ignore]
+        except ImportError:
+            print(f"[taupy] install 'tomli' to read {path} on Python 3.10")
+            return {}
+    with open(path, "rb") as fh:
+        return tomllib.load(fh)
+
+
+def load_server_config(directory: str) -> Dict[str, Any]:
+    """
+    Read the ``[server]`` table of ``taupy.toml`` in ``directory``.
+
+    Returns:
+        dict: The table, empty when the file or table is missing or invalid.
+    """
+    path = os.path.join(directory, "taupy.toml")
+    if not os.path.exists(path):
+        return {}
+    try:
+        cfg = _load_toml(path)
+    except Exception:
+        return {}
+    server = cfg.get("server", {})
+    return server if isinstance(server, dict) else {}
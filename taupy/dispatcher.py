@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import Any, Awaitable, Callable, Dict, Optional
-from .events.events import Click, Input
+from .events.events import Click, Input, Viewport
 
 
-EventHandler = Callable[[Any], Awaitable[Any]]
+EventHandler = Callable[[Any], Awaitable[Any] | Any]
 
 
 class Dispatcher:
@@ -27,7 +28,10 @@ class Dispatcher:
             "input": {},
             "navigate": {},
             "resize": {},
+            "viewport": {},
         }
+        self.input_intervals: Dict[str, float] = {}
+        self._last_input: Dict[str, float] = {}
 
     def on_click(self, widget_id: str) -> Callable[[EventHandler], EventHandler]:
         """
@@ -51,12 +55,16 @@ class Dispatcher:
 
         return decorator
 
-    def on_input(self, widget_id: str) -> Callable[[EventHandler], EventHandler]:
+    def on_input(
+        self, widget_id: str, min_interval: float = 0.0
+    ) -> Callable[[EventHandler], EventHandler]:
         """
         Register an asynchronous input-change event handler.
 
         Parameters:
             widget_id (str): The ID of the input widget.
+            min_interval (float): Minimum seconds between two dispatches of
+                this widget; earlier events wait for the interval to pass.
 
         Returns:
             Callable: A decorator that registers the handler.
@@ -64,10 +72,47 @@ class Dispatcher:
 
         def decorator(func: EventHandler) -> EventHandler:
             self.handlers["input"][widget_id] = func
+            if min_interval > 0:
+                self.input_intervals[widget_id] = min_interval
+            else:
+                self.input_intervals.pop(widget_id, None)
             return func
 
         return decorator
 
+    def on_viewport(self, widget_id: str) -> Callable[[EventHandler], EventHandler]:
+        """
+        Register a handler answering scroll-window requests of a virtualized
+        widget. The handler's return value is sent back to the requesting
+        client only.
+
+        Parameters:
+            widget_id (str): The ID of the virtualized widget.
+
+        Returns:
+            Callable: A decorator that registers the handler.
+        """
+
+        def decorator(func: EventHandler) -> EventHandler:
+            self.handlers["viewport"][widget_id] = func
+            return func
+
+        return decorator
+
+    def remove(self, widget_id: str, *event_types: str) -> None:
+        """
+        Unregister the handlers of a widget.
+
+        Parameters:
+            widget_id (str): The widget ID.
+            *event_types (str): Event types to clear; all types when omitted.
+        """
+        for event_type in event_types or tuple(self.handlers):
+            self.handlers.get(event_type, {}).pop(widget_id, None)
+        if not event_types or "input" in event_types:
+            self.input_intervals.pop(widget_id, None)
+            self._last_input.pop(widget_id, None)
+
     async def dispatch(self, event: Any) -> Optional[Any]:
         """
         Dispatch an event object to the appropriate handler based on its type.
@@ -115,6 +160,11 @@ class Dispatcher:
         """
         Dispatch an input-change event for a given widget ID.
 
+        With a ``min_interval`` registered the call first sleeps until that
+        much time passed since the previous dispatch of the widget; the
+        server cancels the sleeping call when a newer value arrives, so a
+        burst of events runs the handler for its first and last value only.
+
         Parameters:
             component_id (str): The input widget ID.
             value (str): The updated text value.
@@ -123,7 +173,42 @@ class Dispatcher:
             Optional[Any]: Handler result if the handler exists.
         """
         handler = self.handlers["input"].get(component_id)
-        if handler:
-            event = Input(component_id, value)
-            return await handler(event)
-        return None
+        if handler is None:
+            return None
+
+        interval = self.input_intervals.get(component_id)
+        if interval:
+            last = self._last_input.get(component_id)
+            if last is not None:
+                wait = last + interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._last_input[component_id] = time.monotonic()
+
+        result = handler(Input(component_id, value))
+        if asyncio.iscoroutine(result):
+            return await result
+        return result
+
+    async def dispatch_viewport(
+        self, component_id: str, first: int, count: int
+    ) -> Optional[Any]:
+        """
+        Dispatch a viewport change of a virtualized widget.
+
+        Parameters:
+            component_id (str): The widget ID.
+            first (int): Index of the first visible row.
+            count (int): Number of rows requested.
+
+        Returns:
+            Optional[Any]: The reply message produced by the handler.
+        """
+        handler = self.handlers["viewport"].get(component_id)
+        if handler is None:
+            return None
+
+        result = handler(Viewport(component_id, first, count))
+        if asyncio.iscoroutine(result):
+            return await result
+        return result
@@ -56,3 +56,19 @@ class Resize(Event):
         super().__init__("resize")
         self.width = width
         self.height = height
+
+
+class Viewport(Event):
+    """
+    Event triggered when a virtualized table scrolls to a new row range.
+
+    Parameters:
+        widget_id (str): ID of the table.
+        first (int): Index of the first row the client needs.
+        count (int): Number of rows the client needs.
+    """
+
+    def __init__(self, widget_id: str, first: int, count: int) -> None:
+        super().__init__("viewport", widget_id)
+        self.first = first
+        self.count = count
@@ -0,0 +1,215 @@
+"""
+Compact binary wire format for server -> client frames.
+
+Negotiated with the WebSocket subprotocol ``BINARY_PROTOCOL``; clients that
+do not offer it keep receiving JSON text frames.
+
+A binary frame is a sequence of messages. Every message starts with a one
+byte type code followed by its fields in a fixed order:
+
+* strings: varint byte length, then UTF-8 bytes,
+* nullable strings: varint ``length + 1``, ``0`` for ``None``,
+* interned strings (element ids, attribute and class names): varint ``v``.
+  An even ``v`` refers to entry ``v >> 1`` of the connection's table; an
+  odd ``v`` is followed by ``v >> 1`` bytes of a new string, which gets the
+  next table index on both ends,
+* flags: one byte.
+
+Messages without a compact form (or with unexpected fields) are sent as
+type ``JSON`` carrying their JSON text.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List, Tuple
+
+BINARY_PROTOCOL = "taupy.bin1"
+
+MAX_INTERNED = 4096
+
+JSON = 0
+RESET = 255
+
+# type -> (code, fields); field kinds: "id" interned, "str", "opt" nullable
+# string, "flag" boolean.
+SCHEMAS: Dict[str, Tuple[int, Tuple[Tuple[str, str], ...]]] = {
+    "update_text": (1, (("id", "id"), ("value", "str"))),
+    "update_html": (2, (("id", "id"), ("html", "str"))),
+    "replace": (3, (("id", "id"), ("html", "str"))),
+    "set_attr": (4, (("id", "id"), ("name", "id"), ("value", "opt"))),
+    "toggle_class": (5, (("id", "id"), ("name", "id"), ("on", "flag"))),
+    "set_value": (6, (("id", "id"), ("value", "str"))),
+    "update_input": (7, (("id", "id"), ("value", "str"))),
+}
+
+_BY_CODE = {code: (name, fields) for name, (code, fields) in SCHEMAS.items()}
+
+
+def _fits(msg: Dict[str, Any], fields: Tuple[Tuple[str, str], ...]) -> bool:
+    if len(msg) != len(fields) + 1:
+        return False
+    for name, kind in fields:
+        value = msg.get(name, ...)
+        if kind == "flag":
+            if not isinstance(value, bool):
+                return False
+        elif not isinstance(value, str) and not (kind == "opt" and value is None):
+            return False
+    return True
+
+
+class Encoder:
+    """
+    Binary encoder of one connection. Keeps the interned string table, so
+    every frame must be delivered, in order, to the matching ``Decoder``.
+    """
+
+    __slots__ = ("_table", "_dumps")
+
+    def __init__(self, dumps: Callable[[Any], str] = json.dumps) -> None:
+        """
+        Parameters:
+            dumps (Callable): JSON encoder for messages without a compact form.
+        """
+        self._table: Dict[str, int] = {}
+        self._dumps = dumps
+
+    def encode(self, messages: List[Dict[str, Any]]) -> bytes:
+        """
+        Encode a list of messages as one binary frame.
+
+        Parameters:
+            messages (list[dict]): JSON-serializable messages.
+
+        Returns:
+            bytes: The frame.
+        """
+        out = bytearray()
+        for msg in messages:
+            schema = SCHEMAS.get(msg.get("type", ""))
+            if schema is None or not _fits(msg, schema[1]):
+                out.append(JSON)
+                self._str(out, self._dumps(msg))
+                continue
+
+            code, fields = schema
+            # At most two interned fields per message.
+            if len(self._table) + 2 > MAX_INTERNED:
+                out.append(RESET)
+                self._table.clear()
+            out.append(code)
+            for name, kind in fields:
+                value = msg[name]
+                if kind == "id":
+                    self._interned(out, value)
+                elif kind == "flag":
+                    out.append(1 if value else 0)
+                elif kind == "opt" and value is None:
+                    out.append(0)
+                else:
+                    data = value.encode("utf-8")
+                    _varint(out, len(data) + (kind == "opt"))
+                    out += data
+        return bytes(out)
+
+    def _str(self, out: bytearray, value: str) -> None:
+        data = value.encode("utf-8")
+        _varint(out, len(data))
+        out += data
+
+    def _interned(self, out: bytearray, value: str) -> None:
+        index = self._table.get(value)
+        if index is not None:
+            _varint(out, index << 1)
+            return
+        self._table[value] = len(self._table)
+        data = value.encode("utf-8")
+        _varint(out, (len(data) << 1) | 1)
+        out += data
+
+
+class Decoder:
+    """Decoder mirroring an ``Encoder``; used by tests and benchmarks."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self) -> None:
+        self._table: List[str] = []
+
+    def decode(self, frame: bytes) -> List[Dict[str, Any]]:
+        """
+        Decode a binary frame.
+
+        Parameters:
+            frame (bytes): Frame produced by ``Encoder.encode``.
+
+        Returns:
+            list[dict]: The messages.
+        """
+        messages: List[Dict[str, Any]] = []
+        pos = 0
+        while pos < len(frame):
+            code = frame[pos]
+            pos += 1
+            if code == RESET:
+                self._table.clear()
+                continue
+            if code == JSON:
+                text, pos = self._str(frame, pos)
+                messages.append(json.loads(text))
+                continue
+
+            name, fields = _BY_CODE[code]
+            msg: Dict[str, Any] = {"type": name}
+            for field, kind in fields:
+                value: Any
+                if kind == "id":
+                    value, pos = self._interned(frame, pos)
+                elif kind == "flag":
+                    value = frame[pos] == 1
+                    pos += 1
+                elif kind == "opt":
+                    size, pos = _read_varint(frame, pos)
+                    if size:
+                        value = frame[pos : pos + size - 1].decode("utf-8")
+                        pos += size - 1
+                    else:
+                        value = None
+                else:
+                    value, pos = self._str(frame, pos)
+                msg[field] = value
+            messages.append(msg)
+        return messages
+
+    @staticmethod
+    def _str(frame: bytes, pos: int) -> Tuple[str, int]:
+        size, pos = _read_varint(frame, pos)
+        return frame[pos : pos + size].decode("utf-8"), pos + size
+
+    def _interned(self, frame: bytes, pos: int) -> Tuple[str, int]:
+        v, pos = _read_varint(frame, pos)
+        if not v & 1:
+            return self._table[v >> 1], pos
+        size = v >> 1
+        value = frame[pos : pos + size].decode("utf-8")
+        self._table.append(value)
+        return value, pos + size
+
+
+def _varint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(frame: bytes, pos: int) -> Tuple[int, int]:
+    n = shift = 0
+    while True:
+        byte = frame[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
@@ -6,7 +6,10 @@ import platform
 import os
 import sys
 import subprocess
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from types import ModuleType
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .state import restore_states, snapshot_states
 
 
 class TauFilter:
@@ -17,6 +20,8 @@ class TauFilter:
             return False
         if p.startswith("Engine/") or "/Engine/" in p:
             return False
+        if "__pycache__/" in p:
+            return False
 
         return True
 
@@ -75,58 +80,169 @@ def free_port(port: int):
         print("[HMR] Could not free port:", e)
 
 
-async def start_hot_reload(app) -> None:
+POLL_INTERVAL = 0.1
+
+
+def _module_for(path: str) -> Optional[ModuleType]:
+    """Return the loaded module whose source file is ``path``."""
+    target = os.path.abspath(path)
+    for module in list(sys.modules.values()):
+        file = getattr(module, "__file__", None)
+        if file and os.path.abspath(file) == target:
+            return module
+    return None
+
+
+def _app_namespace(app) -> Dict[str, Any]:
+    """Return the globals of the module holding the live ``app``."""
+    for name in (app.root_module_name, "__main__"):
+        module = sys.modules.get(name)
+        if module is not None and any(v is app for v in vars(module).values()):
+            return vars(module)
+    return {}
+
+
+def _adopt(app, new_app) -> None:
     """
-    Watches for file changes and restarts the Python module
+    Move the routes and handlers of a freshly imported App into the live one.
+    The server, window and root component of the live App are kept.
     """
-    global _last_reload
+    app.router = new_app.router
+    app.dispatcher = new_app.dispatcher
+    app.connect_handlers = new_app.connect_handlers
+    app._window_event_handlers = new_app._window_event_handlers
 
-    print("[HMR] Enabled (soft reload mode)")
 
-    await asyncio.sleep(0.4)
+async def hot_swap(app, paths: Iterable[str]) -> bool:
+    """
+    Reload changed code into a running app without restarting it.
 
-    async for changes in _poll_changes(".", TauFilter()):
-        now = time.time()
-        if now - _last_reload < 0.4:
+    The values of keyed States and of the app module's global States are
+    snapshotted, the changed modules are reloaded (the app module last),
+    the new routes and handlers are moved into the live App, the values are
+    restored and the current route is rendered again. The WebSocket server
+    and the window process stay up.
+
+    Parameters:
+        app (App): The running application.
+        paths (Iterable[str]): Changed ``.py`` files.
+
+    Returns:
+        bool: False if there is no current route to re-render.
+    """
+    from .app import App
+
+    if app.current_route is None:
+        return False
+
+    root_path = os.path.abspath(app.root_module_path)
+    old_ns = _app_namespace(app)
+    snapshot = snapshot_states(old_ns)
+
+    for path in paths:
+        if os.path.abspath(path) == root_path:
             continue
+        module = _module_for(path)
+        if module is not None:
+            importlib.reload(module)
 
-        _last_reload = now
+    module = sys.modules.get(app.root_module_name)
+    if module is None:
+        module = importlib.import_module(app.root_module_name)
+    else:
+        module = importlib.reload(module)
+
+    namespace = vars(module)
+    new_app = next(
+        (v for v in namespace.values() if isinstance(v, App) and v is not app), None
+    )
+    if new_app is None:
+        raise RuntimeError(f"no App instance found in {app.root_module_name}")
+
+    _adopt(app, new_app)
+    for name, value in list(namespace.items()):
+        if value is new_app:
+            namespace[name] = app
+
+    restored = restore_states(snapshot, namespace)
+    await app.navigate(app.current_route)
+    print(f"[HMR] Reloaded, {restored} state value(s) kept")
+    return True
+
+
+async def _restart(app) -> None:
+    """Stop the app and start the reloaded module's ``main()`` from scratch."""
+    await app.hot_reload_broadcast("hot_reload")
+
+    try:
+        await app.server.stop()
+    except Exception:
+        pass
+
+    if app.window_process:
+        try:
+            app.window_process.terminate()
+        except Exception:
+            pass
+
+        print("[HMR] Soft restarting...")
+
+        module = importlib.import_module(app.root_module_name)
+        importlib.reload(module)
+
+        if hasattr(module, "main"):
+            asyncio.create_task(module.main())
+        else:
+            print(f"[HMR] ERROR: main() not found in {app.root_module_name}")
+
+
+async def start_hot_reload(app, interval: float = POLL_INTERVAL) -> None:
+    """
+    Watches for file changes and swaps the changed Python code into the
+    running app, keeping State values (see ``hot_swap``). Other files
+    trigger a page reload.
+
+    Parameters:
+        app (App): The running application.
+        interval (float): Polling interval in seconds.
+    """
+    print("[HMR] Enabled (state-preserving mode)")
+
+    async for changes in _poll_changes(".", TauFilter(), interval):
         print("[HMR] Changes detected:", changes)
 
         await asyncio.sleep(0.05)
 
+        paths = [path for _, path in changes if path.endswith(".py")]
+        if not paths:
+            await app.hot_reload_broadcast("hot_reload")
+            continue
+
         try:
             import py_compile
 
-            py_compile.compile(app.root_module_path, doraise=True)
+            for path in paths:
+                if os.path.exists(path):
+                    py_compile.compile(path, doraise=True)
         except Exception as e:
             err = "".join(traceback.format_exception(e))
             print("[HMR] Syntax error:\n", err)
             await app.server.broadcast({"type": "hmr_error", "message": err})
             continue
 
-        await app.hot_reload_broadcast("hot_reload")
-
+        started = time.perf_counter()
         try:
-            await app.server.stop()
-        except Exception:
-            pass
-
-        if app.window_process:
-            try:
-                app.window_process.terminate()
-            except Exception:
-                pass
-
-            print("[HMR] Soft restarting...")
-
-            module = importlib.import_module(app.root_module_name)
-            importlib.reload(module)
+            swapped = await hot_swap(app, paths)
+        except Exception as e:
+            err = "".join(traceback.format_exception(e))
+            print("[HMR] Reload failed:\n", err)
+            await app.server.broadcast({"type": "hmr_error", "message": err})
+            continue
 
-            if hasattr(module, "main"):
-                asyncio.create_task(module.main())
-            else:
-                print(f"[HMR] ERROR: main() not found in {app.root_module_name}")
+        if swapped:
+            print(f"[HMR] Swapped in {(time.perf_counter() - started) * 1000:.0f} ms")
+        else:
+            await _restart(app)
 
 
 async def start_static_reload(app, watch_dir: str = "dist") -> None:
@@ -150,13 +266,16 @@ async def start_static_reload(app, watch_dir: str = "dist") -> None:
 
 
 async def _poll_changes(
-    root: str, watch_filter: Optional[Callable[[str, str], bool]] = None
-) -> Iterable[List[Tuple[str, str]]]:
+    root: str,
+    watch_filter: Optional[Callable[[str, str], bool]] = None,
+    interval: float = POLL_INTERVAL,
+) -> AsyncIterator[List[Tuple[str, str]]]:
     """
     Lightweight polling-based file watcher implemented with stdlib only.
-    Yields lists of (change_kind, path) tuples.
+    Yields lists of (change_kind, path) tuples. Files present on the first
+    scan are not reported.
     """
-    snapshot: Dict[str, float] = {}
+    snapshot: Optional[Dict[str, float]] = None
 
     def should_watch(path: str) -> bool:
         if watch_filter is None:
@@ -178,13 +297,15 @@ async def _poll_changes(
                 except OSError:
                     continue
                 current[rel] = mtime
+                if snapshot is None:
+                    continue
                 old_mtime = snapshot.get(rel)
                 if old_mtime is None:
                     changes.append(("created", rel))
                 elif mtime > old_mtime:
                     changes.append(("modified", rel))
 
-        for path in snapshot:
+        for path in snapshot or ():
             if path not in current:
                 if should_watch(path):
                     changes.append(("deleted", path))
@@ -194,4 +315,4 @@ async def _poll_changes(
         if changes:
             yield changes
 
-        await asyncio.sleep(0.4)
+        await asyncio.sleep(interval)
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+FRAME_INTERVAL = 1 / 60
+
+# Messages that fully describe the state of their target (element id, plus
+# attribute or class name): a newer one makes an older, still unsent one to
+# the same target useless.
+COALESCED_TYPES = frozenset(
+    {
+        "update_text",
+        "update_input",
+        "update_html",
+        "replace",
+        "set_theme",
+        "set_attr",
+        "toggle_class",
+        "set_value",
+    }
+)
+
+# Messages changing the DOM below their target element. Everything else
+# (theme, window commands, reload requests) survives an overflow snapshot.
+DOM_TYPES = frozenset(
+    {
+        "update_text",
+        "update_input",
+        "update_html",
+        "replace",
+        "set_attr",
+        "toggle_class",
+        "set_value",
+        "patch",
+        "list_ops",
+        "table_rows",
+        "append_rows",
+        "update_cells",
+    }
+)
+
+# What to do when a connection has more than ``max_pending`` messages queued:
+#   coalesce:   drop the backlog and send a snapshot of the current screen,
+#   drop:       drop queued messages to elements that a later ``replace``
+#               rebuilds; if that is not enough, behave like coalesce,
+#   disconnect: drop the backlog and close the connection.
+OVERFLOW_POLICIES = ("coalesce", "drop", "disconnect")
+
+FrameSender = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class FrameScheduler:
+    """
+    Outgoing message queue of one client connection.
+
+    Messages pushed during a tick are collected and sent together as one
+    frame. Within a frame, a newer ``update_text`` / ``update_html`` /
+    ``replace`` / ... message for the same target replaces the older one in
+    its queue slot, so a burst of updates to one widget costs a single
+    message; it is never moved past another message to the same element.
+
+    After an idle period the first message goes out on the next loop
+    iteration; afterwards at most one frame is sent per ``interval``.
+
+    ``push`` never waits: a slow connection only delays its own writer task.
+    The queue is bounded by ``max_pending``; on overflow the ``overflow``
+    policy applies (see ``OVERFLOW_POLICIES``). Only messages that a newer
+    one makes useless are ever dropped on their own; otherwise the whole
+    backlog is dropped and ``on_overflow`` is called to queue a snapshot or
+    close the connection, so the client never misses a change silently.
+    """
+
+    def __init__(
+        self,
+        send: FrameSender,
+        interval: float = FRAME_INTERVAL,
+        max_pending: Optional[int] = None,
+        overflow: str = "coalesce",
+        on_overflow: Optional[Callable[[], None]] = None,
+        contains: Optional[Callable[[str, str], bool]] = None,
+    ) -> None:
+        """
+        Parameters:
+            send (Callable): Coroutine function sending a list of messages.
+            interval (float): Minimum time between frames, in seconds.
+            max_pending (int | None): Queue bound, ``None`` for unbounded.
+            overflow (str): Overflow policy, one of ``OVERFLOW_POLICIES``.
+            on_overflow (Callable | None): Called after the backlog of an
+                overflow was dropped.
+            contains (Callable | None): ``contains(root, id)`` tells whether
+                element ``id`` lies inside ``root``, for the ``drop`` policy.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        self.send = send
+        self.interval = interval
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.on_overflow = on_overflow
+        self.contains = contains
+        self.overflows = 0
+        self._pending: Dict[Hashable, Dict[str, Any]] = {}
+        self._generations: Dict[Any, int] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._last_frame = 0.0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def push(self, msg: Dict[str, Any]) -> None:
+        """
+        Queue a message for the next frame.
+
+        A ``batch`` message is queued as its inner messages, so they are
+        coalesced and encoded like messages pushed one by one.
+
+        Parameters:
+            msg (dict): JSON-serializable message.
+        """
+        if msg.get("type") == "batch":
+            for inner in msg["messages"]:
+                self.push(inner)
+            return
+
+        key: Hashable
+        target = msg.get("id")
+        if msg.get("type") in COALESCED_TYPES:
+            # The newer message takes the older one's place in the queue. A
+            # non-coalesced message to the same element in between (e.g. a
+            # patch) starts a new generation, so nothing moves past it.
+            gen = self._generations.get(target, 0)
+            key = (msg["type"], target, msg.get("name"), gen)
+        else:
+            key = next(self._seq)
+            if target is not None:
+                self._generations[target] = self._generations.get(target, 0) + 1
+        self._pending[key] = msg
+
+        if self.max_pending is not None and len(self._pending) > self.max_pending:
+            self._overflow()
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._wakeup.set()
+
+    def _overflow(self) -> None:
+        self.overflows += 1
+        pending = self._pending
+        if self.overflow == "drop":
+            self._drop_stale()
+            if len(pending) <= (self.max_pending or 0):
+                return
+        # The snapshot covers the DOM only: keep theme / window messages.
+        kept = {
+            key: msg for key, msg in pending.items() if msg.get("type") not in DOM_TYPES
+        }
+        pending.clear()
+        if self.overflow != "disconnect":
+            pending.update(kept)
+        if self.on_overflow is not None:
+            self.on_overflow()
+
+    def _drop_stale(self) -> None:
+        """
+        Drop messages made useless by a later ``replace``: those to elements
+        inside the replaced root, and content updates of the root itself.
+        Attribute changes of the root survive, as ``replace`` keeps them.
+        """
+        replaced: List[str] = []
+        for key in reversed(list(self._pending)):
+            msg = self._pending[key]
+            kind = msg.get("type")
+            target: str = msg.get("id", "")
+            if kind not in DOM_TYPES:
+                continue
+            if target in replaced:
+                if kind in ("replace", "update_text"):
+                    del self._pending[key]
+            elif self.contains is not None and any(
+                self.contains(root, target) for root in replaced
+            ):
+                del self._pending[key]
+            elif kind == "replace":
+                replaced.append(target)
+
+    async def flush(self) -> None:
+        """Send everything queued right away."""
+        if self._pending:
+            await self._send_frame()
+
+    async def stop(self, flush: bool = True) -> None:
+        """
+        Stop the writer task.
+
+        Parameters:
+            flush (bool): Send what is still queued first.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if not flush:
+            self._pending.clear()
+            return
+        try:
+            await self.flush()
+        except Exception:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            delay = self._last_frame + self.interval - time.monotonic()
+            await asyncio.sleep(max(0.0, delay))
+            self._wakeup.clear()
+            if self._pending:
+                try:
+                    await self._send_frame()
+                except Exception:
+                    pass
+
+    async def _send_frame(self) -> None:
+        messages = list(self._pending.values())
+        self._pending.clear()
+        self._generations.clear()
+        self._last_frame = time.monotonic()
+        await self.send(messages)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import traceback
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+EVENT_ORDERINGS = ("widget", "connection")
+
+MAX_IN_FLIGHT = 16
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class EventSequencer:
+    """
+    Runs the event handlers of one connection as tasks.
+
+    Events with the same key (the widget id with ``ordering="widget"``,
+    a single key with ``ordering="connection"``) run one after another in
+    arrival order; events with different keys run concurrently. A job
+    submitted with ``supersede=True`` cancels the queued or running jobs
+    that were submitted the same way for the same widget and are still at
+    the end of its queue, e.g. the handlers of older values of an input.
+
+    At most ``max_in_flight`` jobs exist at a time: ``submit`` waits for one
+    to finish, which stops reading from the socket until the client's
+    handlers catch up.
+    """
+
+    def __init__(self, ordering: str = "widget", max_in_flight: int = MAX_IN_FLIGHT):
+        """
+        Parameters:
+            ordering (str): ``"widget"`` or ``"connection"``.
+            max_in_flight (int): Maximum number of unfinished jobs.
+        """
+        if ordering not in EVENT_ORDERINGS:
+            raise ValueError(f"unknown event ordering {ordering!r}")
+        self.ordering = ordering
+        self.max_in_flight = max(1, max_in_flight)
+        self.superseded = 0
+        self._chains: Dict[Hashable, List[Tuple[asyncio.Task[None], Hashable]]] = {}
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self._started: Set[asyncio.Task[Any]] = set()
+
+    async def submit(self, key: Hashable, job: Job, supersede: bool = False) -> None:
+        """
+        Schedule ``job`` after the earlier jobs of ``key``.
+
+        Parameters:
+            key (Hashable): Ordering key, usually the widget id.
+            job (Callable): Coroutine function running the handler.
+            supersede (bool): Cancel the unfinished earlier jobs of ``key``
+                that were submitted with ``supersede=True`` too.
+        """
+        tag = key if supersede else None
+        if self.ordering == "connection":
+            key = None
+        if tag is not None:
+            for task, other in reversed(self._chains.get(key, ())):
+                if other != tag:
+                    break
+                if not task.done():
+                    # Stays in the chain: the next job waits for it to unwind.
+                    task.cancel()
+                    self.superseded += 1
+
+        while len(self._tasks) >= self.max_in_flight:
+            await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+
+        chain = self._chains.setdefault(key, [])
+        prev = chain[-1][0] if chain else None
+        task = asyncio.get_running_loop().create_task(self._run(prev, job))
+        chain.append((task, tag))
+        self._tasks.add(task)
+        task.add_done_callback(lambda t: self._finished(key, t))
+
+    async def join(self) -> None:
+        """Wait until every submitted job finished."""
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
+
+    def cancel(self, running: bool = False) -> None:
+        """
+        Cancel the jobs that have not started yet.
+
+        Parameters:
+            running (bool): Cancel the jobs already running too.
+        """
+        for task in list(self._tasks):
+            if running or task not in self._started:
+                task.cancel()
+
+    def _finished(self, key: Hashable, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        self._started.discard(task)
+        chain = self._chains.get(key)
+        if chain is None:
+            return
+        chain[:] = [entry for entry in chain if entry[0] is not task]
+        if not chain:
+            del self._chains[key]
+
+    async def _run(self, prev: Optional[asyncio.Task[None]], job: Job) -> None:
+        try:
+            if prev is not None and not prev.done():
+                await asyncio.wait([prev])
+            task = asyncio.current_task()
+            if task is not None:
+                self._started.add(task)
+            await job()
+        except asyncio.CancelledError:
+            # Never let a later job of this key overtake the predecessor.
+            if prev is not None and not prev.done():
+                await asyncio.wait([prev])
+            raise
+        except Exception:
+            traceback.print_exc()
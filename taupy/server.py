@@ -1,13 +1,39 @@
 from __future__ import annotations
 import json
 import asyncio
-from typing import Set, Dict, Any, TYPE_CHECKING
+from functools import partial
+from typing import Set, Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from websockets.server import WebSocketServerProtocol
     from taupy.app import App
 
+from .codec import EncodedCache, get_codec
+from .compression import (
+    COMPRESSION_LEVEL,
+    COMPRESSION_THRESHOLD,
+    CompressionStats,
+    ThresholdDeflateFactory,
+)
 from .devui import DevUI
+from websockets.typing import Subprotocol
+
+from .protocol import BINARY_PROTOCOL, Encoder
+from .scheduler import FRAME_INTERVAL, FrameScheduler
+from .sequencer import MAX_IN_FLIGHT, EventSequencer
+
+
+STREAM_THRESHOLD = 256 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+MAX_QUEUE = 1000
+
+EVENT_TYPES = frozenset(
+    {"click", "input", "viewport", "resync", "window_cmd", "window_event"}
+)
+# Events ordered per widget id; the others are ordered per event type.
+WIDGET_EVENTS = frozenset({"click", "input", "viewport", "resync"})
+# A newer event of these types makes the older one for the same widget moot.
+SUPERSEDED_EVENTS = frozenset({"input", "viewport"})
 
 
 class TauServer:
@@ -21,6 +47,32 @@ class TauServer:
         • State updates broadcast
         • Initial route navigation
 
+    Clients offering the ``BINARY_PROTOCOL`` WebSocket subprotocol receive
+    compact binary frames (see ``taupy.protocol``), others JSON text. Set
+    ``protocols`` to an empty tuple before ``App.run()`` to always use JSON.
+
+    With ``compression`` enabled, permessage-deflate is negotiated and
+    messages of at least ``compression_threshold`` bytes are compressed;
+    ``compression_stats`` counts the bytes before and after.
+
+    JSON goes through ``codec`` (orjson / msgspec when installed, see
+    ``taupy.codec``). Each broadcast message is encoded once, however many
+    clients it is sent to.
+
+    Every connection has its own bounded queue and writer task, so a slow
+    client never holds up the others. When more than ``max_queue`` messages
+    are waiting for one client, ``overflow`` decides: ``"coalesce"`` replaces
+    the backlog with a snapshot of the current screen, ``"drop"`` discards the
+    oldest messages and ``"disconnect"`` closes the connection.
+
+    Incoming events run as tasks (see ``EventSequencer``): in order per
+    widget, concurrently across widgets (``event_ordering="connection"``
+    processes them strictly one by one), with at most ``max_in_flight``
+    unfinished handlers per connection. A newer ``input`` / ``viewport``
+    event cancels the still unfinished handler of the previous one. When
+    the connection closes, its queued events are dropped and the handlers
+    already running finish.
+
     This class is not intended to be created manually - it is created
     automatically by `App`.
     """
@@ -34,6 +86,22 @@ class TauServer:
         """
         self.app = app
         self.clients: Set[WebSocketServerProtocol] = set()
+        self.stream_threshold = STREAM_THRESHOLD
+        self.stream_chunk_size = STREAM_CHUNK_SIZE
+        self.frame_interval = FRAME_INTERVAL
+        self.max_queue: Optional[int] = MAX_QUEUE
+        self.overflow = "coalesce"
+        self.event_ordering = "widget"
+        self.max_in_flight = MAX_IN_FLIGHT
+        self.protocols: Tuple[str, ...] = (BINARY_PROTOCOL,)
+        self.compression = True
+        self.compression_threshold = COMPRESSION_THRESHOLD
+        self.compression_level = COMPRESSION_LEVEL
+        self.compression_stats = CompressionStats()
+        self.codec = get_codec()
+        self._encoded = EncodedCache(self.codec)
+        self._schedulers: Dict[WebSocketServerProtocol, FrameScheduler] = {}
+        self._encoders: Dict[WebSocketServerProtocol, Encoder] = {}
 
     async def handler(self, websocket: "WebSocketServerProtocol") -> None:
         """
@@ -49,6 +117,11 @@ class TauServer:
             websocket (WebSocketServerProtocol): Connected client instance.
         """
         self.clients.add(websocket)
+        if getattr(websocket, "subprotocol", None) == BINARY_PROTOCOL:
+            self._encoders[websocket] = Encoder(self._encoded.encode)
+
+        # A fresh page does not share the DOM the cached trees describe.
+        self.app._vdom.clear()
 
         await self.app._run_connect_handlers()
 
@@ -56,51 +129,201 @@ class TauServer:
 
         DevUI.banner(self.app.title, self.app.http_port, dev=self.app.dev)
 
+        sequencer = EventSequencer(self.event_ordering, self.max_in_flight)
         try:
             async for message in websocket:
-                data: Dict[str, Any] = json.loads(message)
+                data: Dict[str, Any] = self.codec.loads(message)
                 event_type = data.get("type")
-
-                if event_type == "click":
-                    await self.app.dispatcher.dispatch_click(data["id"])
-                elif event_type == "input":
-                    await self.app.dispatcher.dispatch_input(
-                        data["id"], data.get("value", "")
-                    )
-                elif event_type == "window_cmd":
-                    cmd = data.get("command") or data.get("payload") or {}
-                    await self.app.send_window_command(cmd)
-                elif event_type == "window_event":
-                    await self.app._handle_window_event(
-                        data.get("name"), data.get("payload", {})
-                    )
+                if event_type not in EVENT_TYPES:
+                    continue
+                key = data.get("id") if event_type in WIDGET_EVENTS else event_type
+                await sequencer.submit(
+                    key,
+                    partial(self._handle_event, websocket, data),
+                    supersede=event_type in SUPERSEDED_EVENTS,
+                )
 
         except Exception:
             raise
 
         finally:
+            # Queued events of a closed connection are dropped; handlers
+            # already running finish, as they may change shared State.
+            sequencer.cancel()
             self.clients.discard(websocket)
+            self._encoders.pop(websocket, None)
+            scheduler = self._schedulers.pop(websocket, None)
+            if scheduler is not None:
+                await scheduler.stop(flush=False)
+
+    async def _handle_event(
+        self, websocket: "WebSocketServerProtocol", data: Dict[str, Any]
+    ) -> None:
+        """Run the handler of one client event."""
+        event_type = data.get("type")
+
+        if event_type == "click":
+            await self.app.dispatcher.dispatch_click(data["id"])
+        elif event_type == "input":
+            await self.app.dispatcher.dispatch_input(data["id"], data.get("value", ""))
+        elif event_type == "viewport":
+            reply = await self.app.dispatcher.dispatch_viewport(
+                data["id"], int(data.get("first", 0)), int(data.get("count", 0))
+            )
+            if reply and websocket in self.clients:
+                # The client now shows rows the cached tree lacks.
+                self.app._vdom.invalidate(data["id"])
+                self._scheduler(websocket).push(reply)
+        elif event_type == "resync":
+            await self.app._resync(data.get("id", ""))
+        elif event_type == "window_cmd":
+            cmd = data.get("command") or data.get("payload") or {}
+            await self.app.send_window_command(cmd)
+        elif event_type == "window_event":
+            await self.app._handle_window_event(
+                data.get("name"), data.get("payload", {})
+            )
 
     async def broadcast(self, msg: Dict[str, Any]) -> None:
         """
-        Send a JSON message to all connected WebSocket clients.
+        Queue a JSON message for all connected WebSocket clients.
 
         Used internally to update UI:
             • State change updates
             • Theme switching
             • DOM replacing (navigation)
 
+        Each connection has a ``FrameScheduler``: messages are collected for
+        up to ``frame_interval`` seconds, superseded updates to the same
+        target are dropped, and the rest is sent as one ``batch`` frame.
+        Use ``flush()`` to send immediately.
+
         Parameters:
             msg (dict): JSON-serializable message.
         """
-        if not self.clients:
-            return
+        for ws in list(self.clients):
+            if ws.open:
+                self._scheduler(ws).push(msg)
 
-        text = json.dumps(msg)
+    async def flush(self) -> None:
+        """Send all queued frames now."""
+        await asyncio.gather(*(s.flush() for s in list(self._schedulers.values())))
 
+    async def stop(self) -> None:
+        """Send queued frames, stop the schedulers and close all connections."""
+        schedulers = list(self._schedulers.values())
+        self._schedulers.clear()
+        await asyncio.gather(*(s.stop() for s in schedulers))
         await asyncio.gather(
-            *(ws.send(text) for ws in self.clients if ws.open), return_exceptions=True
+            *(ws.close() for ws in list(self.clients)), return_exceptions=True
+        )
+
+    def serve_options(self) -> Dict[str, Any]:
+        """Keyword arguments for ``websockets.serve`` matching the settings."""
+        extensions = None
+        if self.compression:
+            factory = ThresholdDeflateFactory(
+                self.compression_threshold,
+                self.compression_level,
+                self.compression_stats,
+            )
+            extensions = [factory]
+        return {
+            "subprotocols": [Subprotocol(p) for p in self.protocols] or None,
+            "compression": None,
+            "extensions": extensions,
+        }
+
+    def _scheduler(self, ws: "WebSocketServerProtocol") -> FrameScheduler:
+        scheduler = self._schedulers.get(ws)
+        if scheduler is None:
+            scheduler = FrameScheduler(
+                partial(self._send_frame, ws),
+                self.frame_interval,
+                max_pending=self.max_queue,
+                overflow=self.overflow,
+                on_overflow=partial(self._on_overflow, ws),
+                contains=self._contains,
+            )
+            self._schedulers[ws] = scheduler
+        return scheduler
+
+    def _contains(self, root_id: str, element_id: str) -> bool:
+        """Whether an element lies inside ``root_id`` on the clients."""
+        root = self.app.root_component
+        if root is not None and root_id == root.id:
+            # Every element the App updates lives inside its root.
+            return element_id != root_id
+        return self.app._vdom.contains(root_id, element_id)
+
+    def _on_overflow(self, ws: "WebSocketServerProtocol") -> None:
+        """Handle a client that fell ``max_queue`` messages behind."""
+        if self.overflow == "disconnect":
+            self.clients.discard(ws)
+            scheduler = self._schedulers.pop(ws, None)
+            if scheduler is not None:
+                asyncio.ensure_future(scheduler.stop(flush=False))
+            asyncio.ensure_future(ws.close(code=1008, reason="send queue overflow"))
+            return
+
+        # The backlog was dropped: bring the client up to date in one message.
+        root = self.app.root_component
+        if root is None:
+            self._schedulers[ws].push({"type": "hot_reload", "message": "resync"})
+            return
+        html = "".join(
+            c.render() if hasattr(c, "render") else str(c) for c in root.children
         )
+        self._schedulers[ws].push({"type": "replace", "id": root.id, "html": html})
+
+    async def _send_frame(
+        self, ws: "WebSocketServerProtocol", messages: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Send one frame of messages to a client.
+
+        Messages carrying more than ``stream_threshold`` characters of HTML
+        are sent on their own as a fragmented JSON text message in
+        ``stream_chunk_size`` pieces, for binary clients too; the others are
+        combined into one binary (or JSON) message.
+        """
+        encoder = self._encoders.get(ws)
+        encode = encoder.encode if encoder is not None else self._encode
+
+        batch: List[Dict[str, Any]] = []
+        for msg in messages:
+            html = msg.get("html")
+            if isinstance(html, str) and len(html) > self.stream_threshold:
+                if batch:
+                    await ws.send(encode(batch))
+                    batch = []
+                await ws.send(self._fragments(msg))
+            else:
+                batch.append(msg)
+        if batch:
+            await ws.send(encode(batch))
+
+    def _encode(self, messages: List[Dict[str, Any]]) -> str:
+        return self._encoded.frame(messages)
+
+    def _fragments(self, msg: Dict[str, Any]) -> List[str]:
+        """
+        Encode a message with a large ``html`` field as WebSocket fragments.
+
+        The HTML is JSON-escaped slice by slice, so neither the full JSON
+        text nor one huge frame is ever built. The client still receives a
+        single message.
+        """
+        html: str = msg["html"]
+        head = json.dumps({k: v for k, v in msg.items() if k != "html"})
+        sep = ", " if len(msg) > 1 else ""
+
+        size = self.stream_chunk_size
+        fragments = [f'{head[:-1]}{sep}"html": "']
+        for start in range(0, len(html), size):
+            fragments.append(json.dumps(html[start : start + size])[1:-1])
+        fragments.append('"}')
+        return fragments
 
     async def init_navigation(self) -> None:
         """
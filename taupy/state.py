@@ -1,5 +1,280 @@
 from __future__ import annotations
-from typing import Any, Callable, List
+import asyncio
+import copy
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+
+_tracking: List[Set["State"]] = []
+
+_batch_depth = 0
+_pending_states: Dict["State", None] = {}
+_pending_effects: Dict["Effect", None] = {}
+_pending_computeds: Dict["Computed", None] = {}
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[int] = None
+_thread_state = threading.local()
+
+_keyed: "weakref.WeakValueDictionary[str, State]" = weakref.WeakValueDictionary()
+
+# Guards State values written from several threads and the States whose
+# notifications were shipped to the loop but have not run yet.
+_lock = threading.RLock()
+_thread_commits: Dict["State", None] = {}
+
+
+def bind_loop(loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Make ``loop`` the home of all State notifications.
+
+    Called by ``App.run()`` from the loop thread. Afterwards, State changes
+    made from other threads write the value at once and hand the
+    notification to the loop with ``call_soon_threadsafe``, so subscribers
+    always run on the loop thread.
+
+    Parameters:
+        loop (AbstractEventLoop | None): The App's loop, or None to unbind.
+    """
+    global _loop, _loop_thread
+    _loop = loop
+    _loop_thread = threading.get_ident() if loop is not None else None
+
+
+def _off_loop() -> bool:
+    return (
+        _loop is not None
+        and _loop_thread != threading.get_ident()
+        and not _loop.is_closed()
+    )
+
+
+def _schedule_commit(st: "State") -> None:
+    """
+    Hand the notification of a State changed off the loop to the loop.
+
+    Several changes of a State made before the loop gets to it notify once,
+    with the latest value. Inside a worker ``batch()`` the States are
+    collected and shipped together when the block exits.
+    """
+    pending = getattr(_thread_state, "states", None)
+    if pending is not None:
+        pending[st] = None
+        return
+    with _lock:
+        if st in _thread_commits:
+            return
+        _thread_commits[st] = None
+    _ship([st])
+
+
+def _ship(states: List["State"]) -> None:
+    """Commit States changed off the loop inside one batch on the loop."""
+    if not states or _loop is None:
+        return
+    with _lock:
+        _thread_commits.update(dict.fromkeys(states))
+    try:
+        _loop.call_soon_threadsafe(_commit_shipped, states)
+    except RuntimeError:
+        # The loop closed meanwhile; values are written, nobody listens.
+        pass
+
+
+def _commit_shipped(states: List["State"]) -> None:
+    with batch():
+        for st in states:
+            with _lock:
+                if st not in _thread_commits:
+                    continue
+                del _thread_commits[st]
+            st._commit()
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """
+    Defer State notifications until the outermost ``batch()`` block exits.
+
+    Values are updated immediately, but each changed State notifies its
+    subscribers once, with its final value, when the block exits. Effects
+    and Computed values depending on several changed States re-run once.
+    Blocks nest.
+
+    Used off the App's loop thread, the values are written right away and
+    the notifications of the block are sent to the loop together.
+
+    Example:
+        with batch():
+            first.set("Ada")
+            last.set("Lovelace")
+    """
+    global _batch_depth
+    if _off_loop():
+        yield from _thread_batch()
+        return
+
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth:
+            _flush()
+
+
+def _thread_batch() -> Iterator[None]:
+    if getattr(_thread_state, "states", None) is not None:
+        yield
+        return
+    _thread_state.states = {}
+    try:
+        yield
+    finally:
+        _ship(list(_thread_state.__dict__.pop("states")))
+
+
+def _flush() -> None:
+    """
+    Deliver pending notifications, including those they cause.
+
+    Changed States notify first. Observed Computed values then refresh from
+    the lowest level up, so every source is current before a dependent
+    recomputes; Effects run last, once each.
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        while _pending_states or _pending_computeds or _pending_effects:
+            states = list(_pending_states)
+            _pending_states.clear()
+            for st in states:
+                st._notify_subscribers()
+
+            computeds = sorted(_pending_computeds, key=lambda c: c.level)
+            _pending_computeds.clear()
+            for computed in computeds:
+                computed._refresh()
+
+            effects = list(_pending_effects)
+            _pending_effects.clear()
+            for effect in effects:
+                effect._rerun()
+    finally:
+        _batch_depth -= 1
+
+
+def track(fn: Callable[[], Any]) -> Tuple[Any, Set["State"]]:
+    """
+    Call ``fn`` and collect every State read while it runs.
+
+    Reads are recorded by ``State.__call__``, so States reached through
+    attributes, containers or helper functions are found too. Nested
+    ``track`` calls collect into their own set only.
+
+    Parameters:
+        fn (Callable[[], Any]): Function to evaluate.
+
+    Returns:
+        tuple: ``(result, states)``.
+    """
+    deps: Set[State] = set()
+    _tracking.append(deps)
+    try:
+        result = fn()
+    finally:
+        _tracking.pop()
+    return result, deps
+
+
+class Effect:
+    """
+    Re-run a function whenever a State it read changes.
+
+    The function is evaluated with ``track``; the Effect subscribes to
+    exactly the States read by the last run, so dependencies that appear or
+    disappear between runs are followed.
+
+    Example:
+        label = Effect(lambda: f"Count: {count()}", on_change=print)
+    """
+
+    __slots__ = ("fn", "on_change", "deps", "value")
+
+    def __init__(self, fn: Callable[[], Any], on_change: Callable[[Any], None]) -> None:
+        """
+        Parameters:
+            fn (Callable[[], Any]): Tracked function.
+            on_change (Callable[[Any], None]): Receives each re-evaluated result.
+        """
+        self.fn = fn
+        self.on_change = on_change
+        self.deps: Set[State] = set()
+        self.value = self._run()
+
+    def _run(self) -> Any:
+        value, deps = track(self.fn)
+        for st in self.deps - deps:
+            st.unsubscribe(self._on_dependency_change)
+        for st in deps - self.deps:
+            st.subscribe(self._on_dependency_change)
+        self.deps = deps
+        return value
+
+    def _on_dependency_change(self, _value: Any) -> None:
+        if _batch_depth:
+            _pending_effects[self] = None
+        else:
+            self._rerun()
+
+    def _rerun(self) -> None:
+        self.value = self._run()
+        self.on_change(self.value)
+
+    def dispose(self) -> None:
+        """Unsubscribe from every dependency."""
+        for st in self.deps:
+            st.unsubscribe(self._on_dependency_change)
+        self.deps = set()
+
+
+Comparator = Callable[[Any, Any], bool]
+
+
+def _not_equal(old: Any, new: Any) -> bool:
+    """
+    ``old != new`` that never raises.
+
+    Element-wise results (NumPy arrays, pandas frames) and failing
+    comparisons fall back to identity.
+    """
+    if old is new:
+        return False
+    try:
+        result = old != new
+        if isinstance(result, bool):
+            return result
+        return bool(result)
+    except (TypeError, ValueError):
+        return True
+
+
+def _comparator(compare: Any) -> Comparator:
+    """Build the "has the value changed" test for a ``compare`` option."""
+    if compare == "equality":
+        return _not_equal
+    if compare == "identity":
+        return lambda old, new: old is not new
+    if compare == "always":
+        return lambda old, new: True
+    if callable(compare):
+        return lambda old, new: _not_equal(compare(old), compare(new))
+    raise ValueError(
+        "compare must be 'equality', 'identity', 'always' or a key function, "
+        f"got {compare!r}"
+    )
 
 
 class State:
@@ -13,37 +288,87 @@ class State:
     The state behaves like a callable:
         count = State(0)
         print(count())  # -> 0
+
+    ``version`` increases by one with every accepted change. ``compare``
+    decides what counts as a change:
+
+    - ``"equality"`` (default): ``old != new``. Values whose comparison is
+      ambiguous or fails (NumPy arrays, DataFrames) fall back to identity.
+    - ``"identity"``: ``old is not new``; no deep comparison of large objects.
+    - ``"always"``: every ``set`` notifies.
+    - a key function: ``key(old) != key(new)``.
+
+    ``key`` names the State for hot reload: its value survives a reload of
+    the code that creates it. Module-level States of the app module are
+    preserved by their variable name without a key.
     """
 
-    def __init__(self, initial_value: Any) -> None:
+    def __init__(
+        self, initial_value: Any, compare: Any = "equality", key: Optional[str] = None
+    ) -> None:
         """
         Initialize a new reactive state.
 
         Parameters:
             initial_value (Any): The initial stored value.
+            compare (str | Callable): Change detection, see above.
+            key (str | None): Stable name used to preserve the value across
+                hot reloads.
         """
+        self.key = key
+        if key is not None:
+            _keyed[key] = self
         self._value: Any = initial_value
         self._subscribers: List[Callable[[Any], None]] = []
+        self._dependents: Set[Computed] = set()
+        self._changed = _comparator(compare)
+        self.level = 0
+        self.version = 0
 
     def __call__(self) -> Any:
         """
         Return the current state value.
 
+        Inside ``track`` (and therefore inside reactive bindings) the read
+        is recorded as a dependency.
+
         Returns:
             Any: The stored value.
         """
+        if _tracking:
+            _tracking[-1].add(self)
         return self._value
 
     def set(self, new_value: Any) -> None:
         """
         Update the stored value and notify subscribers if the value changes.
 
+        Inside ``State.batch()`` the notification is deferred until the
+        block exits; several sets of the same State notify once. Called
+        from another thread, the value is written immediately and only the
+        notification runs on the App's loop.
+
         Parameters:
             new_value (Any): The new value to store.
         """
-        if self._value != new_value:
+        with _lock:
+            if not self._changed(self._value, new_value):
+                return
             self._value = new_value
-            self._notify_subscribers()
+        self._commit()
+
+    def _commit(self) -> None:
+        """Bump the version and schedule notifications for a new value."""
+        if _off_loop():
+            _schedule_commit(self)
+            return
+        self.version += 1
+        self._mark_dependents()
+        _pending_states[self] = None
+        if not _batch_depth:
+            _flush()
+
+    batch = staticmethod(batch)
 
     def subscribe(self, callback: Callable[[Any], None]) -> None:
         """
@@ -67,6 +392,16 @@ class State:
         except ValueError:
             pass
 
+    def _mark_dependents(self) -> None:
+        """Mark every Computed downstream of this State as stale."""
+        for computed in list(self._dependents):
+            if not computed._dirty:
+                computed._dirty = True
+                computed._stale_value = computed._value
+                if computed._subscribers:
+                    _pending_computeds[computed] = None
+                computed._mark_dependents()
+
     def _notify_subscribers(self) -> None:
         """
         Notify all subscribers about the updated value.
@@ -74,3 +409,408 @@ class State:
         """
         for callback in list(self._subscribers):
             callback(self._value)
+
+
+Change = Dict[str, Any]
+
+
+class _CollectionState(State):
+    """
+    Base of the collection States: in-place mutations record change records
+    instead of replacing and comparing the whole value.
+    """
+
+    def __init__(self, initial_value: Any, key: Optional[str] = None) -> None:
+        super().__init__(initial_value, compare="identity", key=key)
+        self._changes: List[Change] = []
+        self._observers: List[Callable[[List[Change]], None]] = []
+
+    def set(self, new_value: Any) -> None:
+        """
+        Replace the whole collection.
+
+        Only identity is checked, so a new collection always notifies, with a
+        single ``reset`` change record.
+
+        Parameters:
+            new_value: The new collection.
+        """
+        with _lock:
+            if not self._changed(self._value, new_value):
+                return
+            self._value = new_value
+            self._record({"op": "reset"})
+        self._commit()
+
+    def observe(self, callback: Callable[[List[Change]], None]) -> None:
+        """
+        Subscribe to change records.
+
+        The callback receives the list of records accumulated since the last
+        notification (one per mutation, or several after ``State.batch()``).
+        If the collection was replaced or cleared meanwhile, the list is a
+        single ``reset`` record whose ``value`` is a copy of the collection.
+        Plain ``subscribe()`` callbacks still receive the whole value.
+
+        Parameters:
+            callback (Callable[[list[dict]], None]): Receives change records.
+        """
+        self._observers.append(callback)
+
+    def unobserve(self, callback: Callable[[List[Change]], None]) -> None:
+        """Remove a callback added with ``observe()``."""
+        try:
+            self._observers.remove(callback)
+        except ValueError:
+            pass
+
+    def _record(self, change: Change) -> None:
+        # Callers hold _lock, so the value and its records change together,
+        # and call _commit() once they released it: subscribers never run
+        # under the lock.
+        self._changes.append(change)
+
+    def _notify_subscribers(self) -> None:
+        # Take the records under the lock, then notify without it. Worker
+        # threads may mutate the value meanwhile; their records come with
+        # the next notification. A reset carries a copy of the value, so
+        # those later records are not already part of what it reports.
+        with _lock:
+            changes, self._changes = self._changes, []
+            if any(change["op"] == "reset" for change in changes):
+                changes = [{"op": "reset", "value": copy.copy(self._value)}]
+        if changes:
+            for callback in list(self._observers):
+                callback(changes)
+        super()._notify_subscribers()
+
+    def __len__(self) -> int:
+        return len(self())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self()[key]
+
+
+class ListState(_CollectionState):
+    """
+    Reactive list with in-place mutations.
+
+    Each mutation notifies observers with a change record:
+
+    - ``{"op": "insert", "index": i, "items": [...]}``
+    - ``{"op": "remove", "index": i, "count": n}``
+    - ``{"op": "replace", "index": i, "value": v}``
+    - ``{"op": "reset"}`` after ``set()`` or ``clear()``
+
+    Example:
+        todos = ListState(["write docs"])
+        todos.append("ship it")
+        For(todos, lambda t: Text(t))
+    """
+
+    def __init__(self, initial_value: Any = (), key: Optional[str] = None) -> None:
+        """
+        Parameters:
+            initial_value (Iterable): Initial items (copied once).
+            key (str | None): Hot reload key, see ``State``.
+        """
+        super().__init__(list(initial_value), key=key)
+
+    def set(self, new_value: Any) -> None:
+        super().set(new_value if isinstance(new_value, list) else list(new_value))
+
+    def append(self, item: Any) -> None:
+        with _lock:
+            self._value.append(item)
+            index = len(self._value) - 1
+            self._record({"op": "insert", "index": index, "items": [item]})
+        self._commit()
+
+    def extend(self, items: Any) -> None:
+        items = list(items)
+        if not items:
+            return
+        with _lock:
+            index = len(self._value)
+            self._value.extend(items)
+            self._record({"op": "insert", "index": index, "items": items})
+        self._commit()
+
+    def insert(self, index: int, item: Any) -> None:
+        with _lock:
+            size = len(self._value)
+            index = min(max(index + size, 0) if index < 0 else index, size)
+            self._value.insert(index, item)
+            self._record({"op": "insert", "index": index, "items": [item]})
+        self._commit()
+
+    def pop(self, index: int = -1) -> Any:
+        with _lock:
+            item = self._pop(self._normalize(index, len(self._value)))
+        self._commit()
+        return item
+
+    def remove(self, item: Any) -> None:
+        with _lock:
+            self._pop(self._value.index(item))
+        self._commit()
+
+    def clear(self) -> None:
+        with _lock:
+            if not self._value:
+                return
+            self._value.clear()
+            self._record({"op": "reset"})
+        self._commit()
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        if isinstance(index, slice):
+            raise TypeError("ListState does not support slice assignment.")
+        with _lock:
+            index = self._normalize(index, len(self._value))
+            self._value[index] = value
+            self._record({"op": "replace", "index": index, "value": value})
+        self._commit()
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    def _pop(self, index: int) -> Any:
+        item = self._value.pop(index)
+        self._record({"op": "remove", "index": index, "count": 1})
+        return item
+
+    @staticmethod
+    def _normalize(index: int, size: int) -> int:
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ListState index out of range")
+        return index
+
+
+class DictState(_CollectionState):
+    """
+    Reactive dict with in-place mutations.
+
+    Each mutation notifies observers with a change record:
+
+    - ``{"op": "set", "key": k, "value": v}``
+    - ``{"op": "delete", "key": k}``
+    - ``{"op": "reset"}`` after ``set()`` or ``clear()``
+    """
+
+    def __init__(
+        self, initial_value: Any = None, *, key: Optional[str] = None, **kwargs: Any
+    ) -> None:
+        """
+        Parameters:
+            initial_value (Mapping | None): Initial items (copied once).
+            key (str | None): Hot reload key, see ``State``.
+            **kwargs: Additional items.
+        """
+        super().__init__(dict(initial_value or {}, **kwargs), key=key)
+
+    def set(self, new_value: Any) -> None:
+        super().set(new_value if isinstance(new_value, dict) else dict(new_value))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self().get(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        items = dict(*args, **kwargs)
+        if not items:
+            return
+        with batch():
+            for key, value in items.items():
+                self[key] = value
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        with _lock:
+            if key not in self._value:
+                if default:
+                    return default[0]
+                raise KeyError(key)
+            value = self._value.pop(key)
+            self._record({"op": "delete", "key": key})
+        self._commit()
+        return value
+
+    def clear(self) -> None:
+        with _lock:
+            if not self._value:
+                return
+            self._value.clear()
+            self._record({"op": "reset"})
+        self._commit()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with _lock:
+            self._value[key] = value
+            self._record({"op": "set", "key": key, "value": value})
+        self._commit()
+
+    def __delitem__(self, key: Any) -> None:
+        self.pop(key)
+
+
+class Computed(State):
+    """
+    Read-only State derived from other States.
+
+    ``fn`` is evaluated with dependency tracking and its result is cached.
+    When a source changes, the Computed is only marked stale: it recomputes
+    on the next read, or right away if something is subscribed to it. Stale
+    values are refreshed in dependency order, so with diamond-shaped
+    dependencies each Computed runs once and never sees a half-updated
+    source. Subscribers are notified only when the result changes.
+
+    Example:
+        items = State([3, 4])
+        total = Computed(lambda: sum(items()))
+        Text(lambda: f"Total: {total()}")
+    """
+
+    def __init__(self, fn: Callable[[], Any], compare: Any = "equality") -> None:
+        """
+        Parameters:
+            fn (Callable[[], Any]): Function computing the value from States.
+            compare (str | Callable): Change detection, as for ``State``.
+        """
+        super().__init__(None, compare=compare)
+        self.fn = fn
+        self._sources: Dict[State, int] = {}
+        self._dirty = True
+        self._computing = False
+        self._stale_value: Any = None
+
+    def __call__(self) -> Any:
+        """
+        Return the cached value, recomputing it first if a source changed.
+
+        Returns:
+            Any: The derived value.
+        """
+        if _tracking:
+            _tracking[-1].add(self)
+        if self._dirty:
+            self._update()
+        return self._value
+
+    def set(self, new_value: Any) -> None:
+        raise TypeError("Computed values are read-only.")
+
+    def subscribe(self, callback: Callable[[Any], None]) -> None:
+        """
+        Subscribe a callback to changes of the derived value.
+
+        The value is computed first, so the Computed is linked to its
+        sources even if it was never read.
+        """
+        if self._dirty:
+            self._update()
+        super().subscribe(callback)
+
+    def _update(self) -> None:
+        """
+        Bring a stale value up to date.
+
+        ``fn`` only runs if the version of a source moved since the last
+        run; a stale Computed source whose result did not change keeps its
+        version, which cuts the propagation short.
+        """
+        if self._sources and not self._sources_changed():
+            self._dirty = False
+        else:
+            self._recompute()
+
+    def _sources_changed(self) -> bool:
+        for src, version in self._sources.items():
+            if isinstance(src, Computed) and src._dirty:
+                src._update()
+            if src.version != version:
+                return True
+        return False
+
+    def _recompute(self) -> None:
+        if self._computing:
+            raise RuntimeError("Computed depends on itself.")
+        self._computing = True
+        try:
+            value, sources = track(self.fn)
+        finally:
+            self._computing = False
+
+        for src in self._sources.keys() - sources:
+            src._dependents.discard(self)
+        for src in sources - self._sources.keys():
+            src._dependents.add(self)
+        self._sources = {src: src.version for src in sources}
+        self.level = 1 + max((src.level for src in sources), default=0)
+
+        if self._changed(self._value, value):
+            self.version += 1
+        self._value = value
+        self._dirty = False
+
+    def _refresh(self) -> None:
+        """Recompute a stale, observed value and notify if it changed."""
+        if self._dirty:
+            self._update()
+        if self._changed(self._stale_value, self._value):
+            self._notify_subscribers()
+
+
+def snapshot_states(namespace: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Capture the values of States that can be restored after a reload.
+
+    Parameters:
+        namespace (dict | None): Module globals whose States are captured by
+            variable name, in addition to all keyed States.
+
+    Returns:
+        dict: Opaque snapshot for ``restore_states``.
+    """
+    values: Dict[str, Any] = {}
+    for name, value in (namespace or {}).items():
+        if isinstance(value, State) and not isinstance(value, Computed):
+            values[f"global:{name}"] = value._value
+    for key, st in list(_keyed.items()):
+        if not isinstance(st, Computed):
+            values[f"key:{key}"] = st._value
+    return values
+
+
+def restore_states(
+    snapshot: Dict[str, Any], namespace: Optional[Dict[str, Any]] = None
+) -> int:
+    """
+    Put snapshotted values into the States created by reloaded code.
+
+    Values are assigned without notifying subscribers: the caller is
+    expected to re-render afterwards.
+
+    Returns:
+        int: Number of restored States.
+    """
+    restored = 0
+    targets: List[Tuple[str, State]] = [
+        (f"global:{name}", value)
+        for name, value in (namespace or {}).items()
+        if isinstance(value, State) and value.key is None
+    ]
+    targets += [(f"key:{key}", st) for key, st in list(_keyed.items())]
+    for name, st in targets:
+        if name in snapshot and not isinstance(st, Computed):
+            st._value = snapshot[name]
+            st.version += 1
+            st._mark_dependents()
+            restored += 1
+    return restored
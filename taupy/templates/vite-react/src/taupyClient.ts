@@ -1,5 +1,94 @@
 export type TaupyMessage = { type: string; [key: string]: any };
 
+export type PatchOp =
+  | { op: "text"; path: number[]; value: string }
+  | { op: "attr"; path: number[]; name: string; value: string }
+  | { op: "rmattr"; path: number[]; name: string }
+  | { op: "insert"; path: number[]; index: number; html: string }
+  | { op: "replace"; path: number[]; html: string }
+  | { op: "remove"; path: number[] }
+  | { op: "move"; path: number[]; from: number; to: number };
+
+function resolvePath(root: Node, path: number[]): Node | null {
+  let node: Node | undefined = root;
+  for (const index of path) {
+    node = node.childNodes[index];
+    if (!node) return null;
+  }
+  return node;
+}
+
+function fragmentFrom(html: string): DocumentFragment {
+  const tpl = document.createElement("template");
+  tpl.innerHTML = html;
+  return tpl.content;
+}
+
+/**
+ * Apply the patch operations produced by the backend diff engine in place.
+ * Returns false when the DOM does not match the expected shape.
+ */
+export function applyPatch(root: Element, ops: PatchOp[]): boolean {
+  for (const op of ops) {
+    const node = resolvePath(root, op.path);
+    if (!node) return false;
+
+    const el = node.nodeType === Node.ELEMENT_NODE ? (node as Element) : null;
+
+    switch (op.op) {
+      case "text":
+        if (el) return false;
+        node.nodeValue = op.value;
+        break;
+      case "attr":
+        if (!el) return false;
+        el.setAttribute(op.name, op.value);
+        if (op.name === "value" && el instanceof HTMLInputElement) el.value = op.value;
+        if (op.name === "checked" && el instanceof HTMLInputElement) el.checked = true;
+        break;
+      case "rmattr":
+        if (!el) return false;
+        el.removeAttribute(op.name);
+        if (op.name === "checked" && el instanceof HTMLInputElement) el.checked = false;
+        break;
+      case "insert":
+        if (op.index > node.childNodes.length) return false;
+        node.insertBefore(fragmentFrom(op.html), node.childNodes[op.index] || null);
+        break;
+      case "replace":
+        (node as ChildNode).replaceWith(fragmentFrom(op.html));
+        break;
+      case "remove":
+        (node as ChildNode).remove();
+        break;
+      case "move": {
+        const child = node.childNodes[op.from];
+        if (!child) return false;
+        node.insertBefore(child, node.childNodes[op.to] || null);
+        break;
+      }
+    }
+  }
+  return true;
+}
+
+export interface InputRateOptions {
+  debounceMs?: number;
+  throttleMs?: number;
+}
+
+/** Read the `data-debounce` / `data-throttle` attributes rendered by `Input`. */
+export function inputRateFrom(el: HTMLElement): InputRateOptions {
+  const debounce = Number(el.dataset.debounce);
+  const throttle = Number(el.dataset.throttle);
+  return {
+    debounceMs: debounce > 0 ? debounce : undefined,
+    throttleMs: throttle > 0 ? throttle : undefined,
+  };
+}
+
+type PendingInput = { value: string; timer: ReturnType<typeof setTimeout> | null; last: number };
+
 type Listener = (msg: TaupyMessage) => void;
 type StatusListener = (status: "connecting" | "open" | "closed") => void;
 
@@ -8,6 +97,7 @@ export interface TaupyClientOptions {
   autoReconnect?: boolean;
   reconnectDelayMs?: number;
   debug?: boolean;
+  applyPatches?: boolean;
 }
 
 export class TaupyClient {
@@ -16,6 +106,7 @@ export class TaupyClient {
   private statusListeners: Set<StatusListener> = new Set();
   private opts: Required<TaupyClientOptions>;
   private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+  private inputs: Map<string, PendingInput> = new Map();
 
   constructor(options: TaupyClientOptions = {}) {
     const hostname = typeof window !== "undefined" ? window.location.hostname : "localhost";
@@ -24,6 +115,7 @@ export class TaupyClient {
       autoReconnect: options.autoReconnect ?? true,
       reconnectDelayMs: options.reconnectDelayMs ?? 1000,
       debug: options.debug ?? false,
+      applyPatches: options.applyPatches ?? true,
     };
   }
 
@@ -81,6 +173,47 @@ export class TaupyClient {
     }
   }
 
+  /**
+   * Send an `input` event, debounced or throttled per widget id.
+   * With neither option the value is sent immediately.
+   */
+  sendInput(id: string, value: string, rate: InputRateOptions = {}) {
+    let state = this.inputs.get(id);
+    if (!state) {
+      state = { value, timer: null, last: -Infinity };
+      this.inputs.set(id, state);
+    }
+    state.value = value;
+
+    const fire = () => {
+      state!.timer = null;
+      state!.last = Date.now();
+      this.send({ type: "input", id, value: state!.value });
+    };
+
+    if (rate.debounceMs) {
+      if (state.timer) clearTimeout(state.timer);
+      state.timer = setTimeout(fire, rate.debounceMs);
+    } else if (rate.throttleMs) {
+      const wait = state.last + rate.throttleMs - Date.now();
+      if (wait <= 0 && !state.timer) fire();
+      else if (!state.timer) state.timer = setTimeout(fire, wait);
+    } else {
+      fire();
+    }
+  }
+
+  /** Send a pending debounced/throttled value of a widget now (e.g. on blur). */
+  flushInput(id: string) {
+    const state = this.inputs.get(id);
+    if (state && state.timer) {
+      clearTimeout(state.timer);
+      state.timer = null;
+      state.last = Date.now();
+      this.send({ type: "input", id, value: state.value });
+    }
+  }
+
   on(type: string, handler: Listener) {
     if (!this.listeners.has(type)) {
       this.listeners.set(type, new Set());
@@ -99,6 +232,16 @@ export class TaupyClient {
   }
 
   private dispatch(msg: TaupyMessage) {
+    if (msg.type === "batch") {
+      (msg.messages as TaupyMessage[]).forEach((m) => this.dispatch(m));
+      return;
+    }
+    if (msg.type === "patch" && this.opts.applyPatches && typeof document !== "undefined") {
+      const el = document.getElementById(msg.id);
+      if (el && !applyPatch(el, msg.ops)) {
+        this.send({ type: "resync", id: msg.id });
+      }
+    }
     this.listeners.get(msg.type)?.forEach((cb) => cb(msg));
   }
 
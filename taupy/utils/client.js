@@ -1,17 +1,278 @@
-let socket = new WebSocket("ws://localhost:8765");
+// Offer the compact binary protocol; the server falls back to JSON text.
+let socket = new WebSocket("ws://localhost:8765", ["taupy.bin1"]);
+socket.binaryType = "arraybuffer";
 
 socket.onopen = () => {
     console.log("Connected to TauPy backend");
 };
 
-socket.onmessage = (event) => {
-    const msg = JSON.parse(event.data);
+function resolvePath(root, path) {
+    let node = root;
+    for (const index of path) {
+        node = node.childNodes[index];
+        if (!node) return null;
+    }
+    return node;
+}
+
+function fragmentFrom(html) {
+    const tpl = document.createElement("template");
+    tpl.innerHTML = html;
+    return tpl.content;
+}
+
+function applyPatch(root, ops) {
+    for (const op of ops) {
+        const node = resolvePath(root, op.path);
+        if (!node) return false;
+
+        const isElement = node.nodeType === Node.ELEMENT_NODE;
+
+        if (op.op === "text") {
+            if (isElement) return false;
+            node.nodeValue = op.value;
+        } else if (op.op === "attr") {
+            if (!isElement) return false;
+            node.setAttribute(op.name, op.value);
+            if (op.name === "value" && "value" in node) node.value = op.value;
+            if (op.name === "checked") node.checked = true;
+        } else if (op.op === "rmattr") {
+            if (!isElement) return false;
+            node.removeAttribute(op.name);
+            if (op.name === "checked") node.checked = false;
+        } else if (op.op === "insert") {
+            if (op.index > node.childNodes.length) return false;
+            node.insertBefore(fragmentFrom(op.html), node.childNodes[op.index] || null);
+        } else if (op.op === "replace") {
+            node.replaceWith(fragmentFrom(op.html));
+        } else if (op.op === "remove") {
+            node.remove();
+        } else if (op.op === "move") {
+            const child = node.childNodes[op.from];
+            if (!child) return false;
+            node.insertBefore(child, node.childNodes[op.to] || null);
+        }
+    }
+    return true;
+}
+
+function setCell(cell, value) {
+    if (cell._tauValue === value) return;
+    cell._tauValue = value;
+    if (/[<&]/.test(value)) cell.innerHTML = value;
+    else cell.textContent = value;
+}
+
+function applyTableRows(msg) {
+    const table = document.getElementById(msg.id);
+    if (!table || !table.tBodies[0]) return;
+    const tbody = table.tBodies[0];
+    const container = table.closest("[data-virtual-table]");
+    const rowHeight = Number(container && container.dataset.rowHeight) || 40;
+    const top = tbody.querySelector('tr[data-spacer="top"]');
+    const bottom = tbody.querySelector('tr[data-spacer="bottom"]');
+    if (!top || !bottom) return;
+
+    const rows = [];
+    for (let tr = top.nextElementSibling; tr && tr !== bottom; tr = tr.nextElementSibling) {
+        rows.push(tr);
+    }
+    while (rows.length < msg.rows.length) {
+        const tr = document.createElement("tr");
+        tr.style.height = rowHeight + "px";
+        tr.appendChild(document.createElement("th"));
+        tbody.insertBefore(tr, bottom);
+        rows.push(tr);
+    }
+    while (rows.length > msg.rows.length) {
+        rows.pop().remove();
+    }
+
+    msg.rows.forEach((cells, i) => {
+        const tr = rows[i];
+        while (tr.cells.length < cells.length + 1) tr.appendChild(document.createElement("td"));
+        while (tr.cells.length > cells.length + 1) tr.lastElementChild.remove();
+        setCell(tr.cells[0], String(msg.start + i + 1));
+        cells.forEach((value, j) => setCell(tr.cells[j + 1], value));
+    });
+
+    top.style.height = msg.start * rowHeight + "px";
+    bottom.style.height = Math.max(0, msg.total - msg.start - msg.rows.length) * rowHeight + "px";
+    tbody.dataset.total = msg.total;
+    if (container) {
+        container._tauStart = msg.start;
+        container._tauEnd = msg.start + msg.rows.length;
+    }
+}
+
+function renderedRows(tbody) {
+    const top = tbody.querySelector('tr[data-spacer="top"]');
+    const bottom = tbody.querySelector('tr[data-spacer="bottom"]');
+    if (!top || !bottom) return { top: null, bottom: null, rows: Array.from(tbody.rows) };
+    const rows = [];
+    for (let tr = top.nextElementSibling; tr && tr !== bottom; tr = tr.nextElementSibling) {
+        rows.push(tr);
+    }
+    return { top, bottom, rows };
+}
+
+function applyAppendRows(msg) {
+    const table = document.getElementById(msg.id);
+    if (!table || !table.tBodies[0]) return;
+    const tbody = table.tBodies[0];
+    const container = table.closest("[data-virtual-table]");
+    const { bottom, rows } = renderedRows(tbody);
+
+    if (!bottom) {
+        const frag = document.createDocumentFragment();
+        msg.rows.forEach((cells, i) => {
+            const tr = document.createElement("tr");
+            const th = document.createElement("th");
+            setCell(th, String(msg.start + i + 1));
+            tr.appendChild(th);
+            cells.forEach(value => {
+                const td = document.createElement("td");
+                setCell(td, value);
+                tr.appendChild(td);
+            });
+            frag.appendChild(tr);
+        });
+        tbody.appendChild(frag);
+        return;
+    }
+
+    const rowHeight = Number(container && container.dataset.rowHeight) || 40;
+    const start = (container && container._tauStart) || 0;
+    const end = start + rows.length;
+    bottom.style.height = Math.max(0, msg.total - end) * rowHeight + "px";
+    tbody.dataset.total = msg.total;
 
+    // A window that reached the old tail has to pull in the new rows.
+    if (container && end >= msg.start) {
+        container._tauStart = undefined;
+        requestViewport(container);
+    }
+}
+
+function applyUpdateCells(msg) {
+    const table = document.getElementById(msg.id);
+    if (!table || !table.tBodies[0]) return;
+    const tbody = table.tBodies[0];
+    const container = table.closest("[data-virtual-table]");
+    const { rows } = renderedRows(tbody);
+    const start = (container && container._tauStart) || 0;
+
+    msg.cells.forEach(([row, col, value]) => {
+        const tr = rows[row - start];
+        if (tr && tr.cells[col + 1]) setCell(tr.cells[col + 1], value);
+    });
+}
+
+function applyListOps(msg) {
+    const list = document.getElementById(msg.id);
+    if (!list) return false;
+    const byKey = new Map();
+    for (const el of list.children) {
+        if (el.dataset.key !== undefined) byKey.set(el.dataset.key, el);
+    }
+    for (const op of msg.ops) {
+        const before = op.before == null ? null : byKey.get(op.before);
+        if (before === undefined) return false;
+        if (op.op === "remove") {
+            const el = byKey.get(op.key);
+            if (!el) return false;
+            el.remove();
+            byKey.delete(op.key);
+        } else if (op.op === "insert") {
+            const el = fragmentFrom(op.html).firstElementChild;
+            if (!el) return false;
+            list.insertBefore(el, before);
+            byKey.set(op.key, el);
+        } else if (op.op === "move") {
+            const el = byKey.get(op.key);
+            if (!el) return false;
+            list.insertBefore(el, before);
+        }
+    }
+    return true;
+}
+
+function requestViewport(container) {
+    const rowHeight = Number(container.dataset.rowHeight) || 40;
+    const overscan = Number(container.dataset.overscan) || 10;
+    const first = Math.floor(container.scrollTop / rowHeight);
+    const visible = Math.ceil(container.clientHeight / rowHeight);
+
+    const start = container._tauStart;
+    const end = container._tauEnd;
+    if (start !== undefined && first - overscan / 2 >= start && first + visible + overscan / 2 <= end) {
+        return;
+    }
+
+    const from = Math.max(0, first - overscan);
+    socket.send(JSON.stringify({
+        type: "viewport",
+        id: container.dataset.virtualTable,
+        first: from,
+        count: first - from + visible + overscan
+    }));
+}
+
+const pendingViewports = new Set();
+
+document.addEventListener("scroll", evt => {
+    const target = evt.target;
+    if (!(target instanceof Element) || !target.dataset.virtualTable) return;
+    if (!pendingViewports.size) {
+        requestAnimationFrame(() => {
+            pendingViewports.forEach(requestViewport);
+            pendingViewports.clear();
+        });
+    }
+    pendingViewports.add(target);
+}, true);
+
+function handleMessage(msg) {
     if (msg.type === "update_text") {
         const el = document.getElementById(msg.id);
         if (el) el.textContent = msg.value;
     }
 
+    if (msg.type === "set_attr") {
+        const el = document.getElementById(msg.id);
+        if (el) {
+            if (msg.value === null) el.removeAttribute(msg.name);
+            else el.setAttribute(msg.name, msg.value);
+            // Attributes only set the initial state of these properties.
+            if (msg.name === "checked" || msg.name === "selected") {
+                el[msg.name] = msg.value !== null;
+            } else if (msg.name === "value") {
+                el.value = msg.value === null ? "" : msg.value;
+            }
+        }
+    }
+
+    if (msg.type === "toggle_class") {
+        const el = document.getElementById(msg.id);
+        if (el) el.classList.toggle(msg.name, msg.on);
+    }
+
+    if (msg.type === "update_input") {
+        const el = document.getElementById(msg.id);
+        if (el) el.value = msg.value;
+    }
+
+    if (msg.type === "window_cmd") {
+        if (window.taupyNative && typeof window.taupyNative.send === "function") {
+            window.taupyNative.send(msg.command || msg.payload || {});
+        }
+    }
+
+    if (msg.type === "set_value") {
+        const el = document.getElementById(msg.id);
+        if (el && el.value !== msg.value) el.value = msg.value;
+    }
+
     if (msg.type === "replace") {
         const el = document.getElementById(msg.id);
         if (el) {
@@ -35,6 +296,109 @@ socket.onmessage = (event) => {
         }
     }
 
+    if (msg.type === "table_rows") {
+        applyTableRows(msg);
+    }
+
+    if (msg.type === "append_rows") {
+        applyAppendRows(msg);
+    }
+
+    if (msg.type === "update_cells") {
+        applyUpdateCells(msg);
+    }
+
+    if (msg.type === "list_ops" && !applyListOps(msg)) {
+        socket.send(JSON.stringify({ type: "resync", id: msg.id }));
+    }
+
+    if (msg.type === "patch") {
+        const el = document.getElementById(msg.id);
+        if (el && !applyPatch(el, msg.ops)) {
+            socket.send(JSON.stringify({ type: "resync", id: msg.id }));
+        }
+    }
+}
+
+// Frames arriving between two paints are applied together in one
+// animation frame, so bursts of updates cause a single layout pass.
+const pendingMessages = [];
+
+function flushMessages() {
+    const messages = pendingMessages.splice(0);
+    messages.forEach(handleMessage);
+}
+
+const BINARY_TYPES = {
+    1: ["update_text", [["id", "id"], ["value", "str"]]],
+    2: ["update_html", [["id", "id"], ["html", "str"]]],
+    3: ["replace", [["id", "id"], ["html", "str"]]],
+    4: ["set_attr", [["id", "id"], ["name", "id"], ["value", "opt"]]],
+    5: ["toggle_class", [["id", "id"], ["name", "id"], ["on", "flag"]]],
+    6: ["set_value", [["id", "id"], ["value", "str"]]],
+    7: ["update_input", [["id", "id"], ["value", "str"]]],
+};
+const textDecoder = new TextDecoder();
+const internedStrings = [];
+
+// Decode a binary frame, see taupy/protocol.py for the format.
+function decodeFrame(buffer) {
+    const bytes = new Uint8Array(buffer);
+    const messages = [];
+    let pos = 0;
+
+    const varint = () => {
+        let n = 0, scale = 1, byte;
+        do {
+            byte = bytes[pos++];
+            n += (byte & 0x7f) * scale;
+            scale *= 128;
+        } while (byte >= 0x80);
+        return n;
+    };
+    const text = size => textDecoder.decode(bytes.subarray(pos, (pos += size)));
+
+    while (pos < bytes.length) {
+        const code = bytes[pos++];
+        if (code === 255) {
+            internedStrings.length = 0;
+            continue;
+        }
+        if (code === 0) {
+            messages.push(JSON.parse(text(varint())));
+            continue;
+        }
+        const [type, fields] = BINARY_TYPES[code];
+        const msg = { type };
+        for (const [name, kind] of fields) {
+            if (kind === "id") {
+                const v = varint();
+                if (v % 2) internedStrings.push((msg[name] = text((v - 1) / 2)));
+                else msg[name] = internedStrings[v / 2];
+            } else if (kind === "flag") {
+                msg[name] = bytes[pos++] === 1;
+            } else if (kind === "opt") {
+                const size = varint();
+                msg[name] = size ? text(size - 1) : null;
+            } else {
+                msg[name] = text(varint());
+            }
+        }
+        messages.push(msg);
+    }
+    return messages;
+}
+
+socket.onmessage = (event) => {
+    let msgs;
+    if (typeof event.data === "string") {
+        const msg = JSON.parse(event.data);
+        msgs = msg.type === "batch" ? msg.messages : [msg];
+    } else {
+        msgs = decodeFrame(event.data);
+    }
+    if (!pendingMessages.length) requestAnimationFrame(flushMessages);
+    for (const msg of msgs) pendingMessages.push(msg);
 };
 
 document.addEventListener("click", evt => {
@@ -48,33 +412,64 @@ document.addEventListener("click", evt => {
     }
 });
 
+function sendInput(target) {
+    socket.send(JSON.stringify({
+        type: "input",
+        id: target.dataset.componentId,
+        value: target.value
+    }));
+}
+
+// Per element state of debounced / throttled inputs.
+const inputTimers = new WeakMap();
+
+function fireInput(target, state) {
+    state.timer = null;
+    state.last = performance.now();
+    sendInput(target);
+}
+
 document.addEventListener("input", evt => {
     const target = evt.target;
+    if (!target.dataset.componentId || target.dataset.on === "change") return;
 
-    if (target.dataset.componentId) {
-        socket.send(JSON.stringify({
-            type: "input",
-            id: target.dataset.componentId,
-            value: target.value
-        }));
+    const debounce = Number(target.dataset.debounce) || 0;
+    const throttle = Number(target.dataset.throttle) || 0;
+    if (!debounce && !throttle) {
+        sendInput(target);
+        return;
+    }
+
+    let state = inputTimers.get(target);
+    if (!state) {
+        state = { timer: null, last: -Infinity };
+        inputTimers.set(target, state);
+    }
+    if (debounce) {
+        clearTimeout(state.timer);
+        state.timer = setTimeout(() => fireInput(target, state), debounce);
+    } else if (!state.timer) {
+        const wait = state.last + throttle - performance.now();
+        if (wait <= 0) fireInput(target, state);
+        else state.timer = setTimeout(() => fireInput(target, state), wait);
     }
 });
 
-if (!window._tauInputPatched) {
-    socket.addEventListener("message", event => {
-        const msg = JSON.parse(event.data);
-        if (msg.type === "update_input") {
-            const el = document.getElementById(msg.id);
-            if (el) el.value = msg.value;
-        }
-        if (msg.type === "window_cmd") {
-            if (window.taupyNative && typeof window.taupyNative.send === "function") {
-                window.taupyNative.send(msg.command || msg.payload || {});
-            }
-        }
-    });
-    window._tauInputPatched = true;
-}
+document.addEventListener("change", evt => {
+    const target = evt.target;
+    if (!target.dataset || !target.dataset.componentId) return;
+
+    if (target.dataset.on === "change") {
+        sendInput(target);
+        return;
+    }
+    // Committing the value sends a pending debounced/throttled update now.
+    const state = inputTimers.get(target);
+    if (state && state.timer) {
+        clearTimeout(state.timer);
+        fireInput(target, state);
+    }
+});
 
 if (!window._tauWindowBridgePatched) {
     if (window.taupyNative && typeof window.taupyNative.onEvent === "function") {
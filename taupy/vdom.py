@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import re
+from html import escape
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Set
+
+
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+RAW_TEXT_ELEMENTS = frozenset({"script", "style"})
+
+_ID_ATTR = re.compile(r'\sid="([^"]*)"')
+
+TEXT = "#text"
+COMMENT = "#comment"
+FRAGMENT = "#fragment"
+
+
+class VNode:
+    """
+    Minimal DOM node used to remember what the client currently displays.
+
+    Element nodes carry a tag, attributes and children. Text and comment
+    nodes use the ``#text`` / ``#comment`` pseudo tags and store their
+    content in ``text``.
+    """
+
+    __slots__ = ("tag", "attrs", "children", "text")
+
+    def __init__(
+        self,
+        tag: str,
+        attrs: Optional[Dict[str, str]] = None,
+        children: Optional[List["VNode"]] = None,
+        text: str = "",
+    ) -> None:
+        self.tag = tag
+        self.attrs: Dict[str, str] = attrs if attrs is not None else {}
+        self.children: List[VNode] = children if children is not None else []
+        self.text = text
+
+    @property
+    def key(self) -> Optional[str]:
+        """The element id, used to detect moved siblings."""
+        return self.attrs.get("id")
+
+    def to_html(self) -> str:
+        """Serialize the node back to HTML."""
+        if self.tag == TEXT:
+            return escape(self.text, quote=False)
+        if self.tag == COMMENT:
+            return f"<!--{self.text}-->"
+        if self.tag == FRAGMENT:
+            return "".join(child.to_html() for child in self.children)
+
+        attrs = "".join(
+            f' {name}="{escape(value, quote=True)}"'
+            for name, value in self.attrs.items()
+        )
+        if self.tag in VOID_ELEMENTS:
+            return f"<{self.tag}{attrs}>"
+        if self.tag in RAW_TEXT_ELEMENTS:
+            inner = "".join(child.text for child in self.children)
+        else:
+            inner = "".join(child.to_html() for child in self.children)
+        return f"<{self.tag}{attrs}>{inner}</{self.tag}>"
+
+    def __repr__(self) -> str:
+        if self.tag in (TEXT, COMMENT):
+            return f"<VNode {self.tag} {self.text!r}>"
+        return f"<VNode {self.tag} children={len(self.children)}>"
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = VNode(FRAGMENT)
+        self._stack: List[VNode] = [self.root]
+
+    def _append(self, node: VNode) -> None:
+        self._stack[-1].children.append(node)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        node = VNode(tag, {name: value or "" for name, value in attrs})
+        self._append(node)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._append(VNode(tag, {name: value or "" for name, value in attrs}))
+
+    def handle_endtag(self, tag: str) -> None:
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                del self._stack[depth:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        siblings = self._stack[-1].children
+        if siblings and siblings[-1].tag == TEXT:
+            siblings[-1].text += data
+        else:
+            siblings.append(VNode(TEXT, text=data))
+
+    def handle_comment(self, data: str) -> None:
+        self._append(VNode(COMMENT, text=data))
+
+
+def parse(html: str) -> VNode:
+    """
+    Parse an HTML fragment into a ``#fragment`` node holding its top-level nodes.
+
+    Parameters:
+        html (str): Rendered HTML.
+
+    Returns:
+        VNode: Fragment root.
+    """
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def diff(old: VNode, new: VNode) -> List[Dict[str, Any]]:
+    """
+    Compute the patch operations that turn ``old`` into ``new``.
+
+    Both nodes must share the same tag. Every operation carries a ``path``
+    of child indexes relative to the patched root, valid at the moment the
+    operation is applied, so the client can replay them in order:
+
+        text    set the text of a text/comment node
+        attr    set an attribute
+        rmattr  remove an attribute
+        insert  insert ``html`` into the node at ``path`` before ``index``
+        replace replace the node at ``path`` with ``html``
+        remove  remove the node at ``path``
+        move    move child ``from`` of the node at ``path`` to index ``to``
+
+    Returns:
+        list[dict]: Patch operations, empty when both trees are equal.
+    """
+    ops: List[Dict[str, Any]] = []
+    _diff_node(old, new, [], ops)
+    return ops
+
+
+def _diff_node(
+    old: VNode, new: VNode, path: List[int], ops: List[Dict[str, Any]]
+) -> None:
+    if old.tag in (TEXT, COMMENT):
+        if old.text != new.text:
+            ops.append({"op": "text", "path": path, "value": new.text})
+        return
+
+    if old.attrs != new.attrs:
+        for name, value in new.attrs.items():
+            if old.attrs.get(name) != value:
+                ops.append({"op": "attr", "path": path, "name": name, "value": value})
+        for name in old.attrs:
+            if name not in new.attrs:
+                ops.append({"op": "rmattr", "path": path, "name": name})
+
+    _diff_children(old.children, new.children, path, ops)
+
+
+def _diff_children(
+    old_children: List[VNode],
+    new_children: List[VNode],
+    path: List[int],
+    ops: List[Dict[str, Any]],
+) -> None:
+    current = list(old_children)
+    new_keys = {node.key for node in new_children if node.key is not None}
+    old_by_key = {node.key: node for node in old_children if node.key is not None}
+
+    for i, node in enumerate(new_children):
+        key = node.key
+        if key is not None and (i >= len(current) or current[i].key != key):
+            moved = old_by_key.get(key)
+            if moved is not None:
+                try:
+                    j = current.index(moved, i + 1)
+                except ValueError:
+                    pass
+                else:
+                    ops.append({"op": "move", "path": path, "from": j, "to": i})
+                    current.insert(i, current.pop(j))
+
+        if i < len(current):
+            existing = current[i]
+            if existing.tag == node.tag:
+                _diff_node(existing, node, path + [i], ops)
+                continue
+            if existing.key is None or existing.key not in new_keys:
+                ops.append(
+                    {"op": "replace", "path": path + [i], "html": node.to_html()}
+                )
+                current[i] = node
+                continue
+
+        ops.append({"op": "insert", "path": path, "index": i, "html": node.to_html()})
+        current.insert(i, node)
+
+    for j in range(len(current) - 1, len(new_children) - 1, -1):
+        ops.append({"op": "remove", "path": path + [j]})
+
+
+def _patch_size(ops: List[Dict[str, Any]]) -> int:
+    size = 0
+    for op in ops:
+        size += 40 + len(op.get("html", "")) + len(str(op.get("value", "")))
+    return size
+
+
+class RenderCache:
+    """
+    Remembers the last tree sent to the client for each DOM target and turns
+    new renders into ``patch`` messages.
+
+    Two kinds of targets are tracked:
+        • roots whose children are replaced (``App.navigate``)
+        • elements replaced as a whole (``Component.update``)
+
+    Elements with an id inside a cached root are indexed, so updating one
+    component also keeps its root's tree in sync.
+
+    A root sent as full HTML (the first render, or a new screen sharing
+    few element ids with the previous one) is kept as text and only parsed
+    when a later diff or mirrored update needs its tree.
+    """
+
+    def __init__(self) -> None:
+        self._roots: Dict[str, VNode] = {}
+        self._nodes: Dict[str, VNode] = {}
+        self._owners: Dict[str, Optional[str]] = {}
+        self._ids: Dict[str, Set[str]] = {}
+        self._unparsed: Dict[str, str] = {}
+
+    def clear(self) -> None:
+        """Forget every tree, e.g. when a fresh client connects."""
+        self._roots.clear()
+        self._nodes.clear()
+        self._owners.clear()
+        self._ids.clear()
+        self._unparsed.clear()
+
+    def replace(self, target_id: str, html: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the message that replaces the children of ``target_id``.
+
+        Returns:
+            dict | None: A ``patch`` or ``replace`` message, or None when
+            nothing changed.
+        """
+        full = {"type": "replace", "id": target_id, "html": html}
+        new_ids = set(_ID_ATTR.findall(html))
+        old_ids = self._ids.get(target_id)
+
+        # Ids come from a counter: a freshly built screen shares (almost)
+        # none with the old one and diffing it can only end in a replace.
+        if old_ids is None or len(old_ids & new_ids) * 2 < len(new_ids):
+            self._set_root(target_id, None)
+            self._unparsed[target_id] = html
+            self._ids[target_id] = new_ids
+            return full
+
+        old_root = self._tree(target_id)
+        new_root = parse(html)
+        self._set_root(target_id, new_root)
+        self._ids[target_id] = new_ids
+        if old_root is None:
+            return full
+        return self._choose(target_id, diff(old_root, new_root), full, len(html))
+
+    def update(self, target_id: str, html: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the message that replaces the element ``target_id`` itself.
+
+        Falls back to a full ``update_html`` message when the element was
+        never sent before or the new HTML is not a single element with the
+        same id.
+        """
+        element = _single_element(parse(html))
+        self._parse_owner(target_id)
+        old = self._nodes.get(target_id)
+
+        if element is None or element.key != target_id:
+            self.invalidate(target_id)
+            return {"type": "update_html", "id": target_id, "html": html}
+
+        full = {"type": "update_html", "id": target_id, "html": html.strip()}
+
+        if old is None or old.tag != element.tag:
+            if old is not None:
+                self.invalidate(target_id)
+            self._index(element, self._owners.get(target_id))
+            return full
+
+        ops = diff(old, element)
+        old.attrs = element.attrs
+        old.children = element.children
+        self._index(old, self._owners.get(target_id))
+        return self._choose(target_id, ops, full, len(html))
+
+    def set_text(self, target_id: str, text: str) -> None:
+        """Mirror an ``update_text`` message into the cached tree."""
+        self._parse_owner(target_id)
+        node = self._nodes.get(target_id)
+        if node is not None:
+            node.children = [VNode(TEXT, text=text)] if text else []
+
+    def set_attr(self, target_id: str, name: str, value: Optional[str]) -> None:
+        """Mirror a ``set_attr`` message; ``None`` removes the attribute."""
+        self._parse_owner(target_id)
+        node = self._nodes.get(target_id)
+        if node is None:
+            return
+        if value is None:
+            node.attrs.pop(name, None)
+        else:
+            node.attrs[name] = value
+
+    def toggle_class(self, target_id: str, name: str, on: bool) -> None:
+        """Mirror a ``toggle_class`` message into the cached tree."""
+        self._parse_owner(target_id)
+        node = self._nodes.get(target_id)
+        if node is None:
+            return
+        classes = [c for c in node.attrs.get("class", "").split() if c != name]
+        if on:
+            classes.append(name)
+        node.attrs["class"] = " ".join(classes)
+
+    def invalidate(self, target_id: str) -> None:
+        """
+        Drop the tree containing ``target_id`` after the DOM was changed in a
+        way the cache cannot mirror. The next render sends full HTML.
+        """
+        for root_id in self._unparsed_owners(target_id):
+            self._forget(root_id)
+        owner = self._owners.get(target_id)
+        if owner is not None:
+            self._forget(owner)
+        self._nodes.pop(target_id, None)
+        self._owners.pop(target_id, None)
+
+    def contains(self, root_id: str, element_id: str) -> bool:
+        """Whether ``element_id`` was last sent inside the root ``root_id``."""
+        return self._owners.get(element_id) == root_id or element_id in self._ids.get(
+            root_id, ()
+        )
+
+    def resync(self, target_id: str) -> Optional[Dict[str, Any]]:
+        """Full HTML message for a target whose patch failed on the client."""
+        if target_id in self._unparsed:
+            html = self._unparsed[target_id]
+            return {"type": "replace", "id": target_id, "html": html}
+        self._parse_owner(target_id)
+        root = self._roots.get(target_id)
+        if root is not None:
+            return {"type": "replace", "id": target_id, "html": root.to_html()}
+        node = self._nodes.get(target_id)
+        if node is not None:
+            return {"type": "update_html", "id": target_id, "html": node.to_html()}
+        return None
+
+    def _choose(
+        self,
+        target_id: str,
+        ops: List[Dict[str, Any]],
+        full: Dict[str, Any],
+        html_size: int,
+    ) -> Optional[Dict[str, Any]]:
+        if not ops:
+            return None
+        if _patch_size(ops) >= html_size:
+            return full
+        return {"type": "patch", "id": target_id, "ops": ops}
+
+    def _tree(self, target_id: str) -> Optional[VNode]:
+        """The tree of a root, parsing it first if it is only kept as text."""
+        html = self._unparsed.pop(target_id, None)
+        if html is not None:
+            self._set_root(target_id, parse(html))
+        return self._roots.get(target_id)
+
+    def _unparsed_owners(self, target_id: str) -> List[str]:
+        return [
+            root_id
+            for root_id in self._unparsed
+            if root_id == target_id or target_id in self._ids.get(root_id, ())
+        ]
+
+    def _parse_owner(self, target_id: str) -> None:
+        """Parse the unparsed root containing ``target_id`` before an edit."""
+        if self._unparsed and target_id not in self._nodes:
+            for root_id in self._unparsed_owners(target_id):
+                self._tree(root_id)
+
+    def _forget(self, target_id: str) -> None:
+        self._unparsed.pop(target_id, None)
+        self._ids.pop(target_id, None)
+        self._set_root(target_id, None)
+
+    def _set_root(self, target_id: str, root: Optional[VNode]) -> None:
+        old = self._roots.pop(target_id, None)
+        if old is not None:
+            for node in _walk(old):
+                key = node.key
+                if key is not None and self._owners.get(key) == target_id:
+                    del self._owners[key]
+                    self._nodes.pop(key, None)
+        if root is not None:
+            self._roots[target_id] = root
+            self._index(root, target_id)
+
+    def _index(self, root: VNode, owner: Optional[str]) -> None:
+        for node in _walk(root):
+            key = node.key
+            if key is not None:
+                self._nodes[key] = node
+                self._owners[key] = owner
+
+
+def _walk(node: VNode):
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(current.children)
+
+
+def _single_element(fragment: VNode) -> Optional[VNode]:
+    element = None
+    for node in fragment.children:
+        if node.tag == TEXT and not node.text.strip():
+            continue
+        if node.tag in (TEXT, COMMENT) or element is not None:
+            return None
+        element = node
+    return element
@@ -1,9 +1,12 @@
 from .elements import Div, Button, Text, Input, Table, Image, Modal
 from .layout import HStack, VStack, Center, Spacer, Scroll, Container
-from .factory import Component
+from .factory import Component, Markup
+from .datasource import ColumnarSource
+from .lists import For, Each
 
 __all__ = [
     "Component",
+    "Markup",
     "Div",
     "Button",
     "Text",
@@ -17,4 +20,7 @@ __all__ = [
     "Spacer",
     "Scroll",
     "Container",
+    "ColumnarSource",
+    "For",
+    "Each",
 ]
@@ -1,41 +1,300 @@
-import uuid
+import itertools
+from typing import Any, Callable, Iterator, List, Optional
+
+from ..state import State
+
+
+class _RenderFrame:
+    __slots__ = ("volatile",)
+
+    def __init__(self) -> None:
+        self.volatile = False
+
+
+_render_frames: List[_RenderFrame] = []
+
+
+def _mark_volatile() -> None:
+    """Prevent the component currently rendering from caching its HTML."""
+    if _render_frames:
+        _render_frames[-1].volatile = True
+
+
+class IdAllocator:
+    """
+    Monotonic source of component ids.
+
+    Ids are plain counters (``tau_1``, ``tau_2``, ...): assigned once at
+    construction, so they are stable across renders, and never reused
+    within the process.
+    """
+
+    __slots__ = ("prefix", "_next")
+
+    def __init__(self, prefix: str = "tau_") -> None:
+        self.prefix = prefix
+        self._next = itertools.count(1).__next__
+
+    def __call__(self) -> str:
+        return f"{self.prefix}{self._next()}"
 
 
 class Component:
-    _id_counter = 0
+    """
+    Base class of every UI element.
+
+    Subclasses implement ``_render()``; ``render()`` memoizes its result
+    until the component is invalidated. A component is invalidated when its
+    children or props change through ``children`` / ``update_props()``, when
+    ``invalidate()`` or ``update()`` is called, or when a bound ``State``
+    changes. Invalidation bubbles up to every ancestor, so a re-render only
+    re-stringifies the dirty path.
+
+    ``iter_render()`` yields the same HTML in chunks, so very large trees can
+    be written or sent without building one big string.
+
+    Lifecycle: the App mounts a subtree after binding it (``on_mount()``,
+    children first) and unmounts the previous screen on navigation
+    (``on_unmount()``). Subscriptions made with ``watch()`` and callbacks
+    registered with ``add_cleanup()`` are released on unmount.
+    """
+
+    __slots__ = (
+        "props",
+        "_children",
+        "_parent",
+        "_html",
+        "_cleanups",
+        "_mounted",
+        "_bindings",
+        "app",
+        "id",
+    )
+
+    ids = IdAllocator()
+
+    # Whether ``props`` are rendered as HTML attributes of the element with
+    # ``id``. Callable props of such components are reactive: the App binds
+    # them and sends ``set_attr`` / ``toggle_class`` messages on change.
+    props_are_attrs = False
+    base_class: Optional[str] = None
 
     def __init__(self, **kwargs):
         self.props = kwargs
-        self.children = self.props.pop("children", []) or []
+        children = kwargs.pop("children", None) or []
+        self._children = children
+        self._parent: Optional[Component] = None
+        self._html: Optional[str] = None
+        self._cleanups: Optional[List[Callable[[], None]]] = None
+        self._mounted = False
+        self._bindings: Optional[List[Any]] = None
+        if children:
+            self._adopt(children)
 
         self.app = None
 
-        provided_id = self.props.pop("id", None)
-        if provided_id is not None:
-            self.id = provided_id
-        else:
-            Component._id_counter += 1
-            self.id = f"tau_{Component._id_counter}_{uuid.uuid4().hex[:6]}"
+        provided_id = kwargs.pop("id", None)
+        self.id = provided_id if provided_id is not None else self.ids()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Subclasses written against the old protocol override render()
+        # directly; their output cannot be tracked, so never cache it.
+        custom_render = cls.__dict__.get("render")
+        if custom_render is None:
+            return
+
+        def render(self):
+            _mark_volatile()
+            return custom_render(self)
+
+        render.__doc__ = custom_render.__doc__
+        cls.render = render  # type: ignore[method-assign]
+
+    @property
+    def children(self) -> List[Any]:
+        return self._children
+
+    @children.setter
+    def children(self, value: List[Any]) -> None:
+        self._children = value
+        self._adopt(value)
+        self.invalidate()
+
+    def _adopt(self, children: List[Any]) -> None:
+        """Link child components to this one so invalidation can bubble up."""
+        for child in children:
+            if isinstance(child, Component):
+                child._parent = self
+
+    def _child_components(self) -> List["Component"]:
+        """
+        Components rendered by this one, used for binding and lifecycle.
+
+        Defaults to the component children; widgets holding components in
+        other attributes extend it.
+        """
+        return [c for c in self._children if isinstance(c, Component)]
+
+    def on_mount(self) -> None:
+        """Called once the component is bound to an App. Override as needed."""
+
+    def on_unmount(self) -> None:
+        """Called when the component is removed from the screen."""
+
+    def watch(self, source: Any, callback: Callable[[Any], None]) -> None:
+        """
+        Subscribe ``callback`` to a ``State`` (or anything with
+        ``subscribe`` / ``unsubscribe``) until the component is unmounted.
+
+        Parameters:
+            source: Object to subscribe to.
+            callback (Callable): Subscriber.
+        """
+        source.subscribe(callback)
+        self.add_cleanup(lambda: source.unsubscribe(callback))
+
+    def add_cleanup(self, fn: Callable[[], None]) -> None:
+        """
+        Register a function to run when the component is unmounted.
+
+        Parameters:
+            fn (Callable[[], None]): Cleanup callback.
+        """
+        if self._cleanups is None:
+            self._cleanups = []
+        self._cleanups.append(fn)
+
+    def _mount(self) -> None:
+        if not self._mounted:
+            self._mounted = True
+            self.on_mount()
+
+    def _unmount(self) -> None:
+        """Unmount this subtree: run cleanups and ``on_unmount`` hooks."""
+        for child in self._child_components():
+            child._unmount()
+
+        cleanups, self._cleanups = self._cleanups, None
+        for fn in cleanups or ():
+            fn()
+
+        if self._mounted:
+            self._mounted = False
+            self.on_unmount()
+
+    def update_props(self, **props: Any) -> None:
+        """
+        Update props and mark the component dirty.
+
+        Parameters:
+            **props: Props to set.
+        """
+        self.props.update(props)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached HTML of this component and all its ancestors.
+
+        Call it after mutating props or children in place.
+        """
+        node: Optional[Component] = self
+        while node is not None:
+            node._html = None
+            node = node._parent
 
     async def update(self):
         """
-        Re-render this component and send HTML to frontend.
+        Re-render this component and send the changes to the frontend.
         """
         if not self.app:
             print(f"[WARN] Component {self.id} has no app linked")
             return
 
-        new_html = self.render()
+        self.invalidate()
+        await self.app.update_component(self.id, self.render())
 
-        await self.app.server.broadcast(
-            {"type": "update_html", "id": self.id, "html": new_html}
-        )
+    def render(self) -> str:
+        """
+        Return the HTML of this component, reusing the cached HTML when
+        nothing below it changed.
+
+        Returns:
+            str: Rendered HTML string.
+        """
+        html = self._html
+        if html is not None:
+            return html
 
-    def render(self):
+        frames = _render_frames
+        frame = _RenderFrame()
+        frames.append(frame)
+        try:
+            html = self._render()
+        finally:
+            frames.pop()
+
+        if frame.volatile or self._is_volatile():
+            _mark_volatile()
+        else:
+            self._html = html
+        return html
+
+    def _render(self) -> str:
         return "".join(
             child.render() if isinstance(child, Component) else str(child)
             for child in self.children
         )
 
+    def iter_render(self) -> Iterator[str]:
+        """
+        Yield the HTML of this component in chunks.
+
+        Containers stream their children instead of concatenating them;
+        cached HTML is yielded as a single chunk.
+
+        Yields:
+            str: Consecutive pieces of the rendered HTML.
+        """
+        html = self._html
+        if html is not None:
+            yield html
+            return
+        yield from self._iter_render()
+
+    def _iter_render(self) -> Iterator[str]:
+        cls = type(self)
+        if cls._render is Component._render and cls.render is Component.render:
+            yield from self._iter_children()
+        else:
+            yield self.render()
+
+    def _iter_children(self) -> Iterator[str]:
+        for child in self.children:
+            if isinstance(child, Component):
+                yield from child.iter_render()
+            else:
+                yield str(child)
+
+    def _is_volatile(self) -> bool:
+        """Whether the output may change without the component being invalidated."""
+        return self._has_reactive_props() and not self._bindings_live()
+
+    def _has_reactive_props(self) -> bool:
+        if not self.props_are_attrs or not self.props:
+            return False
+        for name, value in self.props.items():
+            if isinstance(value, State):
+                return True
+            if name == "classes" and any(isinstance(v, State) for v in value.values()):
+                return True
+        return False
+
+    def _bindings_live(self) -> bool:
+        """Whether every reactive prop is bound to the States it reads."""
+        return self._bindings is not None and all(b.deps for b in self._bindings)
+
     def __repr__(self):
         return f"<{self.__class__.__name__} id={self.id}>"
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+ChangeCallback = Callable[[Dict[str, Any]], None]
+
+
+_INT64 = (-(2**63), 2**63 - 1)
+
+
+def _array_code(values: Sequence[Any]) -> Optional[str]:
+    """``array`` typecode able to hold ``values``, or None for a list."""
+    if all(
+        isinstance(v, int) and not isinstance(v, bool) and _INT64[0] <= v <= _INT64[1]
+        for v in values
+    ):
+        return "q"
+    if all(isinstance(v, (int, float)) for v in values):
+        return "d"
+    return None
+
+
+def _numpy_values(values: Sequence[Any]) -> Any:
+    data = np.asarray(values)
+    if data.dtype.kind not in "biuf":
+        data = np.asarray(values, dtype=object)
+    return data
+
+
+class _Column:
+    """
+    Growable column backed by a NumPy array when available, otherwise by an
+    ``array.array`` for numbers or a list for anything else.
+
+    Both backends widen the column instead of converting new values: ints
+    become floats when a float arrives, and anything non-numeric turns the
+    column into Python objects. An empty column takes the type of the
+    first values appended to it.
+    """
+
+    __slots__ = ("data", "size")
+
+    def __init__(self, values: Sequence[Any]) -> None:
+        if np is not None:
+            self.data: Any = _numpy_values(values)
+        else:
+            code = _array_code(values)
+            self.data = array(code, values) if code else list(values)
+        self.size = len(values)
+
+    def _widen(self, values: Sequence[Any]) -> Any:
+        """Make the backing storage able to hold ``values``; return them."""
+        if not self.size:
+            # An empty column has no type yet: adopt the one of ``values``.
+            if np is not None and isinstance(self.data, np.ndarray):
+                new = _numpy_values(values)
+                self.data = np.empty(0, dtype=new.dtype)
+                return new
+            code = _array_code(values)
+            self.data = array(code) if code else []
+            return values
+        if np is not None and isinstance(self.data, np.ndarray):
+            new = _numpy_values(values)
+            dtype = np.result_type(self.data.dtype, new.dtype)
+            if dtype.kind not in "biuf":
+                dtype = np.dtype(object)
+            if dtype != self.data.dtype:
+                self.data = self.data.astype(dtype)
+            return new.astype(dtype, copy=False)
+        if isinstance(self.data, array):
+            code = _array_code(values)
+            if code is None:
+                self.data = list(self.data)
+            elif code == "d" and self.data.typecode == "q":
+                self.data = array("d", self.data)
+        return values
+
+    def extend(self, values: Sequence[Any]) -> None:
+        count = len(values)
+        values = self._widen(values)
+        if np is not None and isinstance(self.data, np.ndarray):
+            needed = self.size + count
+            if needed > len(self.data):
+                grown = np.empty(max(needed, 2 * len(self.data)), dtype=self.data.dtype)
+                grown[: self.size] = self.data[: self.size]
+                self.data = grown
+            self.data[self.size : needed] = values
+        else:
+            self.data.extend(values)
+        self.size += count
+
+    def set(self, index: int, value: Any) -> None:
+        self.data[index] = self._widen([value])[0]
+
+    def format(self, start: int, stop: int, fmt: Optional[str]) -> List[str]:
+        """Format a slice of the column in one pass."""
+        values = self.data[start : min(stop, self.size)]
+        if np is not None and isinstance(values, np.ndarray):
+            if fmt:
+                return np.char.mod(fmt, values).tolist()
+            return values.astype(str).tolist()
+        if fmt:
+            return [fmt % v for v in values]
+        return list(map(str, values))
+
+
+class ColumnarSource:
+    """
+    Column-oriented data source for ``Table``.
+
+    Each column is stored as one array (NumPy when installed, the ``array``
+    module otherwise) and formatted a whole slice at a time. Mutations are
+    reported to subscribers as incremental ``append_rows`` / ``update_cells``
+    messages, so a bound table never has to be resent as a whole.
+
+    Example:
+        source = ColumnarSource(
+            {"time": [0.0, 0.5], "value": [12, 14]},
+            formats={"time": "%.1f"},
+        )
+        Table(source=source, virtual=True)
+        source.append_rows([(1.0, 13)])
+
+    Parameters:
+        columns (Mapping[str, Sequence]): Column name to values.
+        formats (Mapping[str, str] | None): Optional printf-style format per column.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        formats: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.names: List[str] = list(columns)
+        self.formats: Dict[str, str] = dict(formats or {})
+        self._columns = [_Column(values) for values in columns.values()]
+        self._subscribers: List[ChangeCallback] = []
+
+        sizes = {col.size for col in self._columns}
+        if len(sizes) > 1:
+            raise ValueError("All columns must have the same length.")
+
+    def __len__(self) -> int:
+        return self._columns[0].size if self._columns else 0
+
+    def column(self, name: str) -> Any:
+        """Return the backing array of a column, trimmed to the row count."""
+        col = self._columns[self.names.index(name)]
+        return col.data[: col.size]
+
+    def format_rows(self, start: int, stop: int) -> List[List[str]]:
+        """
+        Format rows ``start:stop`` as strings, one vectorized pass per column.
+
+        Returns:
+            list[list[str]]: Formatted cells, row-major.
+        """
+        formatted = [
+            col.format(start, stop, self.formats.get(name))
+            for name, col in zip(self.names, self._columns)
+        ]
+        return [list(row) for row in zip(*formatted)]
+
+    def append_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Append rows and notify subscribers with an ``append_rows`` change.
+
+        Parameters:
+            rows (Iterable[Sequence]): Rows in column order.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        width = len(self._columns)
+        for row in rows:
+            if len(row) != width:
+                raise ValueError(f"Expected {width} values per row, got {len(row)}.")
+        start = len(self)
+        for col, values in zip(self._columns, zip(*rows)):
+            col.extend(values)
+        self._notify(
+            {
+                "type": "append_rows",
+                "start": start,
+                "total": len(self),
+                "rows": self.format_rows(start, len(self)),
+            }
+        )
+
+    def update_cell(self, row: int, column: str, value: Any) -> None:
+        """Set a single cell. See ``update_cells``."""
+        self.update_cells([(row, column, value)])
+
+    def update_cells(self, updates: Iterable[tuple[int, str, Any]]) -> None:
+        """
+        Set several cells and notify subscribers with one ``update_cells`` change.
+
+        Parameters:
+            updates (Iterable[tuple[int, str, Any]]): (row, column name, value).
+        """
+        resolved = []
+        for row, name, value in updates:
+            index = self.names.index(name)
+            if not 0 <= row < len(self):
+                raise IndexError(f"Row {row} out of range.")
+            resolved.append((row, index, value))
+
+        cells = []
+        for row, index, value in resolved:
+            col = self._columns[index]
+            col.set(row, value)
+            fmt = self.formats.get(self.names[index])
+            cells.append([row, index, col.format(row, row + 1, fmt)[0]])
+        if cells:
+            self._notify({"type": "update_cells", "cells": cells})
+
+    def subscribe(self, callback: ChangeCallback) -> None:
+        """
+        Subscribe a callback to changes. Subscribing twice is a no-op.
+
+        Parameters:
+            callback (Callable[[dict], None]): Receives each change message.
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: ChangeCallback) -> None:
+        """Remove a previously added subscriber."""
+        try:
+            self._subscribers.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify(self, change: Dict[str, Any]) -> None:
+        for callback in list(self._subscribers):
+            callback(change)
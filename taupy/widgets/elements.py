@@ -1,9 +1,9 @@
 from __future__ import annotations
 from typing import Any, List, Optional
+from ..state import State
 from .component import Component
 import shutil
 import os
-import asyncio
 
 
 def _normalize_props(props: dict[str, Any]) -> dict[str, Any]:
@@ -19,17 +19,74 @@ def _normalize_props(props: dict[str, Any]) -> dict[str, Any]:
     return out
 
 
-def _props_to_str(props: dict[str, Any]) -> str:
-    out = []
-    for k, v in props.items():
-        if v is None:
-            continue
+def _prop_value(value: Any) -> Any:
+    """Resolve a reactive prop (a ``State`` or ``Computed``) to its value."""
+    return value() if isinstance(value, State) else value
+
+
+def _active_classes(classes: dict[str, Any]) -> List[str]:
+    return [
+        name
+        for name, on in classes.items()
+        if not callable(on) or isinstance(on, State)
+        if _prop_value(on)
+    ]
+
+
+def _attr_name(prop: str) -> str:
+    return "data-" + prop[5:] if prop.startswith("data_") else prop
+
 
-        if k.startswith("data_"):
-            k = "data-" + k[5:]
+def _attr_value(value: Any) -> Optional[str]:
+    """Attribute value for a ``set_attr`` message; ``None`` removes it."""
+    if value is None or value is False:
+        return None
+    return "" if value is True else str(value)
 
-        out.append(f'{k}="{v}"')
 
+def _class_value(component: Component) -> str:
+    """Full ``class`` attribute of a component, as ``_props_to_str`` renders it."""
+    props = component.props
+    classes = [component.base_class] if component.base_class else []
+    if props.get("class") is not None:
+        classes.append(str(_prop_value(props["class"])))
+    classes.extend(_active_classes(props.get("classes", {})))
+    return " ".join(classes)
+
+
+def _props_to_str(props: dict[str, Any], base_class: Optional[str] = None) -> str:
+    """
+    Render props as HTML attributes.
+
+    ``State`` / ``Computed`` values are reactive and rendered with their
+    current value. Other callables (event handlers such as ``on_click``) are
+    not attributes and are skipped. ``True`` renders a bare boolean
+    attribute, ``False`` and ``None`` omit it.
+    ``classes`` maps class names to (reactive) flags and is merged with
+    ``class`` and the widget's ``base_class`` into one ``class`` attribute.
+    """
+    out: List[str] = []
+    classes = [base_class] if base_class else []
+    class_at = 0 if base_class else -1
+    for k, v in props.items():
+        if isinstance(v, State):
+            v = v()
+        elif callable(v):
+            continue
+        if k == "class" or k == "classes":
+            if class_at < 0:
+                class_at = len(out)
+            if k == "classes":
+                classes.extend(_active_classes(v))
+            elif v is not None:
+                classes.append(str(v))
+        elif v is not None and v is not False:
+            if k.startswith("data_"):
+                k = "data-" + k[5:]
+            out.append(k if v is True else f'{k}="{v}"')
+
+    if class_at >= 0 and classes:
+        out.insert(class_at, f'class="{" ".join(classes)}"')
     return " ".join(out)
 
 
@@ -38,6 +95,8 @@ class Modal_(Component):
     DaisyUI modal. Controlled via State[bool].
     """
 
+    __slots__ = ("state", "title", "content", "actions")
+
     def __init__(
         self,
         open_state,
@@ -54,13 +113,22 @@ class Modal_(Component):
         self.title = title
         self.content = content or []
         self.actions = actions or []
+        self._adopt(self.content)
+        self._adopt(self.actions)
+
+    def _child_components(self) -> List[Component]:
+        return [*super()._child_components(), *self.content, *self.actions]
 
-        def on_state_change(_):
-            asyncio.create_task(self.update())
+    def on_mount(self) -> None:
+        self.watch(self.state, self._on_state_change)
 
-        self.state.subscribe(on_state_change)
+    def _on_state_change(self, value) -> None:
+        """Open or close the modal by toggling its checkbox, not re-rendering."""
+        self.invalidate()
+        if self.app:
+            self.app._set_attr(self.id, "checked", bool(value))
 
-    def render(self) -> str:
+    def _render(self) -> str:
         is_open = bool(self.state())
 
         checked_attr = "checked" if is_open else ""
@@ -92,48 +160,130 @@ class Modal_(Component):
 
 
 class Div_(Component):
-    def render(self) -> str:
+    __slots__ = ()
+
+    props_are_attrs = True
+
+    def _open_tag(self) -> str:
         props_str = _props_to_str(self.props)
-        children = super().render()
-        return f'<div id="{self.id}" {props_str} data-component-id="{self.id}">{children}</div>'
+        return f'<div id="{self.id}" {props_str} data-component-id="{self.id}">'
+
+    def _render(self) -> str:
+        children = super()._render()
+        return f"{self._open_tag()}{children}</div>"
+
+    def _iter_render(self):
+        yield self._open_tag()
+        yield from self._iter_children()
+        yield "</div>"
 
 
 class Button_(Component):
+    __slots__ = ("text",)
+
+    props_are_attrs = True
+    base_class = "btn"
+
     def __init__(self, text: str, **props):
         super().__init__(**props)
         self.text = text
 
-    def render(self) -> str:
-        props_str = _props_to_str(self.props)
+    def _render(self) -> str:
+        props_str = _props_to_str(self.props, self.base_class)
         return (
-            f'<button id="{self.id}" class="btn" {props_str} '
+            f'<button id="{self.id}" {props_str} '
             f'data-component-id="{self.id}">{self.text}</button>'
         )
 
 
 class Input_(Component):
-    def __init__(self, value="", placeholder="", on_input=None, **props):
+    """
+    Text input. A callable ``value`` (e.g. a ``State``) is bound: changes are
+    sent as ``set_value`` messages.
+
+    ``debounce_ms`` sends the value once typing paused that long,
+    ``throttle_ms`` at most once per interval and ``on="change"`` only when
+    the value is committed (enter, blur). The client enforces them; the
+    server delays ``on_input`` handlers of the same widget by the same
+    interval and skips values superseded in the meantime.
+    """
+
+    __slots__ = (
+        "value",
+        "placeholder",
+        "on_input",
+        "debounce_ms",
+        "throttle_ms",
+        "on",
+    )
+
+    props_are_attrs = True
+    base_class = "input"
+    INPUT_TRIGGERS = ("input", "change")
+
+    def __init__(
+        self,
+        value="",
+        placeholder="",
+        on_input=None,
+        debounce_ms: int | None = None,
+        throttle_ms: int | None = None,
+        on: str = "input",
+        **props,
+    ):
         super().__init__(**props)
+        if on not in self.INPUT_TRIGGERS:
+            raise ValueError(f"unknown input trigger {on!r}")
         self.value = value
         self.placeholder = placeholder
         self.on_input = on_input
+        self.debounce_ms = debounce_ms
+        self.throttle_ms = throttle_ms
+        self.on = on
+
+    @property
+    def min_interval(self) -> float:
+        """Seconds the server keeps between two ``on_input`` dispatches."""
+        return (self.throttle_ms or self.debounce_ms or 0) / 1000
 
-    def render(self) -> str:
+    def _is_volatile(self) -> bool:
+        reactive = callable(self.value) or self._has_reactive_props()
+        return reactive and not self._bindings_live()
+
+    def _render(self) -> str:
         v = self.value() if callable(self.value) else self.value
-        props_str = _props_to_str(self.props)
+        props_str = _props_to_str(self.props, self.base_class)
+
+        rate = ""
+        if self.debounce_ms:
+            rate += f' data-debounce="{int(self.debounce_ms)}"'
+        if self.throttle_ms:
+            rate += f' data-throttle="{int(self.throttle_ms)}"'
+        if self.on != "input":
+            rate += f' data-on="{self.on}"'
 
         return (
             f'<input id="{self.id}" value="{v}" placeholder="{self.placeholder}" '
-            f'class="input" {props_str} data-component-id="{self.id}" />'
+            f'{props_str} data-component-id="{self.id}"{rate} />'
         )
 
 
 class Text_(Component):
+    __slots__ = ("value", "binding")
+
+    props_are_attrs = True
+
     def __init__(self, value, **props):
         super().__init__(**props)
         self.value = value
+        self.binding = None
+
+    def _is_volatile(self) -> bool:
+        # Bound callables are invalidated by the App when their States change.
+        unbound = callable(self.value) and not (self.binding and self.binding.deps)
+        return unbound or super()._is_volatile()
 
-    def render(self) -> str:
+    def _render(self) -> str:
         text = self.value() if callable(self.value) else self.value
         props_str = _props_to_str(self.props)
 
@@ -141,36 +291,169 @@ class Text_(Component):
 
 
 class Table_(Component):
-    def __init__(self, head=None, rows=None, **props):
+    """
+    DaisyUI table.
+
+    With ``virtual=True`` only the rows inside the scroll viewport (plus
+    ``overscan`` rows on each side) are rendered. The client reports its
+    scroll position with ``viewport`` messages and receives just the rows
+    it needs in ``table_rows`` replies, reusing its row nodes.
+
+    Rows come either from ``rows`` (a list of row sequences) or from a
+    ``ColumnarSource``. A bound source pushes appended rows and changed
+    cells to the client as incremental ``append_rows`` / ``update_cells``
+    messages instead of re-rendering the table.
+    """
+
+    __slots__ = (
+        "head",
+        "rows",
+        "source",
+        "virtual",
+        "row_height",
+        "viewport_height",
+        "overscan",
+    )
+
+    props_are_attrs = True
+    base_class = "table"
+    MAX_WINDOW = 1000
+    FORMAT_CHUNK = 1000
+
+    def __init__(
+        self,
+        head=None,
+        rows=None,
+        virtual: bool = False,
+        row_height: int = 40,
+        viewport_height: int = 480,
+        overscan: int = 10,
+        source=None,
+        **props,
+    ):
         super().__init__(**props)
-        self.head = head or []
+        self.source = source
+        self.head = head or (list(source.names) if source is not None else [])
         self.rows = rows or []
+        self.virtual = virtual
+        self.row_height = row_height
+        self.viewport_height = viewport_height
+        self.overscan = overscan
+
+    def _render(self) -> str:
+        return "".join(self._iter_render())
+
+    def _thead(self) -> str:
+        if not self.head:
+            return ""
+        ths = "".join(f"<th>{c}</th>" for c in self.head)
+        return f"<thead><tr><th></th>{ths}</tr></thead>"
+
+    def _total(self) -> int:
+        return len(self.source) if self.source is not None else len(self.rows)
+
+    def _iter_rows(self, start: int, stop: int):
+        """Yield rows ``start:stop``, formatting source rows a chunk at a time."""
+        if self.source is None:
+            yield from self.rows[start:stop]
+            return
+        step = self.FORMAT_CHUNK
+        for lo in range(start, stop, step):
+            yield from self.source.format_rows(lo, min(lo + step, stop))
+
+    def _iter_render(self):
+        if self.virtual:
+            yield from self._iter_virtual()
+            return
+
+        props_str = _props_to_str(self.props, self.base_class)
+
+        yield (
+            f'<div class="overflow-x-auto">'
+            f'  <table id="{self.id}" {props_str} data-component-id="{self.id}">'
+            f"    {self._thead()}"
+            f"    <tbody>"
+        )
 
-    def render(self) -> str:
-        props_str = _props_to_str(self.props)
-
-        thead = ""
-        if self.head:
-            ths = "".join(f"<th>{c}</th>" for c in self.head)
-            thead = f"<thead><tr><th></th>{ths}</tr></thead>"
+        rows = self._iter_rows(0, self._total())
+        for i, row in enumerate(rows, start=1):
+            tds = "".join(f"<td>{c}</td>" for c in row)
+            yield f"<tr><th>{i}</th>{tds}</tr>"
+
+        yield "</tbody>  </table></div>"
+
+    def _iter_virtual(self):
+        props_str = _props_to_str(self.props, self.base_class)
+        total = self._total()
+        rh = self.row_height
+        count = min(total, -(-self.viewport_height // rh) + self.overscan)
+
+        yield (
+            f'<div class="overflow-auto" style="height: {self.viewport_height}px" '
+            f'data-virtual-table="{self.id}" data-row-height="{rh}" '
+            f'data-overscan="{self.overscan}">'
+            f'<table id="{self.id}" {props_str} data-component-id="{self.id}">'
+            f"{self._thead()}"
+            f'<tbody data-total="{total}">'
+            f'<tr data-spacer="top" style="height: 0px"></tr>'
+        )
 
-        rows_html = []
-        for i, row in enumerate(self.rows, start=1):
+        for i, row in enumerate(self._iter_rows(0, count), start=1):
             tds = "".join(f"<td>{c}</td>" for c in row)
-            rows_html.append(f"<tr><th>{i}</th>{tds}</tr>")
-        tbody = "<tbody>" + "".join(rows_html) + "</tbody>"
+            yield f'<tr style="height: {rh}px"><th>{i}</th>{tds}</tr>'
 
-        return (
-            f'<div class="overflow-x-auto">'
-            f'  <table id="{self.id}" {props_str} class="table" data-component-id="{self.id}">'
-            f"    {thead}"
-            f"    {tbody}"
-            f"  </table>"
-            f"</div>"
+        yield (
+            f'<tr data-spacer="bottom" style="height: {(total - count) * rh}px"></tr>'
+            f"</tbody></table></div>"
         )
 
+    def window(self, first: int, count: int) -> dict:
+        """
+        Build the ``table_rows`` message for a row range.
+
+        Parameters:
+            first (int): Index of the first requested row.
+            count (int): Number of requested rows.
+
+        Returns:
+            dict: Message with the formatted cells of the clamped range.
+        """
+        total = self._total()
+        count = max(0, min(count, self.MAX_WINDOW, total))
+        start = max(0, min(first, total - count))
+        if self.source is not None:
+            rows = self.source.format_rows(start, start + count)
+        else:
+            rows = [[str(c) for c in row] for row in self.rows[start : start + count]]
+        return {
+            "type": "table_rows",
+            "id": self.id,
+            "start": start,
+            "total": total,
+            "rows": rows,
+        }
+
+    def on_viewport(self, event) -> dict:
+        return self.window(event.first, event.count)
+
+    def on_mount(self) -> None:
+        if self.source is not None:
+            self.watch(self.source, self._on_source_change)
+
+    def _on_source_change(self, change: dict) -> None:
+        """Forward a ``ColumnarSource`` change to the client as a row delta."""
+        self.invalidate()
+        if not self.app:
+            return
+        self.app._vdom.invalidate(self.id)
+        self.app._enqueue({**change, "id": self.id})
+
 
 class Image_(Component):
+    __slots__ = ("src", "alt", "width", "height")
+
+    props_are_attrs = True
+
     def __init__(self, src, alt="", width=None, height=None, **props):
         super().__init__(**props)
 
@@ -186,7 +469,7 @@ class Image_(Component):
         self.width = width
         self.height = height
 
-    def render(self) -> str:
+    def _render(self) -> str:
         props_str = _props_to_str(self.props)
 
         attr_parts = [f'src="{self.src}"', f'alt="{self.alt}"']
@@ -214,8 +497,24 @@ def Text(value, style: str | None = None, **props):
     return Text_(value, style=style, **props)
 
 
-def Input(value="", placeholder="", style: str | None = None, **props):
-    return Input_(value, placeholder=placeholder, style=style, **props)
+def Input(
+    value="",
+    placeholder="",
+    style: str | None = None,
+    debounce_ms: int | None = None,
+    throttle_ms: int | None = None,
+    on: str = "input",
+    **props,
+):
+    return Input_(
+        value,
+        placeholder=placeholder,
+        style=style,
+        debounce_ms=debounce_ms,
+        throttle_ms=throttle_ms,
+        on=on,
+        **props,
+    )
 
 
 def Table(head=None, rows=None, style: str | None = None, **props):
@@ -1,10 +1,99 @@
 from __future__ import annotations
 
-from uuid import uuid4
-from typing import Any, Dict, Type
+import re
+from html import escape
+from string import Formatter
+from typing import Any, Dict, Iterator, List, Type, Union
 from .component import Component as BaseComponent
 
 
+_SLOT_RE = re.compile(r"<children />|<slot />")
+_formatter = Formatter()
+
+
+class Markup(str):
+    """
+    A string that is inserted into templates as-is, without HTML escaping.
+
+    Example:
+        >>> Card(title=Markup("<em>Hello</em>"))
+    """
+
+
+class _Children:
+    __slots__ = ()
+
+
+_CHILDREN = _Children()
+
+
+class _Field:
+    """A ``{prop}`` placeholder of a precompiled template."""
+
+    __slots__ = ("name", "simple", "conversion", "spec")
+
+    def __init__(self, name: str, conversion: str | None, spec: str) -> None:
+        self.name = name
+        self.simple = name.isidentifier()
+        self.conversion = conversion
+        self.spec = spec
+
+    def render(self, props: Dict[str, Any]) -> str:
+        if self.simple:
+            value = props[self.name]
+        else:
+            value, _ = _formatter.get_field(self.name, (), props)
+
+        if isinstance(value, BaseComponent):
+            return value.render()
+
+        if self.conversion:
+            value = _formatter.convert_field(value, self.conversion)
+
+        if self.spec:
+            spec = self.spec
+            if "{" in spec:
+                spec = _formatter.vformat(spec, (), props)
+            text = format(value, spec)
+        else:
+            text = value if isinstance(value, str) else str(value)
+
+        if isinstance(value, Markup):
+            return text
+        return escape(text)
+
+
+_Piece = Union[str, _Field, _Children]
+
+
+def _compile(template: str) -> List[_Piece]:
+    """
+    Split a template into literal segments, prop fields and children slots.
+    """
+    pieces: List[_Piece] = []
+
+    def add_literal(text: str) -> None:
+        if not text:
+            return
+        if pieces and isinstance(pieces[-1], str):
+            pieces[-1] += text
+        else:
+            pieces.append(text)
+
+    for literal, field, spec, conversion in _formatter.parse(template):
+        pos = 0
+        for match in _SLOT_RE.finditer(literal):
+            add_literal(literal[pos : match.start()])
+            pieces.append(_CHILDREN)
+            pos = match.end()
+        add_literal(literal[pos:])
+
+        if field is not None:
+            pieces.append(_Field(field, conversion, spec or ""))
+
+    return pieces
+
+
 def Component(template: str) -> Type[BaseComponent]:
     """
     Factory function that creates a custom template-based UI component.
@@ -13,6 +102,10 @@ def Component(template: str) -> Type[BaseComponent]:
     The template may contain placeholders such as ``{prop}`` and a
     ``<children />`` or ``<slot />`` marker where child components will be injected.
 
+    The template is compiled once, when the class is created. Prop values are
+    HTML-escaped; wrap trusted HTML in ``Markup`` to insert it as-is.
+    Components passed as props are rendered in place.
+
     Example:
         >>> Card = Component(\"\"\"
         ...     <div class='card'>
@@ -30,32 +123,44 @@ def Component(template: str) -> Type[BaseComponent]:
         Type[BaseComponent]: A dynamically created subclass of ``Component``.
     """
 
+    pieces = _compile(template)
+
     class TemplateComponent(BaseComponent):
         """Dynamically generated UI component based on a template."""
 
+        __slots__ = ("template_props",)
+
         def __init__(
             self, *children: BaseComponent, id: str | None = None, **props: Any
         ) -> None:
             super().__init__(id=id, children=list(children), **props)
 
-            self.template_props: Dict[str, Any] = props
-
-            if self.id is None:
-                self.id = f"cmp_{uuid4().hex[:8]}"
+            self.template_props: Dict[str, Any] = self.props
 
-        def render(self) -> str:
+        def _render(self) -> str:
             """
-            Renders the component by injecting props and child components into the template.
+            Renders the component by joining the precompiled template pieces.
 
             Returns:
                 str: Rendered HTML string.
             """
-            children_html = "".join(child.render() for child in self.children)
-
-            html = template.format(**self.template_props)
-
-            html = html.replace("<children />", children_html)
-            html = html.replace("<slot />", children_html)
+            props = self.template_props
+            children_html = None
+            parts = []
+
+            for piece in pieces:
+                if type(piece) is str:
+                    parts.append(piece)
+                elif piece is _CHILDREN:
+                    if children_html is None:
+                        children_html = "".join(
+                            child.render() for child in self.children
+                        )
+                    parts.append(children_html)
+                else:
+                    parts.append(piece.render(props))  # type: ignore[union-attr]
+
+            html = "".join(parts)
 
             return f"""
 <div id="{self.id}" data-component-id="{self.id}">
@@ -63,4 +168,23 @@ def Component(template: str) -> Type[BaseComponent]:
 </div>
 """
 
+        def _iter_render(self) -> Iterator[str]:
+            props = self.template_props
+
+            yield f"""
+<div id="{self.id}" data-component-id="{self.id}">
+    """
+            for piece in pieces:
+                if type(piece) is str:
+                    yield piece
+                elif piece is _CHILDREN:
+                    yield from self._iter_children()
+                else:
+                    yield piece.render(props)  # type: ignore[union-attr]
+            yield """
+</div>
+"""
+
+    TemplateComponent.template = template  # type: ignore[attr-defined]
+
     return TemplateComponent
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
 from .component import Component
+from .elements import _props_to_str
 
 
-def _props_to_str(props: dict[str, Any]) -> str:
-    return " ".join(f'{k}="{v}"' for k, v in props.items())
+class _Box(Component):
+    """Shared ``<div>`` rendering of the layout containers."""
 
+    __slots__ = ()
 
-class HStack(Component):
+    props_are_attrs = True
+
+    def _open_tag(self) -> str:
+        props = _props_to_str(self.props)
+        return f'<div id="{self.id}" {props} data-component-id="{self.id}">'
+
+    def _render(self) -> str:
+        children_html = super()._render()
+        return f"{self._open_tag()}{children_html}</div>"
+
+    def _iter_render(self) -> Iterator[str]:
+        yield self._open_tag()
+        yield from self._iter_children()
+        yield "</div>"
+
+
+class HStack(_Box):
     """
     A horizontal layout container that arranges child components in a row.
 
@@ -16,19 +34,14 @@ class HStack(Component):
         flex flex-row gap-2
     """
 
+    __slots__ = ()
+
     def __init__(self, *children: Component, **props: Any) -> None:
         props.setdefault("class", "flex flex-row gap-2")
         super().__init__(children=list(children), **props)
 
-    def render(self) -> str:
-        children_html = super().render()
-        props = _props_to_str(self.props)
-        id_attr = f'id="{self.id}"' if self.id else ""
-        data_attr = f'data-component-id="{self.id}"' if self.id else ""
-        return f"<div {id_attr} {props} {data_attr}>{children_html}</div>"
-
 
-class VStack(Component):
+class VStack(_Box):
     """
     A vertical layout container that arranges child components in a column.
 
@@ -36,19 +49,14 @@ class VStack(Component):
         flex flex-col gap-2
     """
 
+    __slots__ = ()
+
     def __init__(self, *children: Component, **props: Any) -> None:
         props.setdefault("class", "flex flex-col gap-2")
         super().__init__(children=list(children), **props)
 
-    def render(self) -> str:
-        children_html = super().render()
-        props = _props_to_str(self.props)
-        id_attr = f'id="{self.id}"' if self.id else ""
-        data_attr = f'data-component-id="{self.id}"' if self.id else ""
-        return f"<div {id_attr} {props} {data_attr}>{children_html}</div>"
-
 
-class Center(Component):
+class Center(_Box):
     """
     A layout container that centers its content both vertically and horizontally.
 
@@ -56,18 +64,14 @@ class Center(Component):
         flex justify-center items-center
     """
 
+    __slots__ = ()
+
     def __init__(self, *children: Component, **props: Any) -> None:
         props.setdefault("class", "flex justify-center items-center")
         super().__init__(children=list(children), **props)
 
-    def render(self) -> str:
-        children_html = super().render()
-        props = _props_to_str(self.props)
-        id_attr = f'id="{self.id}"' if self.id else ""
-        return f'<div {id_attr} {props} data-component-id="{self.id}">{children_html}</div>'
-
 
-class Container(Component):
+class Container(_Box):
     """
     A padded container used for page sections or structured blocks.
 
@@ -75,18 +79,14 @@ class Container(Component):
         p-4
     """
 
+    __slots__ = ()
+
     def __init__(self, *children: Component, **props: Any) -> None:
         props.setdefault("class", "p-4")
         super().__init__(children=list(children), **props)
 
-    def render(self) -> str:
-        children_html = super().render()
-        props = _props_to_str(self.props)
-        id_attr = f'id="{self.id}"' if self.id else ""
-        return f'<div {id_attr} {props} data-component-id="{self.id}">{children_html}</div>'
-
 
-class Scroll(Component):
+class Scroll(_Box):
     """
     A scrollable container with a max height constraint.
 
@@ -94,18 +94,14 @@ class Scroll(Component):
         overflow-auto max-h-full
     """
 
+    __slots__ = ()
+
     def __init__(self, *children: Component, **props: Any) -> None:
         props.setdefault("class", "overflow-auto max-h-full")
         super().__init__(children=list(children), **props)
 
-    def render(self) -> str:
-        children_html = super().render()
-        props = _props_to_str(self.props)
-        id_attr = f'id="{self.id}"' if self.id else ""
-        return f'<div {id_attr} {props} data-component-id="{self.id}">{children_html}</div>'
-
 
-class Spacer(Component):
+class Spacer(_Box):
     """
     A flexible layout element that expands to fill available space.
 
@@ -113,12 +109,8 @@ class Spacer(Component):
         flex-grow
     """
 
+    __slots__ = ()
+
     def __init__(self, **props: Any) -> None:
         props.setdefault("class", "flex-grow")
         super().__init__(children=[], **props)
-
-    def render(self) -> str:
-        props = _props_to_str(self.props)
-        id_attr = f'id="{self.id}"' if self.id else ""
-        data_attr = f'data-component-id="{self.id}"' if self.id else ""
-        return f"<div {id_attr} {props} {data_attr}></div>"
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from html import escape
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence
+
+from ..state import _not_equal
+from .component import Component
+from .elements import _props_to_str
+
+
+def _lis(seq: Sequence[int]) -> set[int]:
+    """
+    Return the positions of one longest strictly increasing subsequence.
+
+    Parameters:
+        seq (Sequence[int]): Values, ``-1`` entries are skipped.
+
+    Returns:
+        set[int]: Indexes into ``seq`` that are part of the subsequence.
+    """
+    tails: List[int] = []
+    prev = [-1] * len(seq)
+
+    for i, value in enumerate(seq):
+        if value < 0:
+            continue
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if seq[tails[mid]] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo:
+            prev[i] = tails[lo - 1]
+        if lo == len(tails):
+            tails.append(i)
+        else:
+            tails[lo] = i
+
+    result = set()
+    i = tails[-1] if tails else -1
+    while i >= 0:
+        result.add(i)
+        i = prev[i]
+    return result
+
+
+def reconcile(old_keys: Sequence[str], new_keys: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Compute the keyed list operations turning ``old_keys`` into ``new_keys``.
+
+    Removed keys are dropped first. The new order is then built from the end,
+    so every ``before`` anchor is already in place when an operation refers
+    to it. Items on the longest increasing run of old positions never move.
+
+    Parameters:
+        old_keys (Sequence[str]): Keys currently rendered, in order.
+        new_keys (Sequence[str]): Keys to render, in order.
+
+    Returns:
+        list[dict]: ``remove`` / ``insert`` / ``move`` operations. ``before``
+        is the key of the following item, or ``None`` to append.
+    """
+    old_index = {key: i for i, key in enumerate(old_keys)}
+    new_set = set(new_keys)
+
+    ops: List[Dict[str, Any]] = [
+        {"op": "remove", "key": key} for key in old_keys if key not in new_set
+    ]
+
+    positions = [old_index.get(key, -1) for key in new_keys]
+    stable = _lis(positions)
+
+    for i in range(len(new_keys) - 1, -1, -1):
+        key = new_keys[i]
+        before = new_keys[i + 1] if i + 1 < len(new_keys) else None
+        if positions[i] < 0:
+            ops.append({"op": "insert", "key": key, "before": before})
+        elif i not in stable:
+            ops.append({"op": "move", "key": key, "before": before})
+
+    return ops
+
+
+class For_(Component):
+    """
+    Keyed list bound to a ``State`` holding a sequence.
+
+    Each item is rendered once by ``render_item`` and kept by its key. When
+    the State changes, only the operations needed to reach the new order are
+    sent in a ``list_ops`` message; unchanged item nodes are left alone on
+    the client.
+
+    An item whose key survives but whose value changed (e.g. an edited copy
+    set into a plain ``State`` list) is rendered again and replaced.
+
+    With a ``ListState`` the change records of its mutations are turned into
+    operations directly, without comparing the old and new key lists.
+
+    Items are wrapped in ``<div data-key="..." style="display: contents">``
+    so the client can find them without touching their markup.
+    """
+
+    __slots__ = ("items", "render_item", "key", "_by_key", "_keys", "_items")
+
+    props_are_attrs = True
+
+    def __init__(
+        self,
+        items,
+        render_item: Callable[[Any], Component],
+        key: Optional[Callable[[Any], Hashable]] = None,
+        **props,
+    ):
+        super().__init__(**props)
+        self.items = items
+        self.render_item = render_item
+        self.key = key
+        self._by_key: Dict[str, Component] = {}
+        self._items: Dict[str, Any] = {}
+        self._keys: List[str] = []
+        self._sync(self._current())
+
+    def on_mount(self) -> None:
+        items = self.items
+        if hasattr(items, "observe"):
+            items.observe(self._on_changes)
+            self.add_cleanup(lambda: items.unobserve(self._on_changes))
+        elif hasattr(items, "subscribe"):
+            self.watch(items, self._on_items_change)
+
+    def _current(self) -> List[Any]:
+        return list(self.items() if callable(self.items) else self.items)
+
+    def _key_of(self, item: Any) -> str:
+        return str(self.key(item) if self.key else item)
+
+    def _sync(self, items: List[Any]) -> tuple[List[Component], List[str]]:
+        """
+        Rebuild the key order and item components.
+        Components of removed keys, and of kept keys whose item changed, are
+        unmounted.
+
+        Returns:
+            tuple: The new components and the kept keys rendered again.
+        """
+        keys = [self._key_of(item) for item in items]
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"For: duplicate keys in {keys!r}")
+
+        created: List[Component] = []
+        changed: List[str] = []
+        by_key: Dict[str, Component] = {}
+        for key, item in zip(keys, items):
+            child = self._by_key.pop(key, None)
+            if child is not None and _not_equal(self._items[key], item):
+                child._unmount()
+                changed.append(key)
+                child = None
+            if child is None:
+                child = self.render_item(item)
+                created.append(child)
+            by_key[key] = child
+
+        for removed in self._by_key.values():
+            removed._unmount()
+
+        self._by_key = by_key
+        self._items = dict(zip(keys, items))
+        self._keys = keys
+        self.children = [by_key[key] for key in keys]
+        return created, changed
+
+    def _open_tag(self) -> str:
+        props_str = _props_to_str(self.props)
+        return f'<div id="{self.id}" {props_str} data-component-id="{self.id}">'
+
+    @staticmethod
+    def _wrap(key: str, html: str) -> str:
+        return f'<div data-key="{escape(key)}" style="display: contents">{html}</div>'
+
+    def _render(self) -> str:
+        return "".join(self._iter_render())
+
+    def _iter_render(self) -> Iterator[str]:
+        yield self._open_tag()
+        for key in self._keys:
+            yield self._wrap(key, self._by_key[key].render())
+        yield "</div>"
+
+    def _on_items_change(self, _value: Any, items: Optional[List[Any]] = None) -> None:
+        old_keys = self._keys
+        created, changed = self._sync(self._current() if items is None else items)
+        # Changed items are removed and inserted again at their new place.
+        ops: List[Dict[str, Any]] = [{"op": "remove", "key": key} for key in changed]
+        replaced = set(changed)
+        ops += reconcile([k for k in old_keys if k not in replaced], self._keys)
+        for op in ops:
+            if op["op"] == "insert":
+                op["child"] = self._by_key[op["key"]]
+        self._send_ops(ops, created)
+
+    def _on_changes(self, changes: List[Dict[str, Any]]) -> None:
+        """
+        Apply ``ListState`` change records without re-keying the whole list.
+        """
+        if changes[0]["op"] == "reset":
+            # The copy in the record, not the live list: later mutations
+            # from worker threads arrive as records of their own.
+            self._on_items_change(None, list(changes[0]["value"]))
+            return
+
+        # Check every record before touching anything: a duplicate key must
+        # not leave the list half updated.
+        keys = list(self._keys)
+        live = set(keys)
+        plan: List[tuple[str, str, Any, Optional[str]]] = []
+        for change in changes:
+            index = change["index"]
+            if change["op"] in ("remove", "replace"):
+                count = change.get("count", 1)
+                for key in keys[index : index + count]:
+                    plan.append(("remove", key, None, None))
+                    live.discard(key)
+                del keys[index : index + count]
+            if change["op"] == "remove":
+                continue
+
+            items = change["items"] if change["op"] == "insert" else [change["value"]]
+            before = keys[index] if index < len(keys) else None
+            new_keys = [self._key_of(item) for item in items]
+            for key, item in zip(new_keys, items):
+                if key in live:
+                    raise ValueError(f"For: duplicate key {key!r}")
+                live.add(key)
+                plan.append(("insert", key, item, before))
+            keys[index:index] = new_keys
+
+        ops: List[Dict[str, Any]] = []
+        created: List[Component] = []
+        for op, key, item, before in plan:
+            if op == "remove":
+                ops.append({"op": "remove", "key": key})
+                self._by_key.pop(key)._unmount()
+                del self._items[key]
+                continue
+            child = self._by_key[key] = self.render_item(item)
+            self._items[key] = item
+            created.append(child)
+            ops.append({"op": "insert", "key": key, "before": before, "child": child})
+
+        self._keys = keys
+        self.children = [self._by_key[key] for key in keys]
+        self._send_ops(ops, created)
+
+    def _send_ops(self, ops: List[Dict[str, Any]], created: List[Component]) -> None:
+        """Bind new item components and send the ``list_ops`` message."""
+        if not self.app or not ops:
+            for op in ops:
+                op.pop("child", None)
+            return
+
+        live = {id(child) for child in self._by_key.values()}
+        for child in created:
+            if id(child) in live:
+                self.app._bind_events_and_states(child)
+        for op in ops:
+            child = op.pop("child", None)
+            if child is not None:
+                op["html"] = self._wrap(op["key"], child.render())
+
+        self.app._vdom.invalidate(self.id)
+        self.app._enqueue({"type": "list_ops", "id": self.id, "ops": ops})
+
+
+def For(items, render_item, key=None, style: str | None = None, **props):
+    return For_(items, render_item, key=key, style=style, **props)
+
+
+Each = For
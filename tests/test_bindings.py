@@ -0,0 +1,75 @@
+import pytest
+
+from taupy.app import App
+from taupy.state import State
+from taupy.widgets.elements import Button_, Div_, Input_, Modal_
+
+
+@pytest.fixture
+def app():
+    app = App("Test", 800, 600)
+    app.root_component = Div_()
+    sent = []
+    app._enqueue = sent.append  # type: ignore[method-assign]
+    app.sent = sent  # type: ignore[attr-defined]
+    return app
+
+
+def test_reactive_props_render_current_values():
+    busy = State(True)
+    b = Button_("Save", classes={"loading": busy}, disabled=busy)
+    html = b.render()
+    assert 'class="btn loading"' in html
+    assert " disabled " in html
+
+    busy.set(False)
+    html = b.render()
+    assert 'class="btn"' in html
+    assert "disabled" not in html
+
+
+def test_bound_props_send_targeted_messages(app):
+    busy = State(False)
+    name = State("a")
+    button = Button_("Save", id="b", disabled=busy, classes={"hidden": busy})
+    field = Input_(name, id="f")
+    app._bind_events_and_states(Div_(children=[button, field]))
+    button.render()
+
+    busy.set(True)
+    name.set("b")
+
+    assert app.sent == [
+        {"type": "set_attr", "id": "b", "name": "disabled", "value": ""},
+        {"type": "toggle_class", "id": "b", "name": "hidden", "on": True},
+        {"type": "set_value", "id": "f", "value": "b"},
+    ]
+    assert button._html is None
+    assert "disabled" in button.render()
+
+
+def test_modal_toggles_checked_attribute(app):
+    is_open = State(False)
+    modal = Modal_(is_open, id="m")
+    app._bind_events_and_states(modal)
+
+    is_open.set(True)
+    assert app.sent == [{"type": "set_attr", "id": "m", "name": "checked", "value": ""}]
+
+
+def test_callable_handler_props_are_not_invoked(app):
+    calls = []
+
+    def increment():
+        calls.append(1)
+
+    async def save():
+        calls.append(2)
+
+    b = Button_("Click me", on_click=increment, on_save=save)
+    app._bind_events_and_states(b)
+    html = b.render()
+
+    assert calls == []
+    assert b._bindings is None
+    assert "on_click" not in html and "coroutine" not in html
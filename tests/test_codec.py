@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from taupy.app import App
+from taupy.codec import CODECS, EncodedCache, get_codec
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_codecs_round_trip(name):
+    codec = get_codec(name)
+    msg = {"type": "update_text", "id": "tau_1", "value": "é <b>", "n": [1, 2.5]}
+
+    assert json.loads(codec.dumps(msg)) == msg
+    assert codec.loads(codec.dumps(msg)) == msg
+    assert json.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
+
+
+def test_batch_frame_reuses_encoded_messages():
+    cache = EncodedCache(get_codec())
+    a = {"type": "update_text", "id": "a", "value": "1"}
+    b = {"type": "list_ops", "id": "l", "ops": []}
+
+    frame = cache.frame([a, b])
+    assert json.loads(frame) == {"type": "batch", "messages": [a, b]}
+    assert cache.frame([a, b]) is frame
+    assert (cache.frame_hits, cache.misses) == (1, 2)
+    cache.frame([b, a])
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+class TextSocket:
+    open = True
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, payload):
+        self.sent.append(payload)
+
+    async def close(self):
+        self.open = False
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_for_all_clients():
+    server = App("Test", 800, 600).server
+    clients = [TextSocket() for _ in range(3)]
+    server.clients.update(clients)
+
+    await server.broadcast({"type": "update_text", "id": "a", "value": "x"})
+    await server.flush()
+
+    assert server._encoded.misses == 1
+    assert len({c.sent[0] for c in clients}) == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_frame_is_built_once():
+    server = App("Test", 800, 600).server
+    clients = [TextSocket() for _ in range(3)]
+    server.clients.update(clients)
+
+    await server.broadcast({"type": "update_text", "id": "a", "value": "x"})
+    await server.broadcast({"type": "update_text", "id": "b", "value": "y"})
+    await server.flush()
+
+    assert server._encoded.frame_hits == 2
+    assert clients[0].sent[0] is clients[2].sent[0]
@@ -1,4 +1,4 @@
-from taupy.widgets.elements import Text_, Button_, Input_
+from taupy.widgets.elements import Text_, Button_, Input_, Table_
 
 
 def test_text_static():
@@ -25,3 +25,34 @@ def test_input_render():
     html = i.render()
     assert 'value="test"' in html
     assert 'placeholder="Enter"' in html
+    assert "data-debounce" not in html and "data-on" not in html
+
+
+def test_input_rate_limit_attributes():
+    i = Input_("", debounce_ms=300, on="change")
+    html = i.render()
+    assert 'data-debounce="300"' in html
+    assert 'data-on="change"' in html
+    assert i.min_interval == 0.3
+    assert Input_("", throttle_ms=100).min_interval == 0.1
+
+
+def test_virtual_table_renders_window():
+    rows = [[i, f"row {i}"] for i in range(10_000)]
+    t = Table_(head=["n", "label"], rows=rows, virtual=True, row_height=20)
+    html = t.render()
+
+    assert "row 0" in html
+    assert "row 100" not in html
+    assert f'data-total="{len(rows)}"' in html
+
+
+def test_virtual_table_window_message():
+    rows = [[i] for i in range(50)]
+    t = Table_(rows=rows, virtual=True)
+
+    msg = t.window(45, 10)
+    assert msg["start"] == 40
+    assert msg["total"] == 50
+    assert msg["rows"][0] == ["40"]
+    assert len(msg["rows"]) == 10
@@ -0,0 +1,58 @@
+import sys
+
+import pytest
+import websockets
+
+from taupy.app import App
+from taupy.config import load_server_config
+
+SMALL = '{"type": "update_text", "id": "tau_1", "value": "1"}'
+LARGE = '<div class="flex flex-col gap-2 p-4">item</div>' * 200
+
+
+@pytest.mark.asyncio
+async def test_only_messages_above_threshold_are_compressed():
+    server = App("Test", 800, 600, compression_threshold=512).server
+
+    async def handler(ws):
+        await ws.send(SMALL)
+        await ws.send(LARGE)
+        await ws.wait_closed()
+
+    async with websockets.serve(
+        handler, "localhost", 0, **server.serve_options()
+    ) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        async with websockets.connect(f"ws://localhost:{port}") as client:
+            assert await client.recv() == SMALL
+            assert await client.recv() == LARGE
+
+    stats = server.compression_stats
+    assert (stats.messages, stats.compressed) == (2, 1)
+    assert stats.bytes_in == len(SMALL) + len(LARGE)
+    assert stats.ratio < 0.1
+
+
+def test_server_config_from_toml(tmp_path, monkeypatch):
+    (tmp_path / "taupy.toml").write_text(
+        "[server]\ncompression = false\ncompression_threshold = 64\n"
+    )
+    assert load_server_config(str(tmp_path)) == {
+        "compression": False,
+        "compression_threshold": 64,
+    }
+
+    monkeypatch.setattr("sys.argv", [str(tmp_path / "main.py")])
+    monkeypatch.delenv("TAUPY_WS_COMPRESSION", raising=False)
+    server = App("Test", 800, 600).server
+    assert not server.compression
+    assert server.compression_threshold == 64
+    assert server.serve_options()["extensions"] is None
+
+
+def test_server_config_without_tomllib(tmp_path, monkeypatch):
+    (tmp_path / "taupy.toml").write_text("[server]\ncompression = false\n")
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+
+    assert load_server_config(str(tmp_path)) == {}
@@ -0,0 +1,93 @@
+import pytest
+
+from taupy.widgets import datasource
+from taupy.widgets.datasource import ColumnarSource
+from taupy.widgets.elements import Table_
+
+
+def make_source():
+    return ColumnarSource(
+        {"t": [0.0, 0.5, 1.0], "n": [1, 2, 3]},
+        formats={"t": "%.1f"},
+    )
+
+
+def test_format_rows_is_row_major():
+    source = make_source()
+
+    assert len(source) == 3
+    assert source.format_rows(1, 3) == [["0.5", "2"], ["1.0", "3"]]
+
+
+def test_append_and_update_notify_deltas():
+    source = make_source()
+    changes = []
+    source.subscribe(changes.append)
+
+    source.append_rows([(1.5, 4), (2.0, 5)])
+    source.update_cell(0, "n", 10)
+
+    assert changes[0] == {
+        "type": "append_rows",
+        "start": 3,
+        "total": 5,
+        "rows": [["1.5", "4"], ["2.0", "5"]],
+    }
+    assert changes[1] == {"type": "update_cells", "cells": [[0, 1, "10"]]}
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "array":
+        monkeypatch.setattr(datasource, "np", None)
+    elif datasource.np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+def test_columns_widen_instead_of_converting(backend):
+    source = make_source()
+    source.append_rows([(1.5, 4)])
+    source.update_cell(3, "n", "x")
+
+    assert source.format_rows(2, 4) == [["1.0", "3"], ["1.5", "x"]]
+
+    source = ColumnarSource({"n": [1, 2]})
+    source.append_rows([(1.5,)])
+    assert source.format_rows(0, 3) == [["1.0"], ["2.0"], ["1.5"]]
+
+
+def test_invalid_rows_change_no_column(backend):
+    source = make_source()
+
+    with pytest.raises(ValueError):
+        source.append_rows([(1.5, 4), (2.0,)])
+    with pytest.raises(IndexError):
+        source.update_cells([(0, "n", 7), (9, "n", 8)])
+
+    assert len(source) == 3
+    assert [len(source.column(name)) for name in source.names] == [3, 3]
+    assert source.format_rows(0, 1) == [["0.0", "1"]]
+
+
+def test_table_renders_and_windows_from_source():
+    source = make_source()
+    table = Table_(source=source, virtual=True, viewport_height=40, overscan=1)
+    html = table.render()
+
+    assert "<th>t</th><th>n</th>" in html
+    assert "<td>0.0</td><td>1</td>" in html
+    assert table.window(2, 5)["rows"] == [["0.0", "1"], ["0.5", "2"], ["1.0", "3"]]
+
+
+def test_columns_must_have_equal_length():
+    with pytest.raises(ValueError):
+        ColumnarSource({"a": [1, 2], "b": [1]})
+
+
+def test_empty_columns_adopt_the_first_values(backend):
+    source = ColumnarSource({"n": [], "v": []})
+    source.append_rows([(1, 2)])
+    source.append_rows([(3, 4.5)])
+
+    assert source.format_rows(0, 2) == [["1", "2.0"], ["3", "4.5"]]
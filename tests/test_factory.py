@@ -0,0 +1,33 @@
+from taupy.widgets.elements import Text_
+from taupy.widgets.factory import Component, Markup
+
+
+Card = Component(
+    "<div class='card'><h2>{title}</h2><p>{count:03d}</p><children /></div>"
+)
+
+
+def test_template_props_and_children():
+    card = Card(Text_("body"), title="Hello", count=7)
+    html = card.render()
+
+    assert "<h2>Hello</h2>" in html
+    assert "<p>007</p>" in html
+    assert ">body</span></div>" in html
+
+
+def test_template_escapes_props():
+    html = Card(title="<script>x</script>", count=1).render()
+    assert "&lt;script&gt;" in html
+    assert "<script>" not in html
+
+
+def test_template_markup_is_not_escaped():
+    html = Card(title=Markup("<em>hi</em>"), count=1).render()
+    assert "<h2><em>hi</em></h2>" in html
+
+
+def test_slot_marker_and_braces():
+    Box = Component("<section>{{x}} <slot /></section>")
+    html = Box(Text_("in")).render()
+    assert "<section>{x} <span" in html
@@ -0,0 +1,64 @@
+import pytest
+
+from taupy.app import App
+from taupy.state import State
+from taupy.widgets.component import Component
+from taupy.widgets.elements import Div_, Input_, Modal_, Text_
+from taupy.widgets.layout import VStack
+
+
+class Probe(Component):
+    def __init__(self, log, **props):
+        super().__init__(**props)
+        self.log = log
+
+    def on_mount(self):
+        self.log.append(("mount", self.id))
+
+    def on_unmount(self):
+        self.log.append(("unmount", self.id))
+
+
+@pytest.mark.asyncio
+async def test_navigate_releases_previous_screen():
+    app = App("Test", 800, 600)
+    app.root_component = Div_()
+    count = State(0)
+    is_open = State(False)
+    log = []
+
+    def screen():
+        return VStack(
+            Text_(lambda: count()),
+            Modal_(is_open, content=[Text_(lambda: count() * 2)]),
+            Input_(on_input=lambda e: None),
+            Probe(log),
+        )
+
+    app.router.register("/", screen)
+    for _ in range(20):
+        await app.navigate("/")
+
+    assert len(count._subscribers) == 2
+    assert len(is_open._subscribers) == 1
+    assert len(app.dispatcher.handlers["input"]) == 1
+    assert [kind for kind, _ in log].count("unmount") == 19
+    assert log[-1][0] == "mount"
+
+
+@pytest.mark.asyncio
+async def test_navigating_to_a_cached_screen_does_not_rebind():
+    app = App("Test", 800, 600)
+    app.root_component = Div_()
+    count = State(0)
+    text = Text_(lambda: count())
+    field = Input_(value=count, on_input=lambda e: None)
+    cached = VStack(text, field)
+
+    app.router.register("/", lambda: cached)
+    for _ in range(200):
+        await app.navigate("/")
+
+    assert len(text._cleanups) == 1
+    assert len(field._cleanups) <= 2
+    assert len(count._subscribers) == 2
@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from taupy.state import ListState, State
+from taupy.widgets.elements import Text_
+from taupy.widgets.lists import For_, reconcile
+
+
+def apply_ops(keys, ops):
+    keys = list(keys)
+    for op in ops:
+        if op["op"] == "remove":
+            keys.remove(op["key"])
+            continue
+        if op["op"] == "move":
+            keys.remove(op["key"])
+        at = keys.index(op["before"]) if op["before"] is not None else len(keys)
+        keys.insert(at, op["key"])
+    return keys
+
+
+def test_reconcile_minimal_ops():
+    assert reconcile(list("abc"), list("abc")) == []
+    assert reconcile(list("abc"), list("abxc")) == [
+        {"op": "insert", "key": "x", "before": "c"}
+    ]
+    assert reconcile(list("abcd"), list("dabc")) == [
+        {"op": "move", "key": "d", "before": "a"}
+    ]
+
+
+def test_reconcile_random_orders():
+    rng = random.Random(7)
+    pool = [str(i) for i in range(30)]
+    for _ in range(200):
+        old = rng.sample(pool, rng.randint(0, 20))
+        new = rng.sample(pool, rng.randint(0, 20))
+        assert apply_ops(old, reconcile(old, new)) == new
+
+
+def test_for_keeps_item_components_by_key():
+    items = State([1, 2, 3])
+    made = []
+
+    def render_item(n):
+        made.append(n)
+        return Text_(n)
+
+    lst = For_(items, render_item)
+    lst._mount()
+    first = lst.children[0]
+    assert 'data-key="2"' in lst.render()
+
+    items.set([0, 1, 2, 3])
+
+    assert made == [1, 2, 3, 0]
+    assert lst.children[1] is first
+    assert lst.render().index('data-key="0"') < lst.render().index('data-key="1"')
+
+
+def test_for_applies_list_state_records():
+    ops = []
+
+    class RecordingFor(For_):
+        def _send_ops(self, new_ops, created):
+            ops.extend(new_ops)
+
+    items = ListState(["a", "b", "c"])
+    lst = RecordingFor(items, Text_)
+    lst._mount()
+
+    items.insert(1, "x")
+    items.pop(0)
+    items[2] = "y"
+
+    assert lst._keys == ["x", "b", "y"]
+    assert apply_ops(["a", "b", "c"], ops) == ["x", "b", "y"]
+
+
+class RecordingFor(For_):
+    def __init__(self, *args, **kwargs):
+        self.ops = []
+        super().__init__(*args, **kwargs)
+
+    def _send_ops(self, new_ops, created):
+        self.ops.extend(new_ops)
+
+
+def test_for_rerenders_edited_item_with_same_key():
+    items = State([{"id": 1, "label": "a"}, {"id": 2, "label": "b"}])
+    lst = RecordingFor(items, lambda item: Text_(item["label"]), key=lambda i: i["id"])
+    lst._mount()
+    kept = lst.children[0]
+
+    items.set([{"id": 1, "label": "a"}, {"id": 2, "label": "edited"}])
+
+    assert lst.children[0] is kept
+    assert "edited" in lst.render()
+    assert [(op["op"], op["key"]) for op in lst.ops] == [
+        ("remove", "2"),
+        ("insert", "2"),
+    ]
+
+
+def test_for_duplicate_key_in_records_changes_nothing():
+    items = ListState(["a", "b"])
+    lst = RecordingFor(items, Text_)
+    lst._mount()
+
+    with pytest.raises(ValueError):
+        lst._on_changes(
+            [
+                {"op": "remove", "index": 0, "count": 1},
+                {"op": "insert", "index": 0, "items": ["b"]},
+            ]
+        )
+
+    assert lst._keys == ["a", "b"]
+    assert list(lst._by_key) == ["a", "b"]
+    assert lst.ops == []
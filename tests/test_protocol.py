@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from taupy.app import App
+from taupy.protocol import JSON, MAX_INTERNED, Decoder, Encoder
+from taupy.server import TauServer
+
+MESSAGES = [
+    {"type": "update_text", "id": "tau_1", "value": "héllo"},
+    {"type": "set_attr", "id": "tau_1", "name": "disabled", "value": None},
+    {"type": "set_attr", "id": "tau_2", "name": "title", "value": ""},
+    {"type": "toggle_class", "id": "tau_2", "name": "hidden", "on": False},
+    {"type": "replace", "id": "root", "html": "<p>" + "x" * 300 + "</p>"},
+    {"type": "list_ops", "id": "tau_3", "ops": [{"op": "remove", "key": "a"}]},
+    {"type": "update_text", "id": "tau_4", "value": 5},
+]
+
+
+def test_round_trip_across_frames():
+    encoder, decoder = Encoder(), Decoder()
+
+    assert decoder.decode(encoder.encode(MESSAGES)) == MESSAGES
+    second = encoder.encode(MESSAGES[:1])
+    assert decoder.decode(second) == MESSAGES[:1]
+    assert len(second) < 10
+
+
+def test_intern_table_is_reset_when_full():
+    encoder, decoder = Encoder(), Decoder()
+    messages = [
+        {"type": "update_text", "id": f"tau_{i}", "value": ""}
+        for i in range(MAX_INTERNED + 10)
+    ]
+
+    assert decoder.decode(encoder.encode(messages)) == messages
+    assert len(decoder._table) == len(encoder._table) < 20
+
+
+class BinarySocket:
+    open = True
+    subprotocol = "taupy.bin1"
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, payload):
+        self.sent.append(payload)
+
+    async def close(self):
+        self.open = False
+
+
+@pytest.mark.asyncio
+async def test_binary_client_receives_binary_frames():
+    server = TauServer(App("Test", 800, 600))
+    ws = BinarySocket()
+    server.clients.add(ws)
+    server._encoders[ws] = Encoder()
+
+    await server.broadcast(MESSAGES[0])
+    await server.flush()
+
+    assert isinstance(ws.sent[0], bytes)
+    assert Decoder().decode(ws.sent[0]) == MESSAGES[:1]
+
+
+@pytest.mark.asyncio
+async def test_batch_messages_are_coalesced_and_encoded_individually():
+    server = TauServer(App("Test", 800, 600))
+    ws = BinarySocket()
+    server.clients.add(ws)
+    server._encoders[ws] = Encoder()
+    stale = {"type": "update_text", "id": "tau_1", "value": "old"}
+
+    await server.broadcast({"type": "batch", "messages": [stale] + MESSAGES[:2]})
+    await server.flush()
+
+    assert ws.sent[0][0] != JSON
+    assert Decoder().decode(ws.sent[0]) == MESSAGES[:2]
+
+
+@pytest.mark.asyncio
+async def test_binary_client_receives_large_html_streamed():
+    server = TauServer(App("Test", 800, 600))
+    server.stream_threshold = 100
+    server.stream_chunk_size = 64
+    ws = BinarySocket()
+    server.clients.add(ws)
+    server._encoders[ws] = Encoder()
+
+    for msg in MESSAGES[:2] + MESSAGES[4:5] + MESSAGES[6:]:
+        await server.broadcast(msg)
+    await server.flush()
+
+    decoder = Decoder()
+    assert decoder.decode(ws.sent[0]) == MESSAGES[:2]
+    chunks = ws.sent[1]
+    assert isinstance(chunks, list) and len(chunks) > 1
+    assert json.loads("".join(chunks)) == MESSAGES[4]
+    assert decoder.decode(ws.sent[2]) == MESSAGES[6:]
@@ -0,0 +1,65 @@
+import sys
+import textwrap
+
+import pytest
+
+from taupy.reloader import hot_swap
+from taupy.state import State, restore_states, snapshot_states
+from taupy.widgets.elements import Div_
+
+SOURCE = """
+from taupy.app import App
+from taupy.state import State
+from taupy.widgets.elements import Text_
+
+app = App("Test", 800, 600)
+count = State(0)
+theme = State("light", key="theme")
+
+
+@app.route("/")
+def home():
+    return Text_(lambda: "{label}: " + str(count()))
+"""
+
+
+def test_snapshot_restores_globals_and_keys():
+    old = {"count": State(3), "other": 1}
+    old_theme = State("dark", key="test-theme")
+    snapshot = snapshot_states(old)
+
+    new = {"count": State(0)}
+    theme = State("light", key="test-theme")
+    assert restore_states(snapshot, new) == 2
+    assert new["count"]() == 3
+    assert theme() == "dark"
+    assert old_theme() == "dark"
+
+
+@pytest.mark.asyncio
+async def test_hot_swap_keeps_state_and_app(tmp_path, monkeypatch):
+    path = tmp_path / "hmr_demo.py"
+    path.write_text(textwrap.dedent(SOURCE.replace("{label}", "Old")))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import hmr_demo
+
+    app = hmr_demo.app
+    app.root_module_name = "hmr_demo"
+    app.root_module_path = str(path)
+    app.root_component = Div_()
+    server = app.server
+    await app.navigate("/")
+    hmr_demo.count.set(5)
+    hmr_demo.theme.set("dark")
+
+    path.write_text(textwrap.dedent(SOURCE.replace("{label}", "Newer")))
+    try:
+        assert await hot_swap(app, [str(path)])
+    finally:
+        sys.modules.pop("hmr_demo", None)
+
+    assert hmr_demo.app is app
+    assert app.server is server
+    assert hmr_demo.count() == 5
+    assert hmr_demo.theme() == "dark"
+    assert "Newer: 5" in app.root_component.render()
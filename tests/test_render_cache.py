@@ -0,0 +1,69 @@
+from taupy.widgets.component import Component
+from taupy.widgets.elements import Table_, Text_
+from taupy.widgets.layout import VStack
+
+
+class Counted(Component):
+    def __init__(self, **props):
+        super().__init__(**props)
+        self.calls = 0
+
+    def _render(self) -> str:
+        self.calls += 1
+        return f"<b>{self.props.get('label', '')}</b>"
+
+
+def test_render_is_memoized():
+    leaf = Counted(label="a")
+    root = VStack(leaf)
+
+    first = root.render()
+    assert root.render() == first
+    assert leaf.calls == 1
+
+
+def test_invalidation_bubbles_to_ancestors():
+    leaf = Counted(label="a")
+    sibling = Counted(label="b")
+    root = VStack(VStack(leaf), sibling)
+    root.render()
+
+    leaf.update_props(label="z")
+
+    assert "<b>z</b>" in root.render()
+    assert leaf.calls == 2
+    assert sibling.calls == 1
+
+
+def test_unbound_callable_is_never_cached():
+    value = {"n": 1}
+    root = VStack(Text_(lambda: value["n"]))
+    assert ">1</span>" in root.render()
+
+    value["n"] = 2
+    assert ">2</span>" in root.render()
+
+
+def test_legacy_render_override_is_not_cached():
+    class Legacy(Component):
+        def render(self):
+            return self.props["label"]
+
+    legacy = Legacy(label="x")
+    root = VStack(legacy)
+    root.render()
+
+    legacy.props["label"] = "y"
+    assert "y" in root.render()
+
+
+def test_iter_render_matches_render():
+    root = VStack(
+        Counted(label="a"),
+        Table_(head=["n"], rows=[[1], [2]]),
+        VStack(Text_("x")),
+    )
+    chunks = list(root.iter_render())
+
+    assert len(chunks) > 3
+    assert "".join(chunks) == root.render()
@@ -0,0 +1,134 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from taupy.dispatcher import Dispatcher
+from taupy.sequencer import EventSequencer
+
+
+def recorder(log, name, delay=0.0):
+    async def job():
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        log.append(("end", name))
+
+    return job
+
+
+@pytest.mark.asyncio
+async def test_same_widget_in_order_other_widgets_concurrent():
+    seq = EventSequencer()
+    log = []
+
+    await seq.submit("slow", recorder(log, "slow-1", 0.05))
+    await seq.submit("slow", recorder(log, "slow-2"))
+    await seq.submit("fast", recorder(log, "fast"))
+    await seq.join()
+
+    assert log.index(("end", "fast")) < log.index(("end", "slow-1"))
+    assert log.index(("end", "slow-1")) < log.index(("start", "slow-2"))
+
+
+@pytest.mark.asyncio
+async def test_connection_ordering_is_strict():
+    seq = EventSequencer(ordering="connection")
+    log = []
+
+    await seq.submit("a", recorder(log, "a", 0.02))
+    await seq.submit("b", recorder(log, "b"))
+    await seq.join()
+
+    assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+
+@pytest.mark.asyncio
+async def test_newer_input_cancels_superseded_handlers():
+    seq = EventSequencer()
+    log = []
+
+    for i in range(3):
+        await seq.submit("field", recorder(log, i, 0.02), supersede=True)
+        await asyncio.sleep(0)
+    await seq.join()
+
+    assert ("end", 0) not in log and ("end", 1) not in log
+    assert log[-1] == ("end", 2)
+    assert seq.superseded == 2
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_blocks_submit():
+    seq = EventSequencer(max_in_flight=2)
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+
+    await seq.submit("a", blocked)
+    await seq.submit("b", blocked)
+    third = asyncio.ensure_future(seq.submit("c", blocked))
+    await asyncio.sleep(0.01)
+    assert not third.done()
+
+    release.set()
+    await third
+    await seq.join()
+
+
+@pytest.mark.asyncio
+async def test_throttled_input_dispatches_first_and_last_value():
+    dispatcher = Dispatcher()
+    seq = EventSequencer()
+    values = []
+    dispatcher.on_input("search", min_interval=0.05)(lambda e: values.append(e.value))
+
+    for value in ("a", "ab", "abc", "abcd"):
+        job = partial(dispatcher.dispatch_input, "search", value)
+        await seq.submit("search", job, supersede=True)
+        await asyncio.sleep(0)
+    await seq.join()
+
+    assert values == ["a", "abcd"]
+
+
+class ClosingSocket:
+    open = True
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    def __aiter__(self):
+        return self._messages()
+
+    async def _messages(self):
+        for message in self.messages:
+            yield message
+            await asyncio.sleep(0)
+
+    async def send(self, payload):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_running_handlers_finish_when_the_connection_closes():
+    from taupy.app import App
+
+    app = App("Test", 800, 600)
+    log = []
+
+    async def slow_click(event):
+        log.append("start")
+        await asyncio.sleep(0.05)
+        log.append("done")
+
+    app.dispatcher.on_click("btn")(slow_click)
+    click = '{"type": "click", "id": "btn"}'
+    ws = ClosingSocket([click, click])
+
+    await asyncio.wait_for(app.server.handler(ws), 1)
+    assert ws not in app.server.clients
+
+    # The running handler finishes; the queued second click is dropped.
+    await asyncio.sleep(0.1)
+    assert log == ["start", "done"]
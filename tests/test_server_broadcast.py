@@ -1,6 +1,13 @@
+import asyncio
+import json
+
 import pytest
+from taupy.scheduler import FrameScheduler
 from taupy.server import TauServer
 from taupy.app import App
+from taupy.state import State
+from taupy.widgets.elements import Text_
+from taupy.widgets.layout import VStack
 
 
 @pytest.mark.asyncio
@@ -10,3 +17,201 @@ async def test_broadcast_no_clients():
 
     # should not crash with 0 clients
     await server.broadcast({"hello": 123})
+
+
+def test_large_html_is_fragmented():
+    server = TauServer(App("Test", 800, 600))
+    server.stream_chunk_size = 4
+    msg = {"type": "replace", "id": "root", "html": '<p a="1">é\n</p>' * 3}
+
+    fragments = server._fragments(msg)
+
+    assert len(fragments) > 3
+    assert json.loads("".join(fragments)) == msg
+
+
+class RecordingSocket:
+    open = True
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, payload):
+        self.sent.append(json.loads(payload))
+
+    async def close(self):
+        self.open = False
+
+
+@pytest.mark.asyncio
+async def test_transaction_sends_one_batch_message():
+    app = App("Test", 800, 600)
+    ws = RecordingSocket()
+    app.server.clients.add(ws)
+    states = [State(0) for _ in range(3)]
+    app._bind_events_and_states(VStack(*[Text_(s) for s in states]))
+
+    with app.transaction():
+        for i, s in enumerate(states):
+            s.set(i + 1)
+        states[0].set(9)
+
+    await asyncio.sleep(0.01)
+
+    assert len(ws.sent) == 1
+    assert [m["value"] for m in ws.sent[0]["messages"]] == ["9", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_frame_coalesces_superseded_updates():
+    server = TauServer(App("Test", 800, 600))
+    server.frame_interval = 60
+    ws = RecordingSocket()
+    server.clients.add(ws)
+
+    await server.broadcast({"type": "update_text", "id": "a", "value": "0"})
+    await asyncio.sleep(0.01)
+    for i in range(100):
+        await server.broadcast({"type": "update_text", "id": "a", "value": str(i)})
+    await server.broadcast({"type": "list_ops", "id": "l", "ops": []})
+    await server.flush()
+
+    assert len(ws.sent) == 2
+    assert ws.sent[1]["messages"] == [
+        {"type": "update_text", "id": "a", "value": "99"},
+        {"type": "list_ops", "id": "l", "ops": []},
+    ]
+    await server.stop()
+
+
+class SlowSocket(RecordingSocket):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+        self.close_code = None
+
+    async def send(self, payload):
+        await self.release.wait()
+        await super().send(payload)
+
+    async def close(self, code=1000, reason=""):
+        self.close_code = code
+        await super().close()
+
+
+def _burst(n):
+    return [{"type": "list_ops", "id": "l", "ops": [i]} for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_block_others():
+    server = TauServer(App("Test", 800, 600))
+    slow, fast = SlowSocket(), RecordingSocket()
+    server.clients.update([slow, fast])
+
+    await server.broadcast({"type": "update_text", "id": "a", "value": "1"})
+    await asyncio.sleep(0.01)
+    await server.broadcast({"type": "update_text", "id": "a", "value": "2"})
+    await asyncio.sleep(0.05)
+
+    assert len(fast.sent) == 2
+    assert slow.sent == []
+    slow.release.set()
+    await server.stop()
+    assert len(slow.sent) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", ["coalesce", "drop", "disconnect"])
+async def test_queue_overflow_policies(policy):
+    app = App("Test", 800, 600)
+    app.root_component = VStack(Text_("screen"))
+    server = app.server
+    server.max_queue = 10
+    server.overflow = policy
+    slow = SlowSocket()
+    server.clients.add(slow)
+
+    await server.broadcast({"type": "update_text", "id": "a", "value": "0"})
+    await asyncio.sleep(0.01)
+    for msg in _burst(25):
+        await server.broadcast(msg)
+    await asyncio.sleep(0.01)
+    slow.release.set()
+    await server.flush()
+
+    if policy == "disconnect":
+        assert slow.close_code == 1008
+        assert slow not in server.clients
+        return
+    pending = slow.sent[1]["messages"]
+    assert len(pending) <= 10
+    # list_ops are never stale: "drop" falls back to the snapshot too.
+    assert pending[0]["type"] == "replace"
+    assert "screen" in pending[0]["html"]
+    assert [m["ops"][0] for m in pending[1:]] == list(range(21, 25))
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_drop_overflow_drops_messages_inside_replaced_root():
+    dropped = []
+    inside = {"e0", "e1"}
+    scheduler = FrameScheduler(
+        lambda messages: asyncio.sleep(0),
+        max_pending=5,
+        overflow="drop",
+        on_overflow=lambda: dropped.append(True),
+        contains=lambda root, target: root == "screen" and target in inside,
+    )
+    scheduler.push({"type": "set_attr", "id": "screen", "name": "x", "value": "1"})
+    for i in range(3):
+        scheduler.push({"type": "update_text", "id": f"e{i}", "value": str(i)})
+    scheduler.push({"type": "list_ops", "id": "e1", "ops": []})
+    scheduler.push({"type": "replace", "id": "screen", "html": "<b></b>"})
+
+    kept = [(m["type"], m["id"]) for m in scheduler._pending.values()]
+    assert kept == [
+        ("set_attr", "screen"),
+        ("update_text", "e2"),
+        ("replace", "screen"),
+    ]
+    assert not dropped
+    await scheduler.stop(flush=False)
+
+
+@pytest.mark.asyncio
+async def test_overflow_snapshot_keeps_non_dom_messages():
+    scheduler = FrameScheduler(
+        lambda messages: asyncio.sleep(0), max_pending=3, overflow="coalesce"
+    )
+    scheduler.push({"type": "set_theme", "theme": "dark"})
+    for i in range(3):
+        scheduler.push({"type": "list_ops", "id": "l", "ops": [i]})
+
+    assert list(scheduler._pending.values()) == [{"type": "set_theme", "theme": "dark"}]
+    await scheduler.stop(flush=False)
+
+
+@pytest.mark.asyncio
+async def test_coalescing_keeps_order_around_other_messages():
+    frames = []
+
+    async def send(messages):
+        frames.append(messages)
+
+    scheduler = FrameScheduler(send)
+    scheduler.push({"type": "update_html", "id": "x", "html": "1"})
+    scheduler.push({"type": "update_text", "id": "y", "value": "a"})
+    scheduler.push({"type": "patch", "id": "x", "ops": []})
+    scheduler.push({"type": "update_html", "id": "x", "html": "2"})
+    scheduler.push({"type": "update_text", "id": "y", "value": "b"})
+    await scheduler.stop()
+
+    sent = [(m["type"], m.get("html", m.get("value"))) for m in frames[0]]
+    assert sent == [
+        ("update_html", "1"),
+        ("update_text", "b"),
+        ("patch", None),
+        ("update_html", "2"),
+    ]
@@ -1,4 +1,9 @@
-from taupy.state import State
+import pytest
+
+from taupy.app import App
+from taupy.state import Computed, DictState, Effect, ListState, State, track
+from taupy.widgets.elements import Text_
+from taupy.widgets.layout import VStack
 
 
 def test_state_basic():
@@ -20,3 +25,206 @@ def test_state_subscribe():
     s.set(5)
 
     assert called == [5]
+
+
+def test_track_records_reads_through_attributes():
+    class Counter:
+        def __init__(self):
+            self.count = State(1)
+
+    counter = Counter()
+    other = State(2)
+
+    value, deps = track(lambda: counter.count() * 10)
+
+    assert value == 10
+    assert deps == {counter.count}
+    assert other not in deps
+
+
+def test_effect_follows_changing_dependencies():
+    flag = State(True)
+    a = State("a")
+    b = State("b")
+    seen = []
+
+    effect = Effect(lambda: a() if flag() else b(), seen.append)
+    assert effect.deps == {flag, a}
+
+    flag.set(False)
+    assert seen == ["b"]
+    assert effect.deps == {flag, b}
+
+    a.set("A")
+    assert seen == ["b"]
+
+    b.set("B")
+    assert seen == ["b", "B"]
+
+    effect.dispose()
+    b.set("x")
+    assert seen == ["b", "B"]
+
+
+@pytest.mark.asyncio
+async def test_app_binds_text_to_states_it_reads():
+    app = App("Test", 800, 600)
+    holder = {"count": State(0)}
+    text = Text_(lambda: f"n={holder['count']()}")
+    app._bind_events_and_states(VStack(text))
+
+    assert text.binding.deps == {holder["count"]}
+    assert text.render().endswith(">n=0</span>")
+
+    holder["count"].set(3)
+    assert text.render().endswith(">n=3</span>")
+
+
+def test_batch_defers_and_dedupes_notifications():
+    a = State(0)
+    b = State(0)
+    seen = []
+    a.subscribe(seen.append)
+    effect = Effect(lambda: a() + b(), seen.append)
+
+    with State.batch():
+        a.set(1)
+        a.set(2)
+        b.set(5)
+        assert seen == []
+
+    assert seen == [2, 7]
+    assert effect.value == 7
+
+
+def test_computed_is_lazy_and_memoized():
+    items = State([1, 2, 3])
+    calls = []
+
+    def total():
+        calls.append(1)
+        return sum(items())
+
+    computed = Computed(total)
+    assert calls == []
+    assert computed() == 6
+    assert computed() == 6
+    assert len(calls) == 1
+
+    items.set([1, 2])
+    assert len(calls) == 1
+    assert computed() == 3
+    assert len(calls) == 2
+
+
+def test_computed_diamond_runs_once_without_glitches():
+    a = State(1)
+    b = Computed(lambda: a() + 1)
+    c = Computed(lambda: a() * 2)
+    runs = []
+
+    def combine():
+        runs.append((b(), c()))
+        return b() + c()
+
+    d = Computed(combine)
+    seen = []
+    Effect(lambda: (a(), d()), seen.append)
+    runs.clear()
+
+    a.set(5)
+
+    assert runs == [(6, 10)]
+    assert seen == [(5, 16)]
+    assert d.level == 2
+
+
+def test_list_state_emits_change_records():
+    items = ListState([1, 2, 3])
+    records = []
+    values = []
+    items.observe(records.extend)
+    items.subscribe(values.append)
+
+    items.append(4)
+    items.insert(0, 0)
+    items.pop(1)
+    items[0] = 9
+
+    assert items() == [9, 2, 3, 4]
+    assert records == [
+        {"op": "insert", "index": 3, "items": [4]},
+        {"op": "insert", "index": 0, "items": [0]},
+        {"op": "remove", "index": 1, "count": 1},
+        {"op": "replace", "index": 0, "value": 9},
+    ]
+    assert len(values) == 4
+
+
+def test_dict_state_batches_records():
+    data = DictState(a=1)
+    records = []
+    data.observe(records.append)
+
+    data.update(b=2, c=3)
+    del data["a"]
+
+    assert data() == {"b": 2, "c": 3}
+    assert records == [
+        [{"op": "set", "key": "b", "value": 2}, {"op": "set", "key": "c", "value": 3}],
+        [{"op": "delete", "key": "a"}],
+    ]
+
+
+def test_compare_modes_and_version():
+    eq = State([1, 2])
+    eq.set([1, 2])
+    assert eq.version == 0
+
+    ident = State([1, 2], compare="identity")
+    ident.set([1, 2])
+    assert ident.version == 1
+
+    always = State(1, compare="always")
+    always.set(1)
+    assert always.version == 1
+
+    keyed = State({"id": 1, "n": 0}, compare=lambda v: v["id"])
+    keyed.set({"id": 1, "n": 5})
+    assert keyed.version == 0
+
+    with pytest.raises(ValueError):
+        State(0, compare="deep")
+
+
+def test_ambiguous_equality_does_not_raise():
+    np = pytest.importorskip("numpy")
+    arr = State(np.zeros(3))
+    arr.set(np.ones(3))
+    arr.set(arr())
+
+    assert arr.version == 1
+
+
+def test_computed_skips_when_source_result_is_unchanged():
+    n = State(1)
+    parity = Computed(lambda: n() % 2)
+    runs = []
+    label = Computed(lambda: runs.append(1) or f"parity {parity()}")
+    Effect(label, lambda _v: None)
+
+    n.set(3)
+
+    assert parity.version == 1
+    assert len(runs) == 1
+
+
+def test_computed_subscribed_before_first_read_notifies():
+    a = State(1)
+    c = Computed(lambda: a() * 2)
+    got = []
+    c.subscribe(got.append)
+
+    a.set(2)
+
+    assert got == [4]
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+
+import pytest
+
+from taupy.app import App
+from taupy.state import ListState, State, bind_loop
+
+
+def square(n):
+    return n * n
+
+
+@pytest.fixture
+def app():
+    app = App("Test", 800, 600)
+    yield app
+    bind_loop(None)
+
+
+@pytest.mark.asyncio
+async def test_worker_thread_sets_are_delivered_on_loop(app):
+    bind_loop(asyncio.get_running_loop())
+    count = State(0)
+    seen = []
+    count.subscribe(lambda v: seen.append((v, threading.get_ident())))
+
+    def work():
+        for i in range(1, 51):
+            count.set(i)
+        with State.batch():
+            count.set(100)
+            count.set(101)
+
+    worker = threading.Thread(target=work)
+    worker.start()
+    worker.join()
+    await asyncio.sleep(0.01)
+
+    assert count() == 101
+    assert seen and seen[-1][0] == 101
+    assert {tid for _, tid in seen} == {threading.get_ident()}
+
+
+@pytest.mark.asyncio
+async def test_worker_thread_reads_its_own_writes(app):
+    bind_loop(asyncio.get_running_loop())
+    count = State(0)
+    items = ListState()
+    changes = []
+    items.observe(changes.extend)
+    read_back = []
+
+    def work():
+        for _ in range(100):
+            count.set(count() + 1)
+        items.append(1)
+        read_back.append((count(), len(items), items.pop(), len(items)))
+
+    worker = threading.Thread(target=work)
+    worker.start()
+    worker.join()
+    await asyncio.sleep(0.01)
+
+    assert read_back == [(100, 1, 1, 0)]
+    assert count() == 100
+    assert [c["op"] for c in changes] == ["insert", "remove"]
+
+
+@pytest.mark.asyncio
+async def test_subscribers_run_without_holding_the_state_lock(app):
+    bind_loop(asyncio.get_running_loop())
+    items = ListState()
+    other = State(0)
+    finished = []
+
+    def wait_for_worker(changes):
+        # A worker writing State while a loop callback waits for it must
+        # not block on a lock the loop holds.
+        def work():
+            other.set(1)
+            items.append("from worker")
+            finished.append(True)
+
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join(1)
+
+    items.observe(wait_for_worker)
+    items.append("from loop")
+    items.unobserve(wait_for_worker)
+
+    assert finished == [True]
+    assert items() == ["from loop", "from worker"]
+
+
+def test_reset_records_carry_a_copy_of_the_value():
+    items = ListState([1, 2])
+    seen = []
+    items.observe(seen.append)
+
+    with State.batch():
+        items.append(3)
+        items.set([4])
+        items.append(5)
+
+    assert seen == [[{"op": "reset", "value": [4, 5]}]]
+    assert seen[0][0]["value"] is not items()
+
+
+def test_pop_does_not_wait_for_a_stopped_loop(app):
+    loop = asyncio.new_event_loop()
+    try:
+        bind_loop(loop)
+        items = ListState([1, 2])
+        result = []
+        worker = threading.Thread(target=lambda: result.append(items.pop()))
+        worker.start()
+        worker.join(1)
+        assert result == [2] and items() == [1]
+    finally:
+        bind_loop(None)
+        loop.close()
+
+
+@pytest.mark.asyncio
+async def test_run_in_thread_publishes_into_state(app):
+    result = State(None)
+
+    assert await app.run_in_thread(square, 7, into=result) == 49
+    assert result() == 49
+    app._thread_pool.shutdown()
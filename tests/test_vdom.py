@@ -0,0 +1,98 @@
+from taupy.vdom import RenderCache, diff, parse
+
+
+def _apply(root, ops):
+    def resolve(path):
+        node = root
+        for index in path:
+            node = node.children[index]
+        return node
+
+    for op in ops:
+        node = resolve(op["path"])
+        if op["op"] == "text":
+            node.text = op["value"]
+        elif op["op"] == "attr":
+            node.attrs[op["name"]] = op["value"]
+        elif op["op"] == "rmattr":
+            del node.attrs[op["name"]]
+        elif op["op"] == "insert":
+            node.children[op["index"] : op["index"]] = parse(op["html"]).children
+        elif op["op"] == "replace":
+            parent = resolve(op["path"][:-1])
+            parent.children[op["path"][-1]] = parse(op["html"]).children[0]
+        elif op["op"] == "remove":
+            del resolve(op["path"][:-1]).children[op["path"][-1]]
+        elif op["op"] == "move":
+            node.children.insert(op["to"], node.children.pop(op["from"]))
+
+
+def test_parse_roundtrip():
+    html = '<div id="a" class="x"><span>1 &lt; 2</span><input value="v"></div>'
+    assert parse(html).to_html() == html
+
+
+def test_diff_text_change():
+    old = parse("<table><tr><td>1</td><td>2</td></tr></table>")
+    new = parse("<table><tr><td>1</td><td>3</td></tr></table>")
+    assert diff(old, new) == [
+        {"op": "text", "path": [0, 0, 1, 0], "value": "3"},
+    ]
+
+
+def test_diff_keyed_reorder_and_edit():
+    old = parse('<ul><li id="a">A</li><li id="b">B</li><li id="c">C</li></ul>')
+    new = parse('<ul><li id="c">C</li><li id="a" class="on">A</li><b>x</b></ul>')
+    ops = diff(old, new)
+    assert any(op["op"] == "move" for op in ops)
+    _apply(old, ops)
+    assert old.to_html() == new.to_html()
+
+
+BADGE = '<span id="t" class="badge badge-primary badge-lg font-mono">{}</span>'
+SCREEN = '<div id="a" class="flex flex-col gap-2 p-4">' + BADGE + "</div>"
+
+
+def test_render_cache_patches_after_first_render():
+    cache = RenderCache()
+    first = cache.replace("root", SCREEN.format(0))
+    assert first["type"] == "replace"
+
+    assert cache.replace("root", SCREEN.format(0)) is None
+
+    msg = cache.replace("root", SCREEN.format(1))
+    assert msg == {
+        "type": "patch",
+        "id": "root",
+        "ops": [{"op": "text", "path": [0, 0, 0], "value": "1"}],
+    }
+
+
+def test_render_cache_update_keeps_root_in_sync():
+    cache = RenderCache()
+    cache.replace("root", SCREEN.format(0))
+
+    msg = cache.update("t", BADGE.format(5))
+    assert msg == {
+        "type": "patch",
+        "id": "t",
+        "ops": [{"op": "text", "path": [0], "value": "5"}],
+    }
+
+    assert cache.replace("root", SCREEN.format(5)) is None
+
+
+def test_render_cache_skips_diff_for_a_fresh_screen():
+    cache = RenderCache()
+    items = "".join(f'<li id="a{i}">{i}</li>' for i in range(50))
+    cache.replace("root", f"<ul>{items}</ul>")
+
+    fresh = "".join(f'<li id="b{i}">{i}</li>' for i in range(50))
+    msg = cache.replace("root", f"<ul>{fresh}</ul>")
+
+    assert msg["type"] == "replace"
+    assert "root" in cache._unparsed and "root" not in cache._roots
+
+    cache.set_text("b3", "x")
+    edited = fresh.replace('id="b3">3', 'id="b3">x')
+    assert cache.replace("root", f"<ul>{edited}</ul>") is None